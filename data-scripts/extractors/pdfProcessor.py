@@ -1,18 +1,41 @@
 import asyncio
 import os
-import io
 import csv
 import re
 import json
+import logging
 import time
 import math
+import random
+import mmap
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pdfplumber
 import pandas as pd
 
+try:
+    import pymupdf  # fast text layer, optional
+except ImportError:
+    pymupdf = None
+
+try:
+    import tiktoken  # exact token counts for the prompt budget, optional
+except ImportError:
+    tiktoken = None
+
+try:
+    import orjson  # faster schema dump / response parsing, optional
+except ImportError:
+    orjson = None
+
 from backboard import BackboardClient
 
+log = logging.getLogger(__name__)
+
 # ── Configuration ──────────────────────────────────────────────
 BASE_DIR = Path(__file__).resolve().parent.parent
 SCHEMA_PATH = BASE_DIR / "schema.json"
@@ -23,24 +46,67 @@ API_KEY = os.environ.get("BACKBOARD_API_KEY", "")
 
 MAX_RETRIES = 3
 INITIAL_BACKOFF_S = 2
+MAX_BACKOFF_S = 30
 CONTEXT_CHAR_LIMIT = 85000
+CONTEXT_TOKEN_LIMIT = 21000
+CHARS_PER_TOKEN = 4
+BOILERPLATE_EDGE_LINES = 3
+BOILERPLATE_MIN_PAGES = 3
 MIN_TEXT_CHARS = 80
+MMAP_MIN_BYTES = 16 * 1024 * 1024
+STATEMENT_BLOCK_MIN_PAGES = 30
+STATEMENT_BLOCK_MAX_GAP = 5
+STATEMENT_BLOCK_TAIL_PAGES = 3
+MAX_CONCURRENT_FILES = int(os.environ.get("PDF_CONCURRENCY", os.cpu_count() or 4))
+AI_BATCH_SIZE = int(os.environ.get("PDF_AI_BATCH_SIZE", 4))
+KEY_METRICS = ["revenue_total", "net_income", "cash_end_period", "total_assets"]
+
+# pdfplumber parsing is CPU-bound, so it runs in worker processes while the
+# event loop keeps other files' AI round trips moving.
+_parse_pool = None
+
+
+def get_parse_pool():
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _parse_pool
+
+
+def shutdown_parse_pool():
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown()
+        _parse_pool = None
 
 # ── Load schema ───────────────────────────────────────────────
 def load_schema():
-    raw = json.loads(SCHEMA_PATH.read_text())
+    if orjson is not None:
+        raw = orjson.loads(SCHEMA_PATH.read_bytes())
+    else:
+        raw = json.loads(SCHEMA_PATH.read_text())
     return raw["metrics"]
 
 METRICS_SCHEMA = load_schema()
-SCHEMA_METRIC_NAMES = {m["metric_name"] for m in METRICS_SCHEMA}
-
-# ── PDF validation ────────────────────────────────────────────
-def is_scanned_pdf(pdf_path, text_sample=None):
-    if text_sample is None:
-        with pdfplumber.open(pdf_path) as pdf:
-            total_chars = sum(len((page.extract_text() or "")) for page in pdf.pages)
-        return total_chars < MIN_TEXT_CHARS
-    return len(text_sample.strip()) < MIN_TEXT_CHARS
+SCHEMA_METRIC_NAMES = frozenset(m["metric_name"] for m in METRICS_SCHEMA)
+SCHEMA_COLUMNS = [m["metric_name"] for m in METRICS_SCHEMA]
+if orjson is not None:
+    SCHEMA_JSON = orjson.dumps(METRICS_SCHEMA, option=orjson.OPT_INDENT_2).decode()
+else:
+    SCHEMA_JSON = json.dumps(METRICS_SCHEMA, indent=2)
+METRIC_STATEMENT_TYPES = {m["metric_name"]: m.get("statement_type", "unknown") for m in METRICS_SCHEMA}
+
+# ── PDF access ────────────────────────────────────────────────
+@contextmanager
+def open_plumber(pdf_path, pages=None):
+    """Open a PDF with pdfplumber, reading large files through a read-only mmap."""
+    if os.path.getsize(pdf_path) < MMAP_MIN_BYTES:
+        with pdfplumber.open(pdf_path, pages=pages) as pdf:
+            yield pdf
+        return
+    with open(pdf_path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with pdfplumber.open(mm, pages=pages) as pdf:
+            yield pdf
 
 
 def ocr_extract(pdf_path):
@@ -63,36 +129,88 @@ def ocr_extract(pdf_path):
 
 
 # ── Structured table extraction ───────────────────────────────
+_NEWLINE_TO_SPACE = str.maketrans({"\n": " ", "\r": " "})
+
+
+def _clean_table(table):
+    return [
+        [str(c).translate(_NEWLINE_TO_SPACE).strip() if c else "" for c in row]
+        for row in table
+    ]
+
+
+def _page_tables(page, page_number):
+    page_tables = []
+    for ti, table in enumerate(page.extract_tables()):
+        if not table or len(table) < 2:
+            continue
+        rows = _clean_table(table)
+        page_tables.append({
+            "page": page_number,
+            "table_index": ti,
+            "headers": rows[0],
+            "rows": rows[1:],
+        })
+    return page_tables
+
+
+def _read_page_texts(pdf_path):
+    with pymupdf.open(pdf_path) as doc:
+        return [page.get_text("text") for page in doc]
+
+
+def _statement_block_pages(page_texts, candidate_pages):
+    """Narrow table pages of a long report to the run of statement-header pages."""
+    # Narrative pages mention revenue/assets too, but the statements sit
+    # together; the densest header run wins over e.g. a contents page.
+    if len(page_texts) < STATEMENT_BLOCK_MIN_PAGES:
+        return candidate_pages
+    anchors = [p for p in candidate_pages if has_statement_header(page_texts[p - 1])]
+    if not anchors:
+        return candidate_pages
+    runs = [[anchors[0]]]
+    for p in anchors[1:]:
+        if p - runs[-1][-1] <= STATEMENT_BLOCK_MAX_GAP:
+            runs[-1].append(p)
+        else:
+            runs.append([p])
+    block = max(runs, key=len)
+    lo, hi = block[0], block[-1] + STATEMENT_BLOCK_TAIL_PAGES
+    return [p for p in candidate_pages if lo <= p <= hi]
+
+
 def extract_structured_tables(pdf_path):
     tables_data = []
     raw_text_parts = []
     total_chars = 0
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for i, page in enumerate(pdf.pages):
-            page_text = page.extract_text() or ""
+    if pymupdf is not None:
+        # PyMuPDF reads the text layer for every page; pdfplumber is only
+        # opened for table extraction on pages that look like statements.
+        page_texts = _read_page_texts(pdf_path)
+        table_pages = []
+        for i, page_text in enumerate(page_texts):
             raw_text_parts.append(f"--- PAGE {i+1} ---\n{page_text}")
             total_chars += len(page_text)
-
-            tables = page.extract_tables()
-            for ti, table in enumerate(tables):
-                if not table or len(table) < 2:
-                    continue
-                rows = []
-                for row in table:
-                    clean = [str(c).replace("\n", " ").strip() if c else "" for c in row]
-                    rows.append(clean)
-
-                headers = rows[0]
-                data_rows = rows[1:]
-
-                table_obj = {
-                    "page": i + 1,
-                    "table_index": ti,
-                    "headers": headers,
-                    "rows": data_rows,
-                }
-                tables_data.append(table_obj)
+            if detect_statement_type(page_text) != "unknown":
+                table_pages.append(i + 1)
+        table_pages = _statement_block_pages(page_texts, table_pages)
+        if table_pages:
+            with open_plumber(pdf_path, pages=table_pages) as pdf:
+                for page in pdf.pages:
+                    tables_data.extend(_page_tables(page, page.page_number))
+    else:
+        with open_plumber(pdf_path) as pdf:
+            for i, page in enumerate(pdf.pages):
+                # Image-only (scanned) pages have no chars: skip text layout
+                # and table finding, neither can produce anything there.
+                page_text = (page.extract_text() or "") if page.chars else ""
+                raw_text_parts.append(f"--- PAGE {i+1} ---\n{page_text}")
+                total_chars += len(page_text)
+                # Same page filter as the PyMuPDF path: tables are only
+                # extracted once the text says the page is a statement.
+                if detect_statement_type(page_text) != "unknown":
+                    tables_data.extend(_page_tables(page, i + 1))
 
     is_scanned = total_chars < MIN_TEXT_CHARS
     raw_text = "\n".join(raw_text_parts)
@@ -131,38 +249,107 @@ STATEMENT_PATTERNS = {
         r"(?i)(net\s*change\s*in\s*cash|closing\s*cash|ending\s*cash|cash\s*at\s*end)",
     ],
 }
+STATEMENT_KEYWORDS = {
+    "income_statement": ["profit", "loss", "revenue", "income statement", "p&l"],
+    "balance_sheet": ["balance sheet", "assets", "liabilities", "equity"],
+    "cash_flow": ["cash flow", "cashflow"],
+}
+
+_STATEMENT_RES = {
+    stmt_type: [re.compile(p) for p in patterns]
+    for stmt_type, patterns in STATEMENT_PATTERNS.items()
+}
+# One alternation over every keyword: a single scan of the text instead of
+# one findall per keyword. The keywords never overlap each other, so each
+# hit maps back to exactly one statement type.
+_KEYWORD_STATEMENT_TYPES = {
+    kw.lower(): stmt_type
+    for stmt_type, keywords in STATEMENT_KEYWORDS.items()
+    for kw in keywords
+}
+_STATEMENT_KEYWORD_RE = re.compile(
+    "|".join(re.escape(kw) for kw in sorted(_KEYWORD_STATEMENT_TYPES, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+_HEADER_RES = {
+    "income_statement": re.compile(r"(?i)(profit\s*(and|&)\s*loss|income\s*statement)"),
+    "balance_sheet": re.compile(r"(?i)(balance\s*sheet|statement\s*of\s*financial\s*position)"),
+    "cash_flow": re.compile(r"(?i)(cash\s*flow|statement\s*of\s*cash\s*flows)"),
+}
+
+
+def _header_lines(text):
+    # Only the first 10 short lines can be headers; stop scanning there
+    count = 0
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line or len(line) >= 100:
+            continue
+        yield line
+        count += 1
+        if count == 10:
+            return
+
+
+def has_statement_header(text: str) -> bool:
+    return any(
+        header_re.search(line)
+        for line in _header_lines(text)
+        for header_re in _HEADER_RES.values()
+    )
 
 
 def detect_statement_type(text: str) -> str:
     if not text or len(text.strip()) < 20:
         return "unknown"
     scores = {}
-    for stmt_type, patterns in STATEMENT_PATTERNS.items():
+    for stmt_type, patterns in _STATEMENT_RES.items():
         score = 0
         for pattern in patterns:
-            matches = re.findall(pattern, text)
-            score += len(matches) * 2
-        names = {
-            "income_statement": ["profit", "loss", "revenue", "income statement", "p&l"],
-            "balance_sheet": ["balance sheet", "assets", "liabilities", "equity"],
-            "cash_flow": ["cash flow", "cashflow"],
-        }
-        for keyword in names.get(stmt_type, []):
-            score += len(re.findall(rf"(?i){re.escape(keyword)}", text))
+            score += len(pattern.findall(text)) * 2
         scores[stmt_type] = score
-    text_lower = text.lower()
-    header_lines = [l.strip().lower() for l in text.split("\n") if l.strip() and len(l.strip()) < 100]
-    for line in header_lines[:10]:
-        if re.search(r"(?i)(profit\s*(and|&)\s*loss|income\s*statement)", line):
-            scores["income_statement"] += 10
-        if re.search(r"(?i)(balance\s*sheet|statement\s*of\s*financial\s*position)", line):
-            scores["balance_sheet"] += 10
-        if re.search(r"(?i)(cash\s*flow|statement\s*of\s*cash\s*flows)", line):
-            scores["cash_flow"] += 10
+    for m in _STATEMENT_KEYWORD_RE.finditer(text):
+        scores[_KEYWORD_STATEMENT_TYPES[m.group(0).lower()]] += 1
+    for line in _header_lines(text):
+        for stmt_type, header_re in _HEADER_RES.items():
+            if header_re.search(line):
+                scores[stmt_type] += 10
     best = max(scores, key=scores.get)
     return best if scores[best] >= 3 else "unknown"
 
 
+def _strip_page_boilerplate(pages):
+    # Running headers/footers sit in the first/last lines of many pages; keep
+    # their first occurrence only. Statement titles are never treated as such.
+    page_lines = [page.split("\n") for page in pages]
+    edge_counts = Counter()
+    for lines in page_lines:
+        edges = {l.strip() for l in lines[:BOILERPLATE_EDGE_LINES] + lines[-BOILERPLATE_EDGE_LINES:]}
+        edge_counts.update(
+            e for e in edges
+            if e and any(c.isalpha() for c in e)
+            and not any(header_re.search(e) for header_re in _HEADER_RES.values())
+        )
+    boilerplate = {line for line, n in edge_counts.items() if n >= BOILERPLATE_MIN_PAGES}
+    if not boilerplate:
+        return pages
+
+    seen = set()
+    stripped = []
+    for lines in page_lines:
+        tail_start = len(lines) - BOILERPLATE_EDGE_LINES
+        kept = []
+        for j, line in enumerate(lines):
+            key = line.strip()
+            if key in boilerplate and (j < BOILERPLATE_EDGE_LINES or j >= tail_start):
+                if key in seen:
+                    continue
+                seen.add(key)
+            kept.append(line)
+        stripped.append("\n".join(kept))
+    return stripped
+
+
 def chunk_pdf_by_statement(tables_data: list, raw_text: str) -> dict:
     chunks = {
         "income_statement": {"tables": [], "text": ""},
@@ -170,30 +357,27 @@ def chunk_pdf_by_statement(tables_data: list, raw_text: str) -> dict:
         "cash_flow": {"tables": [], "text": ""},
         "unknown": {"tables": [], "text": ""},
     }
+    # Accumulate text parts per statement and join once at the end
+    text_parts = {stmt_type: [] for stmt_type in chunks}
     for tbl in tables_data:
         table_text = " ".join(tbl["headers"]) + " " + " ".join(
             " ".join(row) for row in tbl["rows"]
         )
         stmt_type = detect_statement_type(table_text)
         chunks[stmt_type]["tables"].append(tbl)
-        chunks[stmt_type]["text"] += f"\n--- {stmt_type} table ---\n{table_text[:3000]}\n"
-    pages = raw_text.split("--- PAGE")
+        text_parts[stmt_type].append(f"\n--- {stmt_type} table ---\n{table_text[:3000]}\n")
+    pages = _strip_page_boilerplate(raw_text.split("--- PAGE"))
     for page_text in pages:
         if not page_text.strip():
             continue
         stmt_type = detect_statement_type(page_text)
-        chunks[stmt_type]["text"] += f"\n--- {stmt_type} text ---\n{page_text[:5000]}\n"
+        text_parts[stmt_type].append(f"\n--- {stmt_type} text ---\n{page_text[:5000]}\n")
+    for stmt_type, parts in text_parts.items():
+        chunks[stmt_type]["text"] = "".join(parts)
     return chunks
 
 
-def format_chunked_prompt(chunks: dict, detected_period: str, schema_str: str) -> str:
-    sections = []
-    statement_labels = {
-        "income_statement": "PROFIT & LOSS STATEMENT (Income Statement)",
-        "balance_sheet": "BALANCE SHEET",
-        "cash_flow": "CASH FLOW STATEMENT",
-        "unknown": "OTHER FINANCIAL DATA",
-    }
+def _group_metrics_by_category():
     category_metrics = {
         "income_statement": [],
         "balance_sheet": [],
@@ -203,11 +387,56 @@ def format_chunked_prompt(chunks: dict, detected_period: str, schema_str: str) -
     for m in METRICS_SCHEMA:
         cat = m.get("statement_type", "income_statement")
         category_metrics.setdefault(cat, []).append(m["metric_name"])
+    return category_metrics
+
+
+PROMPT_CATEGORY_METRICS = _group_metrics_by_category()
+
+
+@lru_cache(maxsize=1)
+def _token_encoding():
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text):
+    encoding = _token_encoding()
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN + 1
+    return len(encoding.encode_ordinary(text))
+
+
+def _trim_to_tokens(text, max_tokens):
+    encoding = _token_encoding()
+    if encoding is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    return encoding.decode(encoding.encode_ordinary(text)[:max_tokens])
+
+
+STATEMENT_LABELS = {
+    "income_statement": "PROFIT & LOSS STATEMENT (Income Statement)",
+    "balance_sheet": "BALANCE SHEET",
+    "cash_flow": "CASH FLOW STATEMENT",
+    "unknown": "OTHER FINANCIAL DATA",
+}
+PROMPT_CATEGORY_TEXT = "".join(
+    f"\n{cat.replace('_', ' ').upper()}: {', '.join(metrics)}\n"
+    for cat, metrics in PROMPT_CATEGORY_METRICS.items()
+    if metrics
+)
+
+
+def _statement_sections(chunks: dict) -> list:
+    sections = []
     for stmt_type in ["income_statement", "balance_sheet", "cash_flow", "unknown"]:
         chunk = chunks.get(stmt_type, {"tables": [], "text": ""})
         if not chunk["tables"] and not chunk["text"].strip():
             continue
-        label = statement_labels.get(stmt_type, stmt_type)
+        label = STATEMENT_LABELS.get(stmt_type, stmt_type)
         section = f"=== {label} ==="
         if chunk["tables"]:
             section += "\n\nStructured Tables:\n"
@@ -215,6 +444,28 @@ def format_chunked_prompt(chunks: dict, detected_period: str, schema_str: str) -
         if chunk["text"].strip() and len(chunk["text"].strip()) > 50:
             section += f"\n\nAdditional Text:\n{chunk['text'][:15000]}"
         sections.append(section)
+    return sections
+
+
+def _fit_sections(sections: list, budget: int) -> list:
+    # Sections are already in priority order (statements before "other");
+    # fill the token budget with them, trimming the one that crosses it.
+    kept = []
+    for section in sections:
+        if budget <= 0:
+            print(f"   ⚠️ Prompt budget reached — dropped {len(sections) - len(kept)} section(s)")
+            break
+        section_tokens = count_tokens(section)
+        if section_tokens > budget:
+            print(f"   ⚠️ Section trimmed from ~{section_tokens} to {budget} tokens")
+            section = _trim_to_tokens(section, budget)
+        kept.append(section)
+        budget -= section_tokens
+    return kept
+
+
+def format_chunked_prompt(chunks: dict, detected_period: str, schema_str: str,
+                          token_limit: int = CONTEXT_TOKEN_LIMIT) -> str:
     prompt = f"""EXTRACT FINANCIAL METRICS BY STATEMENT TYPE
 
 Period to Extract: "{detected_period}"
@@ -223,17 +474,13 @@ The financial data below is organized by statement type (P&L, Balance Sheet, Cas
 Extract metrics according to their category.
 
 Metrics by category:
-"""
-    for cat, metrics in category_metrics.items():
-        if metrics:
-            prompt += f"\n{cat.replace('_', ' ').upper()}: {', '.join(metrics)}\n"
-    prompt += f"""
+{PROMPT_CATEGORY_TEXT}
 Required Schema:
 {schema_str}
 
 Data:
-{chr(10).join(sections)}
-
+"""
+    instructions = f"""
 INSTRUCTIONS:
 1. Extract ALL metrics for the period: "{detected_period}".
 2. Match each metric to its correct statement category above.
@@ -242,7 +489,55 @@ INSTRUCTIONS:
 5. Output in CSV format: metric_name,value (one per line, no header row).
 6. Use EXACT metric names from the schema.
 """
-    return prompt
+    # Never cut into the instructions
+    budget = token_limit - count_tokens(prompt) - count_tokens(instructions)
+    kept = _fit_sections(_statement_sections(chunks), budget)
+    return prompt + "\n".join(kept) + "\n" + instructions
+
+
+def format_batched_prompt(batch: list, schema_str: str,
+                          token_limit: int = CONTEXT_TOKEN_LIMIT) -> str:
+    prompt = f"""EXTRACT FINANCIAL METRICS BY STATEMENT TYPE FOR {len(batch)} DOCUMENTS
+
+Each document below is a separate filing with its own period. Its data is organized by
+statement type (P&L, Balance Sheet, Cash Flow). Extract metrics according to their category.
+
+Metrics by category:
+{PROMPT_CATEGORY_TEXT}
+Required Schema:
+{schema_str}
+"""
+    instructions = """
+INSTRUCTIONS:
+1. Handle every document separately. Start each document's output with the line
+   ===FILE: <file name>=== using the exact file name given above.
+2. Extract ALL metrics for that document's own period.
+3. Match each metric to its correct statement category above.
+4. If a metric is missing, leave value empty (metric_name,). Only use 0 if explicitly zero.
+5. If "gross_profit" is missing, calculate: revenue_total - cost_of_revenue.
+6. Output in CSV format: metric_name,value (one per line, no header row).
+7. Use EXACT metric names from the schema.
+"""
+    documents = []
+    budget = token_limit - count_tokens(prompt) - count_tokens(instructions)
+    for i, prepared in enumerate(batch, 1):
+        doc_header = (
+            f"\nDOCUMENT {i}: {prepared['filename']}\n"
+            f"Period to Extract: \"{prepared['period']}\"\n\nData:\n"
+        )
+        budget -= count_tokens(doc_header)
+        kept = _fit_sections(_statement_sections(prepared["chunks"]), budget)
+        budget -= sum(count_tokens(section) for section in kept)
+        documents.append(doc_header + "\n".join(kept) + "\n")
+    return prompt + "".join(documents) + instructions
+
+
+_BATCH_FILE_RE = re.compile(r"^\s*={3}\s*FILE:\s*(.+?)\s*={3}\s*$", re.MULTILINE)
+
+
+def split_batched_response(content):
+    parts = _BATCH_FILE_RE.split(content)
+    return {parts[i].strip(): parts[i + 1] for i in range(1, len(parts) - 1, 2)}
 
 
 # ── Period extraction (improved) ──────────────────────────────
@@ -263,75 +558,72 @@ MONTH_ABBR = {
     "oct": "october", "nov": "november", "dec": "december",
 }
 
+# Both patterns are case-insensitive, so the text is searched as-is; every
+# match they can produce is a valid period, so the first one is the answer.
+_PERIOD_DATE_RE = re.compile(
+    rf"(?P<day>\d{{1,2}})?\s*(?P<month>{'|'.join(MONTH_ABBR)})[a-z]*[\s,/-]+(?P<year>\d{{4}})",
+    re.IGNORECASE,
+)
+_PERIOD_QUARTER_RE = re.compile(
+    r"(?:q|quarter\s*)(?P<quarter>[1-4])\s*(?:fy|fiscal\s*year)?\s*(?P<year>\d{2,4})",
+    re.IGNORECASE,
+)
+QUARTER_END_MONTH = {1: "March", 2: "June", 3: "September", 4: "December"}
+
 
 def detect_period(text):
     if not text or len(text) < 10:
         return "Unknown Period"
 
-    text_lower = text.lower()
-    search_text = text_lower[:6000] + " ||| " + text_lower[-3000:]
-
-    months_joined = "|".join(MONTH_ABBR.keys())
-    pattern_date = rf"(\d{{1,2}})?\s*({months_joined})[a-z]*[\s,/-]+(\d{{4}})"
-    pattern_q = r"(q[1-4]|quarter\s*[1-4])\s*(?:fy|fiscal\s*year)?\s*(\d{2,4})"
-
-    matches_date = re.findall(pattern_date, search_text, re.IGNORECASE)
-    matches_q = re.findall(pattern_q, search_text, re.IGNORECASE)
-
-    best = None
-
-    for m in matches_date:
-        prefix, mon_abbr, year_str = m
-        month_name = MONTH_ABBR.get(mon_abbr.lower())
-        if not month_name or not year_str.isdigit():
-            continue
-        year = int(year_str)
+    search_text = text[:6000] + " ||| " + text[-3000:]
 
+    m = _PERIOD_DATE_RE.search(search_text)
+    if m:
+        month_name = MONTH_ABBR[m.group("month").lower()]
+        year = int(m.group("year"))
         q = MONTH_QUARTER[month_name]
         fy_end_year = year if month_name in ("january", "february", "march") else year + 1
         fy_short = str(fy_end_year)[-2:]
         month_cap = month_name.capitalize()
+        return f"FY{fy_short}-Q{q} ({month_cap} {year})"
 
-        candidate = f"FY{fy_short}-Q{q} ({month_cap} {year})"
-        if best is None:
-            best = candidate
-
-    for m in matches_q:
-        q_part = re.sub(r"quarter\s*", "", m[0].lower()).replace("q", "").strip()
-        year_str = m[1]
-        if not q_part.isdigit() or not year_str.isdigit():
-            continue
-        q_num = int(q_part)
+    m = _PERIOD_QUARTER_RE.search(search_text)
+    if m:
+        q_num = int(m.group("quarter"))
+        year_str = m.group("year")
         year = int(year_str) if len(year_str) == 4 else 2000 + int(year_str)
-        quarter_months = {1: "March", 2: "June", 3: "September", 4: "December"}
-        month_name = quarter_months.get(q_num, "March")
+        month_name = QUARTER_END_MONTH[q_num]
         fy_short = str(year)[-2:]
-        candidate = f"FY{fy_short}-Q{q_num} ({month_name} {year})"
-        if best is None:
-            best = candidate
+        return f"FY{fy_short}-Q{q_num} ({month_name} {year})"
 
-    return best or "Unknown Period"
+    return "Unknown Period"
 
 
 # ── AI response parser ────────────────────────────────────────
+_FENCE_RE = re.compile(r"```(?:csv|json|markdown)?")
+_JSON_OBJECT_RE = re.compile(r"\{[^{}]*\}", re.DOTALL)
+_NON_NUMERIC_RE = re.compile(r"[^0-9.eE\-+]")
+_KEY_VALUE_RE = re.compile(r"([a-z_]+)[\s:,;=]+([0-9.,\-eE+]+)")
+_MISSING_VALUES = frozenset(("-", "N/A", "NA", "none", "None", "null"))
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
 def parse_ai_response(content, detected_period):
     data = {"period": detected_period}
-    content = content.strip()
-    content = re.sub(r"```(?:csv|json|markdown)?", "", content)
-    content = re.sub(r"```", "", content).strip()
+    content = _FENCE_RE.sub("", content.strip()).strip()
 
     # Try JSON format first (handles {metric: value} and {metric: {value: ...}})
     try:
-        json_match = re.search(r"\{[^{}]*\}", content, re.DOTALL)
+        json_match = _JSON_OBJECT_RE.search(content)
         if json_match:
-            json_data = json.loads(json_match.group(0))
+            json_data = _json_loads(json_match.group(0))
             for metric, val in json_data.items():
                 if metric in SCHEMA_METRIC_NAMES:
                     if isinstance(val, dict) and "value" in val:
                         val = val["value"]
                     try:
                         if isinstance(val, str):
-                            cleaned = re.sub(r"[^0-9.eE\-+]", "", val)
+                            cleaned = _NON_NUMERIC_RE.sub("", val)
                             if cleaned and cleaned not in ("-", "."):
                                 data[metric] = float(cleaned)
                         elif isinstance(val, (int, float)):
@@ -343,37 +635,40 @@ def parse_ai_response(content, detected_period):
     except Exception:
         pass
 
-    # Try CSV format (metric,value or metric value)
-    try:
-        f = io.StringIO(content)
-        reader = csv.reader(f)
-        for row in reader:
-            if len(row) >= 2:
-                metric = row[0].strip()
-                val = row[1].strip()
-                if not val or val in ("-", "N/A", "NA", "none", "None", "null"):
-                    continue
-                cleaned = re.sub(r"[^0-9.eE\-+]", "", val)
-                if cleaned and cleaned not in ("-", "."):
-                    try:
-                        if metric in SCHEMA_METRIC_NAMES:
-                            data[metric] = float(cleaned)
-                    except ValueError:
-                        continue
-        if len(data) > 1:
-            return data
-    except Exception:
-        pass
+    # Try CSV format (metric,value); responses are plain two-column lines, so
+    # a partition per line is enough and skips the csv state machine.
+    for line in content.splitlines():
+        if "," not in line:
+            continue
+        metric, _, val = line.partition(",")
+        metric = metric.strip().strip('"')
+        if metric not in SCHEMA_METRIC_NAMES:
+            continue
+        val = val.strip()
+        if val.startswith('"'):
+            val = val[1:].partition('"')[0].strip()
+        else:
+            val = val.partition(",")[0].strip()
+        if not val or val in _MISSING_VALUES:
+            continue
+        cleaned = _NON_NUMERIC_RE.sub("", val)
+        if cleaned and cleaned not in ("-", "."):
+            try:
+                data[metric] = float(cleaned)
+            except ValueError:
+                continue
+    if len(data) > 1:
+        return data
 
     # Try line-by-line key:value format
     try:
         lines = content.split("\n")
         for line in lines:
-            match = re.match(r"([a-z_]+)[\s:,;=]+([0-9.,\-eE+]+)", line.lower().strip())
+            match = _KEY_VALUE_RE.match(line.lower().strip())
             if match:
                 metric = match.group(1).strip()
                 val = match.group(2).strip()
-                cleaned = re.sub(r"[^0-9.eE\-+]", "", val)
+                cleaned = _NON_NUMERIC_RE.sub("", val)
                 if cleaned and cleaned not in ("-", "."):
                     try:
                         if metric in SCHEMA_METRIC_NAMES:
@@ -389,8 +684,7 @@ def parse_ai_response(content, detected_period):
 
 
 # ── Exponential backoff retry ─────────────────────────────────
-async def call_with_retry(client, pdf_path, filtered_context, detected_period, schema_str):
-    system_prompt = """
+SYSTEM_PROMPT = """
     You are a Financial Data Engine specialized in extracting metrics from financial statements.
 
     TASK: Extract financial metrics for Monte Carlo simulation.
@@ -403,6 +697,20 @@ async def call_with_retry(client, pdf_path, filtered_context, detected_period, s
     4. Use EXACT metric names from the schema provided.
     """
 
+
+async def create_extraction_assistant(client):
+    return await client.create_assistant(
+        name=f"FinEngine_{int(time.time())}",
+        system_prompt=SYSTEM_PROMPT,
+    )
+
+
+def _backoff_delay(attempt):
+    # Exponential backoff with jitter so concurrent files don't retry in lockstep
+    return min(MAX_BACKOFF_S, INITIAL_BACKOFF_S * (2 ** attempt)) + random.random()
+
+
+async def call_with_retry(client, assistant_id, pdf_path, filtered_context, detected_period, schema_str):
     if filtered_context.strip().startswith("EXTRACT FINANCIAL METRICS BY STATEMENT TYPE"):
         user_message = filtered_context
     else:
@@ -434,11 +742,8 @@ async def call_with_retry(client, pdf_path, filtered_context, detected_period, s
     for attempt in range(MAX_RETRIES):
         try:
             print(f"   🤖 AI Analysis (Attempt {attempt+1}/{MAX_RETRIES})...")
-            assistant_obj = await client.create_assistant(
-                name=f"FinEngine_{int(time.time())}",
-                system_prompt=system_prompt,
-            )
-            thread = await client.create_thread(assistant_id=assistant_obj.assistant_id)
+            # Fresh thread per attempt so a retry never sees the previous answer
+            thread = await client.create_thread(assistant_id=assistant_id)
             response = await client.add_message(
                 thread_id=thread.thread_id,
                 content=user_message,
@@ -452,17 +757,16 @@ async def call_with_retry(client, pdf_path, filtered_context, detected_period, s
             if len(data) <= 1:
                 print(f"   ⚠️ No metrics extracted")
                 if attempt < MAX_RETRIES - 1:
-                    backoff = INITIAL_BACKOFF_S * (2 ** attempt)
-                    print(f"   ⏳ Retrying in {backoff}s...")
+                    backoff = _backoff_delay(attempt)
+                    print(f"   ⏳ Retrying in {backoff:.1f}s...")
                     await asyncio.sleep(backoff)
                     continue
                 return None
 
-            key_metrics = ["revenue_total", "net_income", "cash_end_period", "total_assets"]
-            has_key = any(m in data for m in key_metrics)
+            has_key = any(m in data for m in KEY_METRICS)
             if not has_key and attempt < MAX_RETRIES - 1:
                 print(f"   ⚠️ Missing key metrics, retrying...")
-                backoff = INITIAL_BACKOFF_S * (2 ** attempt)
+                backoff = _backoff_delay(attempt)
                 await asyncio.sleep(backoff)
                 continue
 
@@ -473,8 +777,8 @@ async def call_with_retry(client, pdf_path, filtered_context, detected_period, s
             last_error = e
             print(f"   ⚠️ Attempt {attempt+1} error: {e}")
             if attempt < MAX_RETRIES - 1:
-                backoff = INITIAL_BACKOFF_S * (2 ** attempt)
-                print(f"   ⏳ Retrying in {backoff}s...")
+                backoff = _backoff_delay(attempt)
+                print(f"   ⏳ Retrying in {backoff:.1f}s...")
                 await asyncio.sleep(backoff)
 
     print(f"   ❌ Failed after {MAX_RETRIES} attempts. Last error: {last_error}")
@@ -482,19 +786,22 @@ async def call_with_retry(client, pdf_path, filtered_context, detected_period, s
 
 
 # ── Single PDF processing ─────────────────────────────────────
-async def process_file(client, pdf_path):
+async def prepare_file(pdf_path):
     filename = os.path.basename(pdf_path)
     print(f"\n{'='*60}")
     print(f"Processing: {filename}")
     print(f"{'='*60}")
 
-    tables_data, raw_text, is_scanned = extract_structured_tables(pdf_path)
+    loop = asyncio.get_running_loop()
+    tables_data, raw_text, is_scanned = await loop.run_in_executor(
+        get_parse_pool(), extract_structured_tables, str(pdf_path)
+    )
     used_ocr = False
     had_structured_tables = len(tables_data) > 0
 
     if is_scanned:
         print(f"   📄 Scanned PDF detected — attempting OCR...")
-        ocr_text = ocr_extract(pdf_path)
+        ocr_text = await loop.run_in_executor(get_parse_pool(), ocr_extract, str(pdf_path))
         if ocr_text and len(ocr_text.strip()) > MIN_TEXT_CHARS:
             raw_text = ocr_text
             tables_data = []
@@ -506,19 +813,13 @@ async def process_file(client, pdf_path):
 
     if len(raw_text.strip()) < MIN_TEXT_CHARS:
         print(f"   ❌ Insufficient text ({len(raw_text.strip())} chars). Skipping.")
-        return None, None
+        return None
 
     detected_period = detect_period(raw_text[:5000] + raw_text[-3000:])
     print(f"   📅 Detected Period: {detected_period}")
 
-    schema_str = json.dumps(METRICS_SCHEMA, indent=2)
-
     chunks = chunk_pdf_by_statement(tables_data, raw_text)
-    chunked_prompt = format_chunked_prompt(chunks, detected_period, schema_str)
-
-    if len(chunked_prompt) > CONTEXT_CHAR_LIMIT:
-        print(f"   ⚠️ Chunked prompt truncated from {len(chunked_prompt)} to {CONTEXT_CHAR_LIMIT} chars")
-        chunked_prompt = chunked_prompt[:CONTEXT_CHAR_LIMIT]
+    chunked_prompt = format_chunked_prompt(chunks, detected_period, SCHEMA_JSON)
 
     found_types = [t for t in ["income_statement", "balance_sheet", "cash_flow"] if chunks[t]["tables"] or len(chunks[t].get("text", "")) > 100]
     if found_types:
@@ -526,10 +827,24 @@ async def process_file(client, pdf_path):
     else:
         print(f"   📑 No clear statement type detected — using full context")
 
-    filtered_context = chunked_prompt
-    result = await call_with_retry(client, pdf_path, filtered_context, detected_period, schema_str)
+    return {
+        "pdf_path": pdf_path,
+        "filename": filename,
+        "period": detected_period,
+        "chunks": chunks,
+        "prompt": chunked_prompt,
+        "prompt_tokens": count_tokens(chunked_prompt),
+        "used_ocr": used_ocr,
+        "had_structured_tables": had_structured_tables,
+    }
+
 
-    quality = score_data_quality(result or {}, is_scanned=used_ocr, has_structured_tables=had_structured_tables)
+def grade_file(prepared, result):
+    quality = score_data_quality(
+        result or {},
+        is_scanned=prepared["used_ocr"],
+        has_structured_tables=prepared["had_structured_tables"],
+    )
     overall_quality = round(sum(q["score"] for q in quality.values()) / max(len(quality), 1), 2)
     if overall_quality >= 0.8:
         quality_grade = "A"
@@ -541,9 +856,70 @@ async def process_file(client, pdf_path):
         quality_grade = "D"
     else:
         quality_grade = "F"
-    print(f"   📊 Data quality grade: {quality_grade} (overall: {overall_quality})")
-
-    return result, chunks, quality, quality_grade
+    print(f"   📊 {prepared['filename']}: data quality grade {quality_grade} (overall: {overall_quality})")
+    return quality, quality_grade
+
+
+# ── Batched AI extraction ─────────────────────────────────────
+def group_ai_batches(prepared_files):
+    # Files share a request only while their prompts together would still
+    # fit one file's budget; large reports keep a request of their own.
+    batches = []
+    current = []
+    current_tokens = 0
+    for prepared in prepared_files:
+        tokens = prepared["prompt_tokens"]
+        if current and (len(current) >= AI_BATCH_SIZE or current_tokens + tokens > CONTEXT_TOKEN_LIMIT):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(prepared)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def extract_batch(client, assistant_id, batch):
+    if len(batch) == 1:
+        prepared = batch[0]
+        return [await call_with_retry(
+            client, assistant_id, prepared["pdf_path"], prepared["prompt"], prepared["period"], SCHEMA_JSON
+        )]
+
+    names = ", ".join(p["filename"] for p in batch)
+    print(f"\n   🤖 Batched AI Analysis for {len(batch)} files: {names}")
+    results = {}
+    try:
+        thread = await client.create_thread(assistant_id=assistant_id)
+        response = await client.add_message(
+            thread_id=thread.thread_id,
+            content=format_batched_prompt(batch, SCHEMA_JSON),
+        )
+        blocks = split_batched_response(getattr(response, "content", str(response)))
+        for prepared in batch:
+            block = blocks.get(prepared["filename"])
+            if block is None:
+                continue
+            data = parse_ai_response(block, prepared["period"])
+            if any(m in data for m in KEY_METRICS):
+                results[prepared["filename"]] = data
+    except Exception as e:
+        print(f"   ⚠️ Batched request failed: {e}")
+
+    # Anything the batch didn't answer well goes through the single-file path
+    batch_results = []
+    for prepared in batch:
+        data = results.get(prepared["filename"])
+        if data is None:
+            print(f"   ↩️ {prepared['filename']}: falling back to a single-file request")
+            data = await call_with_retry(
+                client, assistant_id, prepared["pdf_path"], prepared["prompt"], prepared["period"], SCHEMA_JSON
+            )
+        else:
+            print(f"   ✅ {prepared['filename']}: Extracted {len(data)-1} metrics")
+        batch_results.append(data)
+    return batch_results
 
 
 # ── Validation & CSV ──────────────────────────────────────────
@@ -557,8 +933,7 @@ def validate_extracted_data(data):
     extracted_count = sum(1 for m in SCHEMA_METRIC_NAMES if m in data)
     if extracted_count < 3:
         return False
-    key_metrics = ["revenue_total", "net_income", "cash_end_period", "total_assets"]
-    has_any_key = any(data.get(m, 0) != 0 for m in key_metrics)
+    has_any_key = any(data.get(m, 0) != 0 for m in KEY_METRICS)
     return has_any_key
 
 
@@ -606,10 +981,7 @@ STATEMENT_EXPECTED_RANGES = {
 
 
 def get_metric_statement_type(metric_name: str) -> str:
-    for m in METRICS_SCHEMA:
-        if m["metric_name"] == metric_name:
-            return m.get("statement_type", "unknown")
-    return "unknown"
+    return METRIC_STATEMENT_TYPES.get(metric_name, "unknown")
 
 
 def score_data_quality(data: dict, is_scanned: bool = False, has_structured_tables: bool = False) -> dict:
@@ -678,55 +1050,56 @@ def score_data_quality(data: dict, is_scanned: bool = False, has_structured_tabl
     return quality_scores
 
 
-def save_to_csv(results, chunks=None, quality_data=None):
-    if not results:
-        return
-    quality_dict = None
-    quality_grade = None
-    if quality_data:
-        quality_dict, quality_grade = quality_data
-    schema_cols = [m["metric_name"] for m in METRICS_SCHEMA]
-    columns = ["period"] + schema_cols
-
-    df = pd.DataFrame(results)
-    for col in columns:
-        if col not in df.columns:
-            df[col] = 0.0
-
-    df["gross_profit"] = df.apply(
-        lambda row: row["revenue_total"] - row["cost_of_revenue"]
-        if (row["gross_profit"] == 0 or pd.isna(row["gross_profit"])) and row["revenue_total"] != 0 and row["cost_of_revenue"] != 0
-        else row["gross_profit"],
-        axis=1,
-    )
-    df["operating_expenses_total"] = df.apply(
-        lambda row: (
-            row["employee_costs"]
-            + row["selling_marketing_expense"]
-            + row["general_admin_expense"]
+def _repair_row(result):
+    row = {"period": result.get("period", "Unknown Period")}
+    for col in SCHEMA_COLUMNS:
+        val = result.get(col)
+        row[col] = 0.0 if pd.isna(val) else float(val)
+    if row["gross_profit"] == 0 and row["revenue_total"] != 0 and row["cost_of_revenue"] != 0:
+        row["gross_profit"] = row["revenue_total"] - row["cost_of_revenue"]
+    if row["operating_expenses_total"] == 0:
+        row["operating_expenses_total"] = (
+            row["employee_costs"] + row["selling_marketing_expense"] + row["general_admin_expense"]
         )
-        if (row["operating_expenses_total"] == 0 or pd.isna(row["operating_expenses_total"]))
-        else row["operating_expenses_total"],
-        axis=1,
-    )
+    return row
 
-    df = df[columns]
 
-    # Fill missing values with 0 for downstream MC engine compatibility
-    for col in columns:
-        if col != "period":
-            df[col] = df[col].fillna(0.0)
+def append_csv_row(result):
+    """Append one extracted result to the CSV, writing the header on first use."""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    partial = OUTPUT_FILE.with_suffix(".partial")
+    write_header = not partial.exists() or partial.stat().st_size == 0
+    with open(partial, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["period"] + SCHEMA_COLUMNS)
+        if write_header:
+            writer.writeheader()
+        writer.writerow(_repair_row(result))
+    print(f"   💾 Row appended to {partial}")
 
-    # Sort periods chronologically; push "Unknown Period" to end
-    df["_sort_key"] = df["period"].apply(
-        lambda p: p if p != "Unknown Period" else "zzzzzz"
-    )
-    df = df.sort_values(by="_sort_key").drop(columns=["_sort_key"])
 
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    df.to_csv(OUTPUT_FILE, index=False)
+def finalize_csv():
+    """Sort the appended rows chronologically and move them over the final CSV.
+
+    The previous CSV is left untouched when no rows were written this run.
+    """
+    partial = OUTPUT_FILE.with_suffix(".partial")
+    if not partial.exists() or partial.stat().st_size == 0:
+        print(f"   ⚠️ No rows extracted; keeping existing {OUTPUT_FILE}")
+        return
+    df = pd.read_csv(partial)
+    df["_sort_key"] = df["period"].where(df["period"] != "Unknown Period", "zzzzzz")
+    df = df.sort_values(by="_sort_key", kind="stable").drop(columns=["_sort_key"])
+    df.to_csv(partial, index=False)
+    os.replace(partial, OUTPUT_FILE)
     print(f"   💾 CSV saved to {OUTPUT_FILE}")
 
+
+def save_metadata(chunks=None, quality_data=None):
+    quality_dict = None
+    quality_grade = None
+    if quality_data:
+        quality_dict, quality_grade = quality_data
+
     if quality_dict:
         quality_path = OUTPUT_DIR / "data_quality.json"
         quality_output = {
@@ -747,8 +1120,7 @@ def save_to_csv(results, chunks=None, quality_data=None):
                     "metric_count": 0,
                 }
         if chunk_summary:
-            for m in METRICS_SCHEMA:
-                cat = m.get("statement_type", "unknown")
+            for cat in METRIC_STATEMENT_TYPES.values():
                 if cat in chunk_summary:
                     chunk_summary[cat]["metric_count"] += 1
             chunk_path = OUTPUT_DIR / "statement_chunks.json"
@@ -768,7 +1140,7 @@ async def main():
 
     # Clean up stale output files from previous runs
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    for stale in ["data_quality.json", "statement_chunks.json"]:
+    for stale in [OUTPUT_FILE.with_suffix(".partial").name, "data_quality.json", "statement_chunks.json"]:
         stale_path = OUTPUT_DIR / stale
         if stale_path.exists():
             stale_path.unlink()
@@ -787,28 +1159,71 @@ async def main():
 
     print(f"📂 Found {len(pdf_files)} PDF file(s).")
 
+    # One assistant serves every PDF; each file still gets its own thread.
+    try:
+        assistant_obj = await create_extraction_assistant(client)
+    except Exception as e:
+        print(f"❌ Failed to create Backboard assistant: {e}")
+        return
+
     all_results = []
     all_chunks = []
     all_quality = []
     failed_files = []
 
-    for idx, pdf_path in enumerate(pdf_files, 1):
-        print(f"\n[{idx}/{len(pdf_files)}] {pdf_path.name}")
-        try:
-            result, chunks, quality, quality_grade = await process_file(client, pdf_path)
-            if result and validate_extracted_data(result):
-                all_results.append(result)
-                all_chunks.append(chunks)
-                all_quality.append((quality, quality_grade))
-                save_to_csv(all_results, chunks, quality_data=(quality, quality_grade))
-                print(f"   ✅ Success (quality: {quality_grade})")
-            else:
+    # Files are parsed concurrently, then sent to the AI in batches; the lock
+    # keeps CSV writes ordered.
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILES)
+    csv_lock = asyncio.Lock()
+
+    async def prepare_one(idx, pdf_path):
+        async with semaphore:
+            print(f"\n[{idx}/{len(pdf_files)}] {pdf_path.name}")
+            try:
+                prepared = await prepare_file(pdf_path)
+            except Exception as e:
+                print(f"   ❌ Error: {e}")
+                log.error("failed to process %s", pdf_path.name, exc_info=True)
+                failed_files.append((pdf_path.name, str(e)))
+                return None
+            if prepared is None:
                 failed_files.append((pdf_path.name, "Validation failed"))
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
-            failed_files.append((pdf_path.name, str(e)))
+            return prepared
+
+    async def run_batch(batch):
+        async with semaphore:
+            try:
+                results = await extract_batch(client, assistant_obj.assistant_id, batch)
+            except Exception as e:
+                print(f"   ❌ Error: {e}")
+                log.error("failed to process batch %s", [p["filename"] for p in batch], exc_info=True)
+                failed_files.extend((p["filename"], str(e)) for p in batch)
+                return
+            for prepared, result in zip(batch, results):
+                quality, quality_grade = grade_file(prepared, result)
+                if result and validate_extracted_data(result):
+                    async with csv_lock:
+                        all_results.append(result)
+                        all_chunks.append(prepared["chunks"])
+                        all_quality.append((quality, quality_grade))
+                        append_csv_row(result)
+                        save_metadata(prepared["chunks"], quality_data=(quality, quality_grade))
+                    print(f"   ✅ {prepared['filename']}: Success (quality: {quality_grade})")
+                else:
+                    failed_files.append((prepared["filename"], "Validation failed"))
+
+    try:
+        prepared_files = await asyncio.gather(
+            *(prepare_one(idx, p) for idx, p in enumerate(pdf_files, 1))
+        )
+        batches = group_ai_batches([p for p in prepared_files if p is not None])
+        if batches:
+            print(f"\n🤖 Sending {sum(map(len, batches))} file(s) in {len(batches)} AI request(s)")
+        await asyncio.gather(*(run_batch(batch) for batch in batches))
+    finally:
+        shutdown_parse_pool()
+
+    finalize_csv()
 
     print(f"\n{'='*60}")
     print(f"SUMMARY: {len(all_results)}/{len(pdf_files)} succeeded")
@@ -820,4 +1235,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, handlers=[logging.StreamHandler()])
     asyncio.run(main())
@@ -2,12 +2,22 @@ import pytest
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'extractors'))
+import pandas as pd
+import pdfProcessor
 from pdfProcessor import (
     detect_statement_type,
     detect_period,
     validate_extracted_data,
     score_data_quality,
     get_metric_statement_type,
+    parse_ai_response,
+    append_csv_row,
+    finalize_csv,
+    _statement_block_pages,
+    _strip_page_boilerplate,
+    format_chunked_prompt,
+    group_ai_batches,
+    split_batched_response,
 )
 
 class TestDetectStatementType:
@@ -30,6 +40,53 @@ class TestDetectStatementType:
         assert detect_statement_type("") == "unknown"
 
 
+class TestStatementBlockPages:
+    def test_short_document_keeps_all_candidates(self):
+        texts = ["Balance Sheet\nTotal Assets 1"] * 5
+        assert _statement_block_pages(texts, [1, 3, 5]) == [1, 3, 5]
+
+    def test_long_report_narrows_to_header_run(self):
+        texts = ["Narrative about revenue and assets"] * 60
+        texts[2] = "Contents\nBalance Sheet 40"
+        for p in (40, 41, 43):
+            texts[p - 1] = "Balance Sheet\nTotal Assets 5000"
+        candidates = [3, 10, 20, 40, 41, 43, 45, 50]
+        assert _statement_block_pages(texts, candidates) == [40, 41, 43, 45]
+
+
+class TestPromptBudget:
+    def test_running_headers_kept_once(self):
+        pages = [f" {i} ---\nACME Ltd Annual Report\nBalance Sheet\nTotal Assets {i}" for i in range(4)]
+        stripped = _strip_page_boilerplate(pages)
+        assert sum("ACME Ltd Annual Report" in p for p in stripped) == 1
+        assert all("Balance Sheet" in p for p in stripped)
+
+    def test_prompt_respects_token_budget(self):
+        chunks = {
+            stmt: {"tables": [], "text": "Revenue 1000 for the year\n" * 5000}
+            for stmt in ["income_statement", "balance_sheet", "cash_flow", "unknown"]
+        }
+        prompt = format_chunked_prompt(chunks, "FY25", pdfProcessor.SCHEMA_JSON, token_limit=4000)
+        assert pdfProcessor.count_tokens(prompt) <= 4000 + 10
+        assert "INSTRUCTIONS:" in prompt
+
+
+class TestBatchedExtraction:
+    def test_split_batched_response(self):
+        content = "```csv\n===FILE: a.pdf===\nrevenue_total,100\n=== FILE: b.pdf ===\nnet_income,5\n```"
+        blocks = split_batched_response(content)
+        assert set(blocks) == {"a.pdf", "b.pdf"}
+        assert parse_ai_response(blocks["a.pdf"], "P")["revenue_total"] == 100.0
+        assert parse_ai_response(blocks["b.pdf"], "P")["net_income"] == 5.0
+
+    def test_group_ai_batches_respects_size_and_budget(self, monkeypatch):
+        monkeypatch.setattr(pdfProcessor, "AI_BATCH_SIZE", 2)
+        monkeypatch.setattr(pdfProcessor, "CONTEXT_TOKEN_LIMIT", 1000)
+        files = [{"prompt_tokens": t} for t in (100, 100, 100, 950, 100)]
+        batches = group_ai_batches(files)
+        assert [len(b) for b in batches] == [2, 1, 1, 1]
+
+
 class TestDetectPeriod:
     def test_quarterly_format(self):
         text = "Financial results for Q1 FY25"
@@ -46,6 +103,30 @@ class TestDetectPeriod:
         assert detect_period(None) == "Unknown Period"
 
 
+class TestParseAiResponse:
+    def test_csv_format(self):
+        content = "revenue_total,1000\nnet_income,200\nunknown_metric,5"
+        result = parse_ai_response(content, "FY25-Q1")
+        assert result == {"period": "FY25-Q1", "revenue_total": 1000.0, "net_income": 200.0}
+
+    def test_csv_with_fence_and_blank_values(self):
+        content = "```csv\nrevenue_total,\"1,000\"\nnet_income,\ntotal_assets,N/A\n```"
+        result = parse_ai_response(content, "FY25-Q1")
+        assert result == {"period": "FY25-Q1", "revenue_total": 1000.0}
+
+    def test_json_format(self):
+        content = '```json\n{"revenue_total": 1000, "net_income": "200"}\n```'
+        result = parse_ai_response(content, "FY25-Q1")
+        assert result["revenue_total"] == 1000.0
+        assert result["net_income"] == 200.0
+
+    def test_key_value_format(self):
+        content = "revenue_total: 1000\nnet_income = 200"
+        result = parse_ai_response(content, "FY25-Q1")
+        assert result["revenue_total"] == 1000.0
+        assert result["net_income"] == 200.0
+
+
 class TestValidateExtractedData:
     def test_valid_data(self):
         data = {"period": "FY25-Q1", "revenue_total": 1000, "net_income": 200, "total_assets": 5000}
@@ -109,3 +190,47 @@ class TestScoreDataQuality:
         result = score_data_quality(data, has_structured_tables=True)
         assert result["revenue_total"]["score"] == 0.0
         assert "missing" in result["revenue_total"]["flags"]
+
+
+class TestCsvOutput:
+    def test_math_repair_and_ordering(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pdfProcessor, "OUTPUT_DIR", tmp_path)
+        monkeypatch.setattr(pdfProcessor, "OUTPUT_FILE", tmp_path / "out.csv")
+        results = [
+            {"period": "Unknown Period", "revenue_total": 50, "gross_profit": 20},
+            {"period": "FY25-Q2", "revenue_total": 1000, "cost_of_revenue": 600, "gross_profit": 0,
+             "employee_costs": 100, "selling_marketing_expense": 50, "general_admin_expense": 25},
+            {"period": "FY25-Q1", "revenue_total": 900, "cost_of_revenue": 500, "gross_profit": 350,
+             "operating_expenses_total": 300},
+        ]
+        for result in results:
+            append_csv_row(result)
+        finalize_csv()
+        df = pd.read_csv(tmp_path / "out.csv")
+        assert df["period"].tolist() == ["FY25-Q1", "FY25-Q2", "Unknown Period"]
+        assert df["gross_profit"].tolist() == [350.0, 400.0, 20.0]
+        assert df["operating_expenses_total"].tolist() == [300.0, 175.0, 0.0]
+        assert df.columns.tolist() == ["period"] + pdfProcessor.SCHEMA_COLUMNS
+        assert not df.isna().any().any()
+
+    def test_append_rows_then_finalize(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pdfProcessor, "OUTPUT_DIR", tmp_path)
+        monkeypatch.setattr(pdfProcessor, "OUTPUT_FILE", tmp_path / "out.csv")
+        append_csv_row({"period": "FY25-Q2", "revenue_total": 1000, "cost_of_revenue": 600})
+        append_csv_row({"period": "Unknown Period", "revenue_total": 50})
+        append_csv_row({"period": "FY25-Q1", "revenue_total": 900, "employee_costs": 100,
+                        "general_admin_expense": 25})
+        finalize_csv()
+        df = pd.read_csv(tmp_path / "out.csv")
+        assert df["period"].tolist() == ["FY25-Q1", "FY25-Q2", "Unknown Period"]
+        assert df["gross_profit"].tolist() == [0.0, 400.0, 0.0]
+        assert df["operating_expenses_total"].tolist() == [125.0, 0.0, 0.0]
+        assert not (tmp_path / "out.partial").exists()
+        assert df.columns.tolist() == ["period"] + pdfProcessor.SCHEMA_COLUMNS
+
+    def test_finalize_without_rows_keeps_previous_csv(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pdfProcessor, "OUTPUT_DIR", tmp_path)
+        monkeypatch.setattr(pdfProcessor, "OUTPUT_FILE", tmp_path / "out.csv")
+        (tmp_path / "out.csv").write_text("period\nFY24-Q4\n")
+        finalize_csv()
+        assert (tmp_path / "out.csv").read_text() == "period\nFY24-Q4\n"
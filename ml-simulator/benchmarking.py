@@ -9,13 +9,11 @@ import os
 import json
 import numpy as np
 import pandas as pd
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 from typing import Dict, List, Optional
 from monte_carlo_simulations import (
     load_financials,
     derive_historical_metrics,
+    new_figure,
     CSV_PATH,
     OUTPUT_DIR,
 )
@@ -174,7 +172,7 @@ def plot_radar_chart(results: List[Dict]) -> Optional[str]:
     angles = np.linspace(0, 2 * np.pi, num_vars, endpoint=False).tolist()
     angles += angles[:1]
 
-    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True))
+    fig, ax = new_figure((8, 8), polar=True)
     colors = ["#8c52ff", "#ff6b6b", "#4ecdc4", "#ffd93d", "#6c5ce7", "#f97316"]
 
     for idx, r in enumerate(valid):
@@ -198,10 +196,9 @@ def plot_radar_chart(results: List[Dict]) -> Optional[str]:
     ax.set_title("Company Benchmark — Radar", fontsize=14, fontweight="bold", pad=20)
     ax.legend(loc="upper right", bbox_to_anchor=(1.3, 1.1), fontsize=10)
 
-    plt.tight_layout()
+    fig.tight_layout()
     filename = os.path.join(OUTPUT_DIR, "benchmark_radar.png")
-    plt.savefig(filename, dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.savefig(filename, dpi=300, bbox_inches="tight")
     return filename
 
 
@@ -216,7 +213,7 @@ def plot_benchmark_bar_chart(results: List[Dict]) -> Optional[str]:
     x = np.arange(len(bar_metrics))
     width = 0.8 / n if n > 0 else 0.2
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = new_figure((10, 6))
     colors = ["#8c52ff", "#ff6b6b", "#4ecdc4", "#ffd93d", "#6c5ce7"]
 
     for idx, r in enumerate(valid):
@@ -251,10 +248,9 @@ def plot_benchmark_bar_chart(results: List[Dict]) -> Optional[str]:
     ax.spines["top"].set_visible(False)
     ax.spines["right"].set_visible(False)
 
-    plt.tight_layout()
+    fig.tight_layout()
     filename = os.path.join(OUTPUT_DIR, "benchmark_bar.png")
-    plt.savefig(filename, dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.savefig(filename, dpi=300, bbox_inches="tight")
     return filename
 
 
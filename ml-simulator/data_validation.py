@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, List
-from monte_carlo_simulations import CSV_PATH, safe_float
+from monte_carlo_simulations import CSV_PATH, safe_float_column
 
 REQUIRED_METRICS = [
     "revenue_total", "gross_profit", "operating_expenses_total", "net_income",
@@ -44,7 +44,7 @@ def run_data_validation(csv_path: str = None) -> Dict:
 
         null_count = df[col].isna().sum()
         null_pct = (null_count / len(df)) * 100
-        present = df[col].apply(safe_float).notna().sum() > 0
+        present = bool(safe_float_column(df[col]).notna().any())
         if present:
             present_metrics += 1
 
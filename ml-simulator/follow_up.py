@@ -12,8 +12,8 @@ import asyncio
 
 from nlp_pipeline import parse_question_with_fallback, get_or_create_assistant, API_KEY
 from backboard import BackboardClient
-from llm_interpreter import interpret_mc_results, get_or_create_interpreter_assistant, INTERPRETER_SYSTEM_PROMPT
-from mc_router import answer_question_async
+from llm_interpreter import interpret_mc_results, get_or_create_interpreter_assistant, prefetch_threads, INTERPRETER_SYSTEM_PROMPT
+from mc_router import answer_question_async, new_event_loop
 
 FOLLOW_UP_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE = os.path.join(FOLLOW_UP_DIR, "follow_up_input.json")
@@ -74,10 +74,10 @@ async def handle_follow_up():
 
     client = BackboardClient(api_key=API_KEY)
 
-    nlp_assistant_id = await get_or_create_assistant(client)
     interpreter_assistant_id = await get_or_create_interpreter_assistant(client)
 
-    # If we have existing MC results, use LLM re-interpretation directly
+    # If we have existing MC results, use LLM re-interpretation directly;
+    # the NLP parser assistant is only needed for a new analysis
     if mc_facts:
         follow_up_prompt = build_follow_up_prompt(new_question, conversation, mc_facts)
         llm_response = await interpret_mc_results(new_question, mc_facts, client, interpreter_assistant_id)
@@ -89,7 +89,12 @@ async def handle_follow_up():
             "statistics": mc_facts.get("statistics", {}),
         }
     else:
-        # No existing data — run a full new analysis
+        # No existing data — run a full new analysis. Open the interpreter's
+        # thread alongside the NLP assistant lookup
+        nlp_assistant_id, _ = await asyncio.gather(
+            get_or_create_assistant(client),
+            prefetch_threads(client, interpreter_assistant_id)
+        )
         response = await answer_question_async(
             new_question, client,
             nlp_assistant_id, interpreter_assistant_id,
@@ -110,11 +115,18 @@ async def handle_follow_up():
         ],
     }
 
+    # Encode once for both the output file and stdout
+    payload = json.dumps(output, indent=2, default=str)
     with open(OUTPUT_FILE, "w") as f:
-        json.dump(output, f, indent=2, default=str)
+        f.write(payload)
 
-    print(json.dumps(output, indent=2, default=str))
+    print(payload)
 
 
 if __name__ == "__main__":
-    asyncio.run(handle_follow_up())
+    loop = new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(handle_follow_up())
+    finally:
+        loop.close()
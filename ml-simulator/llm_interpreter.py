@@ -1,8 +1,45 @@
+"""
+LLM Interpreter
+===============
+Turns Monte Carlo facts into an executive-friendly explanation via Backboard.
+Everything here is async and I/O-bound on the LLM API; the entry points
+(mc_router.answer_question, follow_up.py) run it on uvloop when installed.
+"""
+
+import os
 import json
 import asyncio
-from typing import Dict
+import hashlib
+import random
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
 from backboard import BackboardClient
-from backboard.exceptions import BackboardAPIError
+from backboard.exceptions import BackboardAPIError, BackboardRateLimitError
+
+try:
+    import orjson  # faster dumps, serialises numpy scalars/arrays natively
+except ImportError:
+    orjson = None
+
+MAX_RETRIES = 3
+INITIAL_BACKOFF_S = 1
+MAX_CONCURRENT_INTERPRETATIONS = 8
+LLM_PROVIDER = "openai"
+LLM_MODEL = "gpt-4o"
+# Explanations kept in memory; older ones are evicted first
+MAX_CACHED_EXPLANATIONS = 256
+# Directory for explanations reused across processes (the backend runs one
+# process per question); unset keeps the cache in memory only.
+EXPLANATION_CACHE_DIR = os.environ.get("LLM_INTERPRETER_CACHE_DIR", "")
+# Pretty-print the facts in prompts (easier to eyeball, ~25% more tokens)
+DEBUG = os.environ.get("LLM_INTERPRETER_DEBUG", "") not in ("", "0")
+
+# Numeric arrays longer than this are summarised before going into the prompt;
+# values under these keys are already summaries and pass through untouched.
+PROMPT_ARRAY_LIMIT = 20
+PROMPT_KEEP_KEYS = frozenset({"percentiles", "mean", "stdev", "std"})
 
 
 INTERPRETER_SYSTEM_PROMPT = """
@@ -23,19 +60,157 @@ Your job:
 """
 
 
+# assistant_id per API key, so repeated questions skip the create round-trip.
+# Locks are per event loop: mc_router and follow_up.py each run their own.
+_ASSISTANT_IDS: Dict[str, str] = {}
+_ASSISTANT_LOCKS = weakref.WeakKeyDictionary()
+
+
 async def get_or_create_interpreter_assistant(client: BackboardClient):
     """
-    Create the interpreter assistant once.
-    In production, you should persist assistant_id.
+    Create the interpreter assistant once per API key and reuse its id.
     """
-    try:
-        assistant = await client.create_assistant(
-            name="Monte Carlo Results Interpreter",
-            system_prompt=INTERPRETER_SYSTEM_PROMPT
-        )
+    key = getattr(client, "api_key", "")
+    assistant_id = _ASSISTANT_IDS.get(key)
+    if assistant_id is not None:
+        return assistant_id
+
+    loop = asyncio.get_running_loop()
+    lock = _ASSISTANT_LOCKS.get(loop)
+    if lock is None:
+        lock = _ASSISTANT_LOCKS[loop] = asyncio.Lock()
+    async with lock:
+        assistant_id = _ASSISTANT_IDS.get(key)
+        if assistant_id is not None:
+            return assistant_id
+        try:
+            assistant = await client.create_assistant(
+                name="Monte Carlo Results Interpreter",
+                system_prompt=INTERPRETER_SYSTEM_PROMPT
+            )
+        except Exception as e:
+            raise RuntimeError("Failed to create interpreter assistant") from e
+        _ASSISTANT_IDS[key] = assistant.assistant_id
         return assistant.assistant_id
-    except Exception as e:
-        raise RuntimeError("Failed to create interpreter assistant") from e
+
+
+# Pre-created, still-empty thread ids per (api_key, assistant_id). Threads keep
+# their message history, so each one is handed out once and never reused.
+_SPARE_THREADS: Dict[Tuple[str, str], List[str]] = {}
+
+
+async def prefetch_threads(client: BackboardClient, assistant_id: str, count: int = 1) -> None:
+    """
+    Open `count` interpreter threads ahead of time so interpret_mc_results can
+    skip the create round-trip. Failures are ignored: it creates its own then.
+    """
+    created = await asyncio.gather(
+        *(client.create_thread(assistant_id) for _ in range(count)),
+        return_exceptions=True
+    )
+    spares = _SPARE_THREADS.setdefault((getattr(client, "api_key", ""), assistant_id), [])
+    spares.extend(t.thread_id for t in created if not isinstance(t, BaseException))
+
+
+async def _new_thread_id(client: BackboardClient, assistant_id: str) -> str:
+    spares = _SPARE_THREADS.get((getattr(client, "api_key", ""), assistant_id))
+    if spares:
+        return spares.pop()
+    thread = await client.create_thread(assistant_id)
+    return thread.thread_id
+
+
+def _retry_delay(error: BackboardAPIError, attempt: int) -> float:
+    """Honour the server's Retry-After header, else exponential backoff with jitter."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return INITIAL_BACKOFF_S * (2 ** attempt) + random.random()
+
+
+def _prune_for_prompt(value: Any) -> Any:
+    """Replace long numeric arrays with a p10/p50/p90 summary, recursively."""
+    if isinstance(value, dict):
+        return {
+            k: v if k in PROMPT_KEEP_KEYS else _prune_for_prompt(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, (list, tuple, np.ndarray)):
+        if len(value) > PROMPT_ARRAY_LIMIT:
+            try:
+                arr = np.asarray(value)
+            except ValueError:  # ragged nesting
+                arr = None
+            if arr is not None and arr.dtype.kind in "iuf":
+                p10, p50, p90 = np.percentile(arr, [10, 50, 90])
+                return {"_summary": {
+                    "p10": float(p10), "p50": float(p50), "p90": float(p90), "n": int(arr.size)
+                }}
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        return [_prune_for_prompt(v) for v in value]
+    return value
+
+
+def _dump_facts(mc_facts: Dict) -> str:
+    # The model doesn't need indentation; compact JSON keeps the prompt small
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if DEBUG:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(mc_facts, option=option).decode()
+    if DEBUG:
+        return json.dumps(mc_facts, indent=2)
+    return json.dumps(mc_facts, separators=(",", ":"))
+
+
+# Explanations by prompt hash, most recently used last. Each question in a
+# process draws fresh simulation numbers, so a repeat within one process gets
+# new facts and misses; reuse comes from LLM_INTERPRETER_CACHE_DIR across
+# fresh processes (the backend's one question per process starts from the
+# same seed, so the same question on the same CSV yields the same prompt).
+_EXPLANATIONS: OrderedDict = OrderedDict()
+
+
+def _explanation_key(prompt: str) -> str:
+    return hashlib.sha256(f"{LLM_PROVIDER}/{LLM_MODEL}\n{prompt}".encode()).hexdigest()
+
+
+def _cached_explanation(key: str) -> Optional[str]:
+    explanation = _EXPLANATIONS.get(key)
+    if explanation is not None:
+        _EXPLANATIONS.move_to_end(key)
+    elif EXPLANATION_CACHE_DIR:
+        try:
+            with open(os.path.join(EXPLANATION_CACHE_DIR, f"{key}.txt"), encoding="utf-8") as f:
+                explanation = f.read()
+        except OSError:
+            return None
+        _remember_explanation(key, explanation)
+    return explanation
+
+
+def _remember_explanation(key: str, explanation: str) -> None:
+    _EXPLANATIONS[key] = explanation
+    _EXPLANATIONS.move_to_end(key)
+    if len(_EXPLANATIONS) > MAX_CACHED_EXPLANATIONS:
+        _EXPLANATIONS.popitem(last=False)
+
+
+def _store_explanation(key: str, explanation: str) -> None:
+    _remember_explanation(key, explanation)
+    if not EXPLANATION_CACHE_DIR:
+        return
+    path = os.path.join(EXPLANATION_CACHE_DIR, f"{key}.txt")
+    try:
+        os.makedirs(EXPLANATION_CACHE_DIR, exist_ok=True)
+        # Write-then-rename so a concurrent reader never sees a partial file
+        with open(f"{path}.{os.getpid()}.tmp", "w", encoding="utf-8") as f:
+            f.write(explanation)
+        os.replace(f"{path}.{os.getpid()}.tmp", path)
+    except OSError:
+        pass  # the cache is best-effort
 
 
 async def interpret_mc_results(
@@ -46,7 +221,8 @@ async def interpret_mc_results(
 ) -> str:
     """
     Converts Monte Carlo factual output into a human-readable explanation
-    with insights and recommendations.
+    with insights and recommendations. An identical prompt is answered from
+    the explanation cache instead of another LLM round-trip.
     """
 
     user_prompt = f"""
@@ -54,7 +230,7 @@ USER QUESTION:
 {question}
 
 MONTE CARLO RESULTS (FACTS ONLY):
-{json.dumps(mc_facts, indent=2)}
+{_dump_facts(_prune_for_prompt(mc_facts))}
 
 INSTRUCTIONS:
 - Answer the user's question directly
@@ -63,15 +239,45 @@ INSTRUCTIONS:
 - Be concise, executive-friendly, and precise
 - Format the output clearly with sections
 """
+    cache_key = _explanation_key(user_prompt)
+    cached = _cached_explanation(cache_key)
+    if cached is not None:
+        return cached
 
-    # Create a fresh thread per query
-    thread = await client.create_thread(assistant_id)
+    for attempt in range(MAX_RETRIES):
+        try:
+            # Fresh thread per query (a prefetched one when available)
+            thread_id = await _new_thread_id(client, assistant_id)
 
-    response = await client.add_message(
-        thread_id=thread.thread_id,
-        content=user_prompt,
-        llm_provider="openai",
-        model_name="gpt-4o"
-    )
+            response = await client.add_message(
+                thread_id=thread_id,
+                content=user_prompt,
+                llm_provider=LLM_PROVIDER,
+                model_name=LLM_MODEL
+            )
+            explanation = response.content.strip()
+            _store_explanation(cache_key, explanation)
+            return explanation
+        except BackboardRateLimitError as e:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            await asyncio.sleep(_retry_delay(e, attempt))
+
+
+async def interpret_many(
+    items: Iterable[Tuple[str, Dict]],
+    client: BackboardClient,
+    assistant_id: str,
+    max_concurrency: int = MAX_CONCURRENT_INTERPRETATIONS
+) -> List[str]:
+    """
+    Interpret several (question, mc_facts) pairs concurrently, at most
+    max_concurrency requests in flight. Results keep the input order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def one(question: str, mc_facts: Dict) -> str:
+        async with semaphore:
+            return await interpret_mc_results(question, mc_facts, client, assistant_id)
 
-    return response.content.strip()
\ No newline at end of file
+    return await asyncio.gather(*(one(q, facts) for q, facts in items))
\ No newline at end of file
@@ -9,18 +9,20 @@ import base64
 import os
 import numpy as np
 import re
-from typing import Dict
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+import threading
+from typing import Dict, List
 
 from nlp_pipeline import parse_question_with_fallback, get_or_create_assistant, API_KEY
 from backboard import BackboardClient
-from llm_interpreter import interpret_mc_results, get_or_create_interpreter_assistant
+from llm_interpreter import (
+    interpret_mc_results,
+    get_or_create_interpreter_assistant,
+    prefetch_threads,
+    MAX_CONCURRENT_INTERPRETATIONS
+)
 from monte_carlo_simulations import (
-    load_financials,
-    derive_historical_metrics,
-    build_distributions,
+    load_financials_cached,
+    load_base_and_distributions,
     run_monte_carlo_simulations,
     plot_monte_carlo_bell_curve,
     plot_revenue_distribution,
@@ -29,8 +31,11 @@ from monte_carlo_simulations import (
     load_data_quality,
     run_multi_period_simulations,
     plot_fan_chart,
+    sorted_percentiles,
+    sorted_prob_below,
     NUM_SIMULATIONS,
-    CSV_PATH
+    CSV_PATH,
+    RNG
 )
 from scenario_comparison import run_scenario_comparison, plot_comparison_chart
 from ratio_dashboard import compute_ratios
@@ -40,6 +45,282 @@ from what_if_builder import what_if_from_session, run_what_if_comparison, apply_
 from executive_summary import generate_executive_summary
 from data_validation import run_data_validation
 
+try:
+    import uvloop  # lower per-await overhead than the default loop (Linux/macOS)
+except ImportError:
+    uvloop = None
+
+
+# (pattern, period type) for "next 3 quarters"-style horizons; first match wins
+PERIOD_PATTERNS = (
+    (re.compile(r'(\d+)\s*(?:quarters?|q)'), 'quarters'),
+    (re.compile(r'(\d+)\s*(?:months?|m)'), 'months'),
+    (re.compile(r'(\d+)\s*(?:years?|y)'), 'years'),
+    (re.compile(r'last\s+(\d+)'), 'quarters'),
+    (re.compile(r'(\d+)\s*(?:periods?|period)'), 'periods'),
+)
+_NUMBER_RE = re.compile(r'(\d+)')
+# Every routing keyword in the question, from one scan; the lookahead lets
+# overlapping occurrences match (no keyword is a prefix of another)
+_ROUTING_KEYWORDS_RE = re.compile(
+    r'(?=(below|falls|drops|risk|volatile|volatility|range|expected|runway|gross|worst))'
+)
+
+SERIES_PERCENTILES = (1, 5, 10, 50, 90, 95)
+
+
+def _series_summary(values: np.ndarray) -> Dict:
+    """
+    Every statistic the router reports for one simulated series, from a single
+    sort and one mean/std pass; "sorted" is kept for threshold probabilities.
+    """
+    ordered = np.sort(values)
+    p1, p5, p10, p50, p90, p95 = sorted_percentiles(ordered, SERIES_PERCENTILES)
+    return {
+        "sorted": ordered,
+        "mean": values.mean(),
+        "std": values.std(),
+        "min": float(ordered[0]),
+        "max": float(ordered[-1]),
+        "p1": p1, "p5": p5, "p10": p10, "p50": p50, "p90": p90, "p95": p95,
+    }
+
+
+# Keys copied from a _series_summary into mc_facts["statistics"], after mean/median/std
+STATS_KEYS = ("p5", "p10", "p50", "p90", "p95", "min", "max")
+MARGIN_STATS_KEYS = ("p5", "p95")
+
+
+def _stats_block(summary: Dict, keys=STATS_KEYS, **extra) -> Dict:
+    """mc_facts["statistics"] entry for one series, read off its _series_summary."""
+    block = {"mean": float(summary["mean"]), "median": summary["p50"], "std": float(summary["std"])}
+    block.update((key, summary[key]) for key in keys)
+    block.update(extra)
+    return block
+
+
+# computed_answer handlers, picked by _answer_topic. Each takes the stats bundle
+# built in answer_question_async, the routing keywords found in the question, the
+# parsed parameters and the base metrics; returns (computed_answer, computed_metrics).
+
+def _answer_topic(metric: str, intent: str):
+    """Which handler answers the question: "revenue", "cash", "margin" or None (general)."""
+    if "revenue" in metric or "revenue" in intent:
+        return "revenue"
+    if "cash" in metric or "cash" in intent or "liquidity" in metric:
+        return "cash"
+    if "margin" in metric or "profitability" in metric or "margin" in intent:
+        return "margin"
+    return None
+
+
+def _answer_revenue(stats: Dict, question_hits: set, parameters: Dict, base: Dict):
+    rev = stats["rev"]
+    revenue_cv = stats["revenue_cv"]
+    if not question_hits.isdisjoint(("below", "falls", "drops")):
+        threshold = parameters.get("threshold")
+        if threshold is None:
+            threshold = base["revenue"]
+        prob = sorted_prob_below(rev["sorted"], threshold)
+        computed_answer = {
+            "probability": prob,
+            "percentage": prob * 100,
+            "threshold": threshold,
+            "interpretation": "high" if prob > 0.3 else "medium" if prob > 0.1 else "low"
+        }
+        computed_metrics = {
+            "p5_revenue": rev["p5"],
+            "p10_revenue": rev["p10"],
+            "median_revenue": rev["p50"],
+            "p90_revenue": rev["p90"],
+            "p95_revenue": rev["p95"]
+        }
+        return computed_answer, computed_metrics
+    if not question_hits.isdisjoint(("risk", "volatile", "volatility")):
+        return {
+            "coefficient_of_variation": revenue_cv,
+            "volatility_level": "high" if revenue_cv > 0.2 else "medium" if revenue_cv > 0.1 else "low",
+            "probability_decline": stats["prob_revenue_decline"],
+            "risk_level": "high" if revenue_cv > 0.25 else "medium" if revenue_cv > 0.15 else "low",
+            "historical_volatility": stats["historical_cv"],
+            "periods_compared": stats["periods"]
+        }, {}
+    if not question_hits.isdisjoint(("range", "expected")):
+        return {
+            "p10_revenue": rev["p10"],
+            "p90_revenue": rev["p90"],
+            "median_revenue": rev["p50"],
+            "range": rev["p90"] - rev["p10"],
+            "confidence_interval": "80%"
+        }, {}
+    return {
+        "expected_revenue_range": {
+            "p10": rev["p10"],
+            "median": rev["p50"],
+            "p90": rev["p90"]
+        },
+        "probability_decline": stats["prob_revenue_decline"],
+        "volatility": revenue_cv,
+        "risk_level": "high" if revenue_cv > 0.25 else "medium" if revenue_cv > 0.15 else "low"
+    }, {}
+
+
+def _answer_cash(stats: Dict, question_hits: set, parameters: Dict, base: Dict):
+    csh = stats["csh"]
+    if not question_hits.isdisjoint(("below", "drops")):
+        threshold = parameters.get("threshold")
+        if threshold is None:
+            threshold = base.get("min_cash_buffer_for_hiring", base["cash"] * 0.5)
+        prob = sorted_prob_below(csh["sorted"], threshold)
+        return {
+            "probability": prob,
+            "threshold": threshold,
+            "p5_cash": csh["p5"],
+            "median_cash": csh["p50"]
+        }, {}
+    if "runway" in question_hits:
+        # Mean of the negative cash flows, without gathering them into a new array
+        cash_flow = stats["cash_flow"]
+        burning = np.count_nonzero(cash_flow < 0)
+        monthly_burn = float(-np.minimum(cash_flow, 0.0).sum() / burning) if burning else base["cash"] / 12
+        if monthly_burn > 0:
+            runway_p5 = csh["p5"] / monthly_burn
+            runway_median = csh["p50"] / monthly_burn
+        else:
+            runway_p5 = float("inf")
+            runway_median = float("inf")
+        return {
+            "runway_months_p5": runway_p5,
+            "runway_months_median": runway_median,
+            "monthly_burn_rate": monthly_burn
+        }, {}
+    prob_cash_negative = stats["prob_cash_negative"]
+    return {
+        "probability_negative_cash": prob_cash_negative,
+        "probability_low_liquidity": sorted_prob_below(csh["sorted"], base["cash"] * 0.3),
+        "risk_level": "high" if prob_cash_negative > 0.15 else "medium" if prob_cash_negative > 0.05 else "low",
+        "p5_cash": csh["p5"],
+        "median_cash": csh["p50"]
+    }, {}
+
+
+def _answer_margin(stats: Dict, question_hits: set, parameters: Dict, base: Dict):
+    gm, om = stats["gm"], stats["om"]
+    if "gross" in question_hits:
+        threshold = parameters.get("threshold", 30)
+        prob = sorted_prob_below(gm["sorted"], threshold)
+        return {
+            "probability": prob,
+            "threshold": threshold,
+            "p5_gross_margin": gm["p5"],
+            "median_gross_margin": gm["p50"]
+        }, {}
+    if "worst" in question_hits:  # also covers "worst-case"
+        return {
+            "worst_case_5th_percentile": om["p5"],
+            "worst_case_1st_percentile": om["p1"],
+            "median": om["p50"]
+        }, {}
+    return {
+        "gross_margin": {
+            "p5": gm["p5"],
+            "median": gm["p50"]
+        },
+        "operating_margin": {
+            "p5": om["p5"],
+            "median": om["p50"]
+        }
+    }, {}
+
+
+def _answer_general(stats: Dict, question_hits: set, parameters: Dict, base: Dict):
+    rev, csh = stats["rev"], stats["csh"]
+    revenue_cv = stats["revenue_cv"]
+    prob_cash_negative = stats["prob_cash_negative"]
+    revenue_risk_level = "HIGH" if revenue_cv > 0.25 else "MEDIUM" if revenue_cv > 0.15 else "LOW"
+    cash_risk_level = "HIGH" if prob_cash_negative > 0.15 else "MEDIUM" if prob_cash_negative > 0.05 else "LOW"
+
+    return {
+        "revenue_risk_assessment": {
+            "risk_level": revenue_risk_level,
+            "coefficient_of_variation": revenue_cv,
+            "probability_decline": stats["prob_revenue_decline"],
+            "expected_revenue_range": {
+                "p10": rev["p10"],
+                "median": rev["p50"],
+                "p90": rev["p90"]
+            }
+        },
+        "cash_risk_assessment": {
+            "risk_level": cash_risk_level,
+            "probability_negative_cash": prob_cash_negative,
+            "cash_range": {
+                "p5": csh["p5"],
+                "median": csh["p50"],
+                "p95": csh["p95"]
+            }
+        },
+        "overall_assessment": {
+            "primary_risk": "revenue_volatility" if revenue_cv > stats["cash_cv"] else "cash_liquidity"
+        }
+    }, {}
+
+
+_ANSWER_HANDLERS = {
+    "revenue": _answer_revenue,
+    "cash": _answer_cash,
+    "margin": _answer_margin,
+}
+
+
+def _period_from_question(question_lower: str):
+    """(num_periods, period_type) named in the question text, or (None, None)."""
+    for pattern, ptype in PERIOD_PATTERNS:
+        match = pattern.search(question_lower)
+        if match:
+            return int(match.group(1)), ptype
+    return None, None
+
+
+def _period_from_parameters(parameters: Dict):
+    """(num_periods, period_type) from a parsed "time_period" parameter, or (None, None)."""
+    if "time_period" not in parameters:
+        return None, None
+    time_period = str(parameters["time_period"]).lower()
+    num_match = _NUMBER_RE.search(time_period)
+    if not num_match:
+        return None, None
+    period_type = None
+    if "quarter" in time_period:
+        period_type = "quarters"
+    elif "month" in time_period:
+        period_type = "months"
+    elif "year" in time_period:
+        period_type = "years"
+    return int(num_match.group(1)), period_type
+
+
+# Each question draws from its own generator, seeded from a child of RNG's
+# SeedSequence, so concurrent questions (answer_questions_async) never share
+# draws. Spawning children mutates the parent sequence, hence the lock.
+_SEED_LOCK = threading.Lock()
+
+
+def _question_seed() -> np.random.SeedSequence:
+    with _SEED_LOCK:
+        return RNG.bit_generator.seed_seq.spawn(1)[0]
+
+
+def _simulate(num_periods, seed: np.random.SeedSequence):
+    """
+    Distributions over the last num_periods (all when None) and one simulation
+    run, plus the question's generator positioned after it. The same seed
+    redoes the run with the same draws.
+    """
+    base, dists = load_base_and_distributions(CSV_PATH, num_periods)
+    rng = np.random.default_rng(seed)
+    return base, dists, run_monte_carlo_simulations(base, dists, rng=rng), rng
+
 
 async def answer_question_async(question: str, client: BackboardClient, nlp_assistant_id: str, interpreter_assistant_id: str, generate_plot: bool = False, generate_fan_charts: bool = False) -> Dict:
     """
@@ -49,62 +330,44 @@ async def answer_question_async(question: str, client: BackboardClient, nlp_assi
     3. Collecting all simulation facts
     4. Generating human-readable explanation using LLM interpreter (llm_interpreter.py)
     """
-    # Step 1: Parse question using NLP pipeline (rule-based + API fallback)
-    nlp_result = await parse_question_with_fallback(question, client, nlp_assistant_id)
+    question_lower = question.lower()
+    question_hits = set(_ROUTING_KEYWORDS_RE.findall(question_lower))
+
+    # Step 1: Parse question using NLP pipeline (rule-based + API fallback),
+    # simulating over the period named in the question while the parse is in
+    # flight. The simulation only needs the period, not the parse.
+    hinted_periods, hinted_type = _period_from_question(question_lower)
+    seed = _question_seed()
+    nlp_result, (base, dists, sim_data, rng) = await asyncio.gather(
+        parse_question_with_fallback(question, client, nlp_assistant_id),
+        asyncio.to_thread(_simulate, hinted_periods, seed),
+    )
 
     # Step 2: Extract time period from question and NLP parsing (dynamic extraction)
-    num_periods = None
-    period_type = None
-    question_lower = question.lower()
+    num_periods, period_type = hinted_periods, hinted_type
     parameters = nlp_result.get("parameters", {}) or nlp_result.get("nlp_analysis", {}).get("api_parameters", {})
 
-    period_patterns = [
-        (r'(\d+)\s*(?:quarters?|q)', 'quarters'),
-        (r'(\d+)\s*(?:months?|m)', 'months'),
-        (r'(\d+)\s*(?:years?|y)', 'years'),
-        (r'last\s+(\d+)', 'quarters'),
-        (r'(\d+)\s*(?:periods?|period)', 'periods')
-    ]
-
-    for pattern, ptype in period_patterns:
-        match = re.search(pattern, question_lower)
-        if match:
-            num_periods = int(match.group(1))
-            period_type = ptype
-            break
-
     if num_periods is None:
-        if "time_period" in parameters:
-            time_period = str(parameters["time_period"]).lower()
-            num_match = re.search(r'(\d+)', time_period)
-            if num_match:
-                num_periods = int(num_match.group(1))
-                if "quarter" in time_period:
-                    period_type = "quarters"
-                elif "month" in time_period:
-                    period_type = "months"
-                elif "year" in time_period:
-                    period_type = "years"
+        num_periods, period_type = _period_from_parameters(parameters)
+        if num_periods is not None:
+            # Parse named a period the question text didn't: redo the run from
+            # the question's seed, off the event loop like the first run.
+            base, dists, sim_data, rng = await asyncio.to_thread(_simulate, num_periods, seed)
 
     # Step 3: Load financial data and filter by requested time period if specified
-    df_full = load_financials(CSV_PATH)
+    # df is the shared cached frame (or a tail view of it): read it, never write to it
+    df_full = load_financials_cached(CSV_PATH)
+    df = df_full.tail(num_periods) if num_periods is not None else df_full
+    periods_used = df["period"].tolist() if "period" in df.columns else [f"Period {i+1}" for i in range(len(df))]
 
     if num_periods is not None:
-        df = df_full.tail(num_periods).copy()
-        periods_used = df["period"].tolist() if "period" in df.columns else [f"Period {i+1}" for i in range(len(df))]
         note = f"Analysis based on last {num_periods} {period_type or 'periods'}: {', '.join(periods_used)}"
     else:
-        df = df_full.copy()
-        periods_used = df["period"].tolist() if "period" in df.columns else [f"Period {i+1}" for i in range(len(df))]
         note = f"Analysis based on all available data: {len(df)} periods"
 
     statement_chunks = load_statement_chunks()
     data_quality = load_data_quality()
 
-    base = derive_historical_metrics(df)
-    dists = build_distributions(base)
-    sim_data = run_monte_carlo_simulations(base, dists)
-
     # Compute ratio dashboard
     ratio_dashboard = compute_ratios(base, sim_data, df)
 
@@ -130,155 +393,38 @@ async def answer_question_async(question: str, client: BackboardClient, nlp_assi
     operating_margin = sim_data["operating_margin"]
     cash_flow = sim_data["cash_flow"]
 
-    computed_metrics = {}
-    computed_answer = {}
-
-    revenue_cv = float(np.std(revenue) / np.mean(revenue)) if np.mean(revenue) > 0 else 0
-    cash_cv = float(np.std(cash) / np.abs(np.mean(cash))) if np.mean(cash) != 0 else 0
-    prob_cash_negative = float(np.mean(cash < 0))
-    prob_revenue_decline = float(np.mean(revenue < base["revenue"]))
-
-    historical_revenues = df["revenue_total"].values if len(df) > 1 else [base["revenue"]]
-    historical_cv = float(np.std(historical_revenues) / np.mean(historical_revenues)) if len(historical_revenues) > 1 and np.mean(historical_revenues) > 0 else 0.0
-
-    if "revenue" in metric or "revenue" in intent:
-        if "below" in question.lower() or "falls" in question.lower() or "drops" in question.lower():
-            threshold = parameters.get("threshold")
-            if threshold is None:
-                threshold = base["revenue"]
-            prob = float(np.mean(revenue < threshold))
-            computed_answer = {
-                "probability": prob,
-                "percentage": prob * 100,
-                "threshold": threshold,
-                "interpretation": "high" if prob > 0.3 else "medium" if prob > 0.1 else "low"
-            }
-            computed_metrics = {
-                "p5_revenue": float(np.percentile(revenue, 5)),
-                "p10_revenue": float(np.percentile(revenue, 10)),
-                "median_revenue": float(np.median(revenue)),
-                "p90_revenue": float(np.percentile(revenue, 90)),
-                "p95_revenue": float(np.percentile(revenue, 95))
-            }
-        elif "risk" in question.lower() or "volatile" in question.lower() or "volatility" in question.lower():
-            computed_answer = {
-                "coefficient_of_variation": revenue_cv,
-                "volatility_level": "high" if revenue_cv > 0.2 else "medium" if revenue_cv > 0.1 else "low",
-                "probability_decline": prob_revenue_decline,
-                "risk_level": "high" if revenue_cv > 0.25 else "medium" if revenue_cv > 0.15 else "low",
-                "historical_volatility": historical_cv,
-                "periods_compared": len(df)
-            }
-        elif "range" in question.lower() or "expected" in question.lower():
-            computed_answer = {
-                "p10_revenue": float(np.percentile(revenue, 10)),
-                "p90_revenue": float(np.percentile(revenue, 90)),
-                "median_revenue": float(np.median(revenue)),
-                "range": float(np.percentile(revenue, 90) - np.percentile(revenue, 10)),
-                "confidence_interval": "80%"
-            }
-        else:
-            computed_answer = {
-                "expected_revenue_range": {
-                    "p10": float(np.percentile(revenue, 10)),
-                    "median": float(np.median(revenue)),
-                    "p90": float(np.percentile(revenue, 90))
-                },
-                "probability_decline": prob_revenue_decline,
-                "volatility": revenue_cv,
-                "risk_level": "high" if revenue_cv > 0.25 else "medium" if revenue_cv > 0.15 else "low"
-            }
-
-    elif "cash" in metric or "cash" in intent or "liquidity" in metric:
-        if "below" in question.lower() or "drops" in question.lower():
-            threshold = parameters.get("threshold")
-            if threshold is None:
-                threshold = base.get("min_cash_buffer_for_hiring", base["cash"] * 0.5)
-            prob = float(np.mean(cash < threshold))
-            computed_answer = {
-                "probability": prob,
-                "threshold": threshold,
-                "p5_cash": float(np.percentile(cash, 5)),
-                "median_cash": float(np.median(cash))
-            }
-        elif "runway" in question.lower():
-            monthly_burn = -np.mean(cash_flow[cash_flow < 0]) if np.any(cash_flow < 0) else base["cash"] / 12
-            if monthly_burn > 0:
-                runway_p5 = float(np.percentile(cash, 5)) / monthly_burn
-                runway_median = float(np.median(cash)) / monthly_burn
-            else:
-                runway_p5 = float("inf")
-                runway_median = float("inf")
-            computed_answer = {
-                "runway_months_p5": runway_p5,
-                "runway_months_median": runway_median,
-                "monthly_burn_rate": monthly_burn
-            }
-        else:
-            computed_answer = {
-                "probability_negative_cash": prob_cash_negative,
-                "probability_low_liquidity": float(np.mean(cash < base["cash"] * 0.3)),
-                "risk_level": "high" if prob_cash_negative > 0.15 else "medium" if prob_cash_negative > 0.05 else "low",
-                "p5_cash": float(np.percentile(cash, 5)),
-                "median_cash": float(np.median(cash))
-            }
-
-    elif "margin" in metric or "profitability" in metric or "margin" in intent:
-        if "gross" in question.lower():
-            threshold = parameters.get("threshold", 30)
-            prob = float(np.mean(gross_margin < threshold))
-            computed_answer = {
-                "probability": prob,
-                "threshold": threshold,
-                "p5_gross_margin": float(np.percentile(gross_margin, 5)),
-                "median_gross_margin": float(np.median(gross_margin))
-            }
-        elif "worst" in question.lower() or "worst-case" in question.lower():
-            computed_answer = {
-                "worst_case_5th_percentile": float(np.percentile(operating_margin, 5)),
-                "worst_case_1st_percentile": float(np.percentile(operating_margin, 1)),
-                "median": float(np.median(operating_margin))
-            }
-        else:
-            computed_answer = {
-                "gross_margin": {
-                    "p5": float(np.percentile(gross_margin, 5)),
-                    "median": float(np.median(gross_margin))
-                },
-                "operating_margin": {
-                    "p5": float(np.percentile(operating_margin, 5)),
-                    "median": float(np.median(operating_margin))
-                }
-            }
-
-    else:
-        revenue_risk_level = "HIGH" if revenue_cv > 0.25 else "MEDIUM" if revenue_cv > 0.15 else "LOW"
-        cash_risk_level = "HIGH" if prob_cash_negative > 0.15 else "MEDIUM" if prob_cash_negative > 0.05 else "LOW"
-
-        computed_answer = {
-            "revenue_risk_assessment": {
-                "risk_level": revenue_risk_level,
-                "coefficient_of_variation": revenue_cv,
-                "probability_decline": prob_revenue_decline,
-                "expected_revenue_range": {
-                    "p10": float(np.percentile(revenue, 10)),
-                    "median": float(np.median(revenue)),
-                    "p90": float(np.percentile(revenue, 90))
-                }
-            },
-            "cash_risk_assessment": {
-                "risk_level": cash_risk_level,
-                "probability_negative_cash": prob_cash_negative,
-                "cash_range": {
-                    "p5": float(np.percentile(cash, 5)),
-                    "median": float(np.median(cash)),
-                    "p95": float(np.percentile(cash, 95))
-                }
-            },
-            "overall_assessment": {
-                "primary_risk": "revenue_volatility" if revenue_cv > cash_cv else "cash_liquidity"
-            }
-        }
+    # One sort + mean/std per series; every branch below reads from these
+    rev = _series_summary(revenue)
+    csh = _series_summary(cash)
+    gm = _series_summary(gross_margin)
+    om = _series_summary(operating_margin)
+
+    revenue_cv = float(rev["std"] / rev["mean"]) if rev["mean"] > 0 else 0
+    cash_cv = float(csh["std"] / np.abs(csh["mean"])) if csh["mean"] != 0 else 0
+    prob_cash_negative = sorted_prob_below(csh["sorted"], 0)
+    prob_revenue_decline = sorted_prob_below(rev["sorted"], base["revenue"])
+
+    historical_cv = 0.0
+    if len(df) > 1:
+        historical_revenues = df["revenue_total"].to_numpy(dtype=np.float64)
+        historical_mean = historical_revenues.mean()
+        if historical_mean > 0:
+            historical_cv = float(historical_revenues.std() / historical_mean)
+
+    stats = {
+        "rev": rev, "csh": csh, "gm": gm, "om": om,
+        "cash_flow": cash_flow,
+        "revenue_cv": revenue_cv,
+        "cash_cv": cash_cv,
+        "prob_cash_negative": prob_cash_negative,
+        "prob_revenue_decline": prob_revenue_decline,
+        "historical_cv": historical_cv,
+        "periods": len(df),
+    }
+    answer_topic = _answer_topic(metric, intent)
+    computed_answer, computed_metrics = _ANSWER_HANDLERS.get(answer_topic, _answer_general)(
+        stats, question_hits, parameters, base
+    )
 
     # Step 5: Prepare Monte Carlo facts for LLM interpreter
     mc_facts = {
@@ -306,49 +452,19 @@ async def answer_question_async(question: str, client: BackboardClient, nlp_assi
         },
         "computed_results": computed_answer,
         "statistics": {
-            "revenue": {
-                "mean": float(np.mean(revenue)),
-                "median": float(np.median(revenue)),
-                "std": float(np.std(revenue)),
-                "p5": float(np.percentile(revenue, 5)),
-                "p10": float(np.percentile(revenue, 10)),
-                "p50": float(np.median(revenue)),
-                "p90": float(np.percentile(revenue, 90)),
-                "p95": float(np.percentile(revenue, 95)),
-                "min": float(np.min(revenue)),
-                "max": float(np.max(revenue)),
-                "coefficient_of_variation": revenue_cv,
-                "probability_decline": prob_revenue_decline,
-                "historical_volatility": historical_cv
-            },
-            "cash": {
-                "mean": float(np.mean(cash)),
-                "median": float(np.median(cash)),
-                "std": float(np.std(cash)),
-                "p5": float(np.percentile(cash, 5)),
-                "p10": float(np.percentile(cash, 10)),
-                "p50": float(np.median(cash)),
-                "p90": float(np.percentile(cash, 90)),
-                "p95": float(np.percentile(cash, 95)),
-                "min": float(np.min(cash)),
-                "max": float(np.max(cash)),
-                "probability_negative": prob_cash_negative,
-                "coefficient_of_variation": cash_cv
-            },
-            "gross_margin": {
-                "mean": float(np.mean(gross_margin)),
-                "median": float(np.median(gross_margin)),
-                "std": float(np.std(gross_margin)),
-                "p5": float(np.percentile(gross_margin, 5)),
-                "p95": float(np.percentile(gross_margin, 95))
-            },
-            "operating_margin": {
-                "mean": float(np.mean(operating_margin)),
-                "median": float(np.median(operating_margin)),
-                "std": float(np.std(operating_margin)),
-                "p5": float(np.percentile(operating_margin, 5)),
-                "p95": float(np.percentile(operating_margin, 95))
-            }
+            "revenue": _stats_block(
+                rev,
+                coefficient_of_variation=revenue_cv,
+                probability_decline=prob_revenue_decline,
+                historical_volatility=historical_cv
+            ),
+            "cash": _stats_block(
+                csh,
+                probability_negative=prob_cash_negative,
+                coefficient_of_variation=cash_cv
+            ),
+            "gross_margin": _stats_block(gm, MARGIN_STATS_KEYS),
+            "operating_margin": _stats_block(om, MARGIN_STATS_KEYS)
         },
         "metrics": computed_metrics,
         "data_used": {
@@ -359,6 +475,13 @@ async def answer_question_async(question: str, client: BackboardClient, nlp_assi
         }
     }
 
+    if not generate_plot:
+        # Only the summaries above are reported from here on: release the
+        # per-path arrays before waiting on the interpreter
+        del sim_data, revenue, cash, gross_margin, operating_margin, cash_flow, stats
+        for summary in (rev, csh, gm, om):
+            del summary["sorted"]
+
     # Step 6: Generate human-readable explanation using LLM interpreter
     llm_explanation = await interpret_mc_results(question, mc_facts, client, interpreter_assistant_id)
 
@@ -411,14 +534,14 @@ async def answer_question_async(question: str, client: BackboardClient, nlp_assi
     # Store plot metadata
     plot_metadata = None
     if generate_plot:
-        if "revenue" in metric or "revenue" in intent:
+        if answer_topic == "revenue":
             comprehensive_response["plot_generation"] = {
                 "status": "will_generate",
                 "file": "revenue_distribution.png",
                 "type": "revenue_distribution"
             }
             plot_metadata = {"type": "revenue", "sim_data": sim_data}
-        elif "cash" in metric or "cash" in intent or "liquidity" in metric:
+        elif answer_topic == "cash":
             comprehensive_response["plot_generation"] = {
                 "status": "will_generate",
                 "file": "cash_distribution.png",
@@ -428,26 +551,27 @@ async def answer_question_async(question: str, client: BackboardClient, nlp_assi
         else:
             results_for_plot = {
                 "starting_cash": base["cash"],
-                "median_ending_cash": float(np.median(cash)),
-                "p5_ending_cash": float(np.percentile(cash, 5)),
-                "p10_ending_cash": float(np.percentile(cash, 10)),
-                "p90_ending_cash": float(np.percentile(cash, 90)),
-                "p95_ending_cash": float(np.percentile(cash, 95)),
-                "probability_cash_negative": float(np.mean(cash < 0))
+                "median_ending_cash": csh["p50"],
+                "p5_ending_cash": csh["p5"],
+                "p10_ending_cash": csh["p10"],
+                "p90_ending_cash": csh["p90"],
+                "p95_ending_cash": csh["p95"],
+                "probability_cash_negative": prob_cash_negative
             }
             comprehensive_response["plot_generation"] = {
                 "status": "will_generate",
                 "file": "monte_carlo_bell_curve.png",
                 "type": "comprehensive_bell_curve"
             }
-            plot_metadata = {"type": "bell_curve", "results_for_plot": results_for_plot, "cash": cash}
+            plot_metadata = {"type": "bell_curve", "results_for_plot": results_for_plot, "cash": cash,
+                             "stats": {key: csh[key] for key in ("mean", "std", "min", "max")}}
     else:
         comprehensive_response["plot_generation"] = {"status": "skipped", "reason": "generate_plot=False"}
 
     fan_chart_files = []
     if generate_fan_charts and len(df) >= 1:
         try:
-            multi_periods = run_multi_period_simulations(base, dists, num_periods=8, num_sims=2000)
+            multi_periods = run_multi_period_simulations(base, dists, num_periods=8, num_sims=2000, rng=rng)
             for metric_name in ["revenue", "cash"]:
                 fan_file = plot_fan_chart(multi_periods, metric=metric_name)
                 fan_chart_files.append(fan_file)
@@ -498,9 +622,7 @@ def answer_sensitivity_analysis(num_sims: int = None) -> Dict:
     Run sensitivity analysis synchronously.
     Returns tornado data + base64-encoded plots for each metric.
     """
-    df = load_financials(CSV_PATH)
-    base = derive_historical_metrics(df)
-    dists = build_distributions(base)
+    base, dists = load_base_and_distributions(CSV_PATH)
     result = run_sensitivity(base, dists, num_sims)
 
     plots = {}
@@ -525,20 +647,101 @@ def answer_what_if(base_metrics: dict, overrides: dict, num_sims: int = None) ->
     return result
 
 
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Event loop for the synchronous entry points; uvloop when it's installed."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+# Event loop, client and assistant ids shared by every answer_question call in
+# this process. The client's connection pool is bound to the loop it first ran
+# on, so the loop is kept alive with it; the lock serializes callers.
+_SESSION_LOCK = threading.Lock()
+_SESSION: Dict = {}
+
+
+def _get_session() -> Dict:
+    if not _SESSION:
+        loop = new_event_loop()
+        asyncio.set_event_loop(loop)
+        client = BackboardClient(api_key=API_KEY)
+        try:
+            interpreter_assistant_id = loop.run_until_complete(get_or_create_interpreter_assistant(client))
+            # Open the interpreter's thread alongside the NLP assistant lookup
+            nlp_assistant_id, _ = loop.run_until_complete(asyncio.gather(
+                get_or_create_assistant(client),
+                prefetch_threads(client, interpreter_assistant_id)
+            ))
+        except BaseException:
+            loop.close()
+            raise
+        _SESSION.update(
+            loop=loop,
+            client=client,
+            nlp_assistant_id=nlp_assistant_id,
+            interpreter_assistant_id=interpreter_assistant_id,
+        )
+    return _SESSION
+
+
 def answer_question(question: str, generate_plot: bool = False, generate_fan_charts: bool = False) -> Dict:
     """
     Synchronous wrapper for answer_question_async.
     """
     if not API_KEY:
         raise ValueError("BACKBOARD_API_KEY not set in environment")
-    client = BackboardClient(api_key=API_KEY)
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        nlp_assistant_id = loop.run_until_complete(get_or_create_assistant(client))
-        interpreter_assistant_id = loop.run_until_complete(get_or_create_interpreter_assistant(client))
-        result = loop.run_until_complete(answer_question_async(question, client, nlp_assistant_id, interpreter_assistant_id, generate_plot, generate_fan_charts))
-        return result
-    finally:
-        loop.close()
+
+    with _SESSION_LOCK:
+        session = _get_session()
+        loop = session["loop"]
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(answer_question_async(
+            question,
+            session["client"],
+            session["nlp_assistant_id"],
+            session["interpreter_assistant_id"],
+            generate_plot,
+            generate_fan_charts
+        ))
+
+
+async def answer_questions_async(
+    questions: List[str],
+    client: BackboardClient,
+    nlp_assistant_id: str,
+    interpreter_assistant_id: str,
+    max_concurrency: int = MAX_CONCURRENT_INTERPRETATIONS
+) -> List:
+    """
+    Answer several questions concurrently (at most max_concurrency in flight),
+    so their NLP and interpreter round-trips overlap. Results keep the input
+    order; a question that fails yields its exception instead of a response.
+    No plots are generated: every question would write the same files.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def one(question: str) -> Dict:
+        async with semaphore:
+            return await answer_question_async(question, client, nlp_assistant_id, interpreter_assistant_id)
+
+    return await asyncio.gather(*(one(q) for q in questions), return_exceptions=True)
+
+
+def answer_questions(questions: List[str]) -> List:
+    """
+    Synchronous wrapper for answer_questions_async, on the shared session.
+    """
+    if not API_KEY:
+        raise ValueError("BACKBOARD_API_KEY not set in environment")
+
+    with _SESSION_LOCK:
+        session = _get_session()
+        loop = session["loop"]
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(answer_questions_async(
+            questions,
+            session["client"],
+            session["nlp_assistant_id"],
+            session["interpreter_assistant_id"]
+        ))
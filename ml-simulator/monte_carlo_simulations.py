@@ -7,12 +7,11 @@ distribution building, and visualization functions.
 
 import os
 import json
+from collections.abc import Sequence
+from functools import lru_cache
 import pandas as pd
 import numpy as np
-from scipy.stats import truncnorm, lognorm
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+from scipy.special import ndtr, ndtri
 from typing import Dict, List, Tuple, Optional
 
 # =====================================================
@@ -21,8 +20,12 @@ from typing import Dict, List, Tuple, Optional
 
 CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data-scripts", "output", "monte_carlo_final_data.csv")
 OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Charts are viewed on screen; 150 dpi rasterises a quarter of the pixels of
+# print-quality 300 and halves the time spent in savefig.
+PLOT_DPI = 150
 NUM_SIMULATIONS = 10000
-np.random.seed(42)
+# Seeded generator (PCG64) for simulation draws when no rng is passed in
+RNG = np.random.default_rng(42)
 
 # =====================================================
 # META-DATA LOADERS
@@ -60,12 +63,72 @@ def safe_float(value):
         return None
 
 
-def truncated_normal(mean, std, min_val, max_val, size=1):
-    """Generate samples from a truncated normal distribution."""
+def safe_float_column(values: pd.Series) -> pd.Series:
+    """safe_float over a whole column, vectorised: unparseable cells become NaN."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(np.float64)
+    cleaned = values.astype(str).str.replace(",", "", regex=False).str.strip()
+    return pd.to_numeric(cleaned, errors="coerce")
+
+
+# Smallest share of the normal's mass inside [min_val, max_val] for which
+# truncated_normal samples by rejection; narrower or tail intervals would
+# redraw too often, so they use the inverse CDF instead.
+REJECTION_MIN_ACCEPTANCE = 0.5
+
+
+def truncated_normal(mean, std, min_val, max_val, size=1, rng=None):
+    """Generate samples from a truncated normal distribution (drawn from rng, default RNG)."""
+    if rng is None:
+        rng = RNG
     if std <= 0 or np.isclose(min_val, max_val):
         return np.full(size, mean)
     a, b = (min_val - mean) / std, (max_val - mean) / std
-    return truncnorm.rvs(a, b, loc=mean, scale=std, size=size)
+    if ndtr(b) - ndtr(a) >= REJECTION_MIN_ACCEPTANCE:
+        # Plain normal draws, redrawing only those outside the bounds; at the
+        # ±3σ bounds build_distributions sets, that is ~0.3% of them once.
+        out = rng.normal(mean, std, size)
+        flat = out.reshape(-1)
+        redraw = np.flatnonzero((flat < min_val) | (flat > max_val))
+        while redraw.size:
+            flat[redraw] = rng.normal(mean, std, redraw.size)
+            redraw = redraw[(flat[redraw] < min_val) | (flat[redraw] > max_val)]
+        return out
+    # Inverse-CDF draw; mirror intervals in the upper tail so ndtr stays
+    # away from 1.0 where it loses precision.
+    flip = a > 0
+    if flip:
+        a, b = -b, -a
+    z = ndtri(rng.uniform(ndtr(a), ndtr(b), size=size))
+    if flip:
+        z = -z
+    return np.clip(mean + std * z, min_val, max_val)
+
+
+def lognormal_ratio(mean, std, size=None, rng=None):
+    """Lognormal draw(s) with scale=mean and shape std/mean (scipy lognorm)."""
+    return (RNG if rng is None else rng).lognormal(np.log(mean), std / max(mean, 0.001), size)
+
+def sorted_percentiles(sorted_values: np.ndarray, percentiles) -> List[float]:
+    """
+    np.percentile (linear method) of an already-sorted array, read off by
+    index instead of re-partitioning the data on every call. Uses numpy's own
+    interpolation, so results match np.percentile exactly.
+    """
+    last = sorted_values.size - 1
+    virtual = last * (np.asarray(percentiles, dtype=float) / 100)
+    lower = np.floor(virtual)
+    gamma = virtual - lower
+    lower = np.minimum(lower.astype(np.intp), last)
+    a, b = sorted_values[lower], sorted_values[np.minimum(lower + 1, last)]
+    diff = b - a
+    # tolist() converts to Python floats in one call rather than float() per value
+    return np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma).tolist()
+
+
+def sorted_prob_below(sorted_values: np.ndarray, threshold) -> float:
+    """Share of an already-sorted array strictly below threshold (binary search)."""
+    return float(np.searchsorted(sorted_values, threshold, side="left") / sorted_values.size)
 
 # =====================================================
 # DATA LOADING
@@ -97,35 +160,51 @@ def load_financials(csv_path):
     ]
 
     for c in cols:
-        df[c] = df[c].apply(safe_float)
+        df[c] = safe_float_column(df[c])
 
     return df.dropna(subset=["revenue_total"])
 
+
+def _csv_cache_key(csv_path):
+    stat = os.stat(csv_path)
+    return os.path.abspath(csv_path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=4)
+def _load_financials_cached(csv_path, mtime_ns, size):
+    return load_financials(csv_path)
+
+
+def load_financials_cached(csv_path=None):
+    """
+    load_financials, memoised on the file's mtime and size. The frame is
+    shared between callers: copy it before modifying.
+    """
+    return _load_financials_cached(*_csv_cache_key(csv_path or CSV_PATH))
+
 # =====================================================
 # HISTORICAL METRICS DERIVATION
 # =====================================================
 
 def derive_historical_metrics(df):
     """Derive historical metrics from financial data."""
-    # Latest valid cash row
-    cash_valid = df[df["cash_end_period"] > 0]
-    if len(cash_valid) == 0:
+    # Latest valid cash row, found by scanning the mask backwards (no filtered copy of df)
+    cash_valid = df["cash_end_period"].to_numpy() > 0
+    if not cash_valid.any():
         raise ValueError("No valid non-zero cash rows found")
 
-    latest = cash_valid.iloc[-1]
+    latest = df.iloc[len(cash_valid) - 1 - int(np.argmax(cash_valid[::-1]))]
 
     # SAFE employee handling
     raw_emp = latest["employee_count"]
     employee_count = int(raw_emp) if raw_emp and raw_emp > 0 else None
 
-    revenues = df["revenue_total"].values
+    revenues = df["revenue_total"].to_numpy(dtype=np.float64)
 
-    # Quarterly → annualized revenue growth
-    revenue_growths = []
-    for i in range(1, len(revenues)):
-        if revenues[i-1] > 0:
-            q_growth = (revenues[i] - revenues[i-1]) / revenues[i-1]
-            revenue_growths.append(q_growth * 4)
+    # Quarterly → annualized revenue growth, for periods following positive revenue
+    prev, cur = revenues[:-1], revenues[1:]
+    grew_from = prev > 0
+    revenue_growths = (cur[grew_from] - prev[grew_from]) / prev[grew_from] * 4
 
     gross_margins = df["gross_profit"] / df["revenue_total"]
     opex_ratios = df["operating_expenses_total"] / df["revenue_total"]
@@ -136,7 +215,7 @@ def derive_historical_metrics(df):
     capex_ratios = (df["capital_expenditure"].abs() / df["revenue_total"]).dropna()
 
     # Handle single-period data gracefully
-    if len(revenue_growths) == 0:
+    if revenue_growths.size == 0:
         revenue_growth_mean = 0.0
         revenue_growth_std = 0.08
         revenue_growth_min = -0.15
@@ -249,26 +328,60 @@ def build_distributions(base):
         }
     }
 
+@lru_cache(maxsize=16)
+def _load_base_and_distributions(csv_key, num_periods):
+    df = _load_financials_cached(*csv_key)
+    if num_periods is not None:
+        df = df.tail(num_periods)
+    base = derive_historical_metrics(df)
+    return base, build_distributions(base)
+
+
+def load_base_and_distributions(csv_path=None, num_periods=None):
+    """
+    derive_historical_metrics + build_distributions for a CSV (optionally its
+    last num_periods rows), memoised on the file's mtime and size so the CSV
+    is only re-read when it changes. Returns fresh copies, since callers
+    adjust base/dists in place.
+    """
+    base, dists = _load_base_and_distributions(_csv_cache_key(csv_path or CSV_PATH), num_periods)
+    return dict(base), {name: dict(dist) for name, dist in dists.items()}
+
 # =====================================================
-# SINGLE SIMULATION
+# SIMULATION KERNEL
 # =====================================================
 
-def run_simulation(base, dists):
-    """Run a single Monte Carlo simulation."""
-    revenue = base["revenue"]
+# Per-path output series, in the order run_simulation reports them
+SIM_SERIES = (
+    "cash", "revenue", "hired", "gross_margin", "operating_margin", "ebitda",
+    "cash_flow", "revenue_growth", "opex", "capex", "cfo",
+    "current_ratio", "debt_to_equity", "roe", "roa",
+)
+
+
+def _pct_of_revenue(values: np.ndarray, revenue: np.ndarray) -> np.ndarray:
+    """values / revenue * 100, and 0 where revenue is not positive."""
+    ratio = np.divide(values, revenue, out=np.zeros_like(revenue, dtype=float), where=revenue > 0)
+    return ratio * 100
+
+
+def simulate_paths(base, dists, num_sims: int, rng=None) -> Dict[str, np.ndarray]:
+    """
+    num_sims independent one-period paths at once: every distribution is drawn
+    as a vector and the model below is applied elementwise. Returns one array
+    per SIM_SERIES entry. Draws come from rng (default RNG).
+    """
     cash = base["cash"]
     employees = base["employee_count"]
-    hired = False
 
     # --- Revenue (floored at 0) ---
-    g = truncated_normal(**dists["revenue_growth"])[0]
-    revenue *= (1 + g)
-    revenue = max(revenue, 0)
+    g = truncated_normal(**dists["revenue_growth"], size=num_sims, rng=rng)
+    revenue = np.maximum(base["revenue"] * (1 + g), 0)
 
     # --- Operations ---
-    margin = truncated_normal(**dists["gross_margin"])[0]
-    opex_ratio = truncated_normal(**dists["opex_ratio"])[0]
-    cash_conv = truncated_normal(**dists["cash_conversion"])[0]
+    margin = truncated_normal(**dists["gross_margin"], size=num_sims, rng=rng)
+    opex_ratio = truncated_normal(**dists["opex_ratio"], size=num_sims, rng=rng)
+    cash_conv = truncated_normal(**dists["cash_conversion"], size=num_sims, rng=rng)
 
     gross_profit = revenue * margin
     opex = revenue * opex_ratio
@@ -276,107 +389,101 @@ def run_simulation(base, dists):
     cfo = operating_income * cash_conv
 
     # --- CapEx (DATA-DRIVEN CAP) ---
-    capex_ratio = lognorm(
-        s=dists["capex_ratio"]["std"] / max(dists["capex_ratio"]["mean"], 0.001),
-        scale=dists["capex_ratio"]["mean"]
-    ).rvs()
-
-    capex_ratio = min(capex_ratio, base["capex_cap"])
+    capex_ratio = np.minimum(lognormal_ratio(**dists["capex_ratio"], size=num_sims, rng=rng), base["capex_cap"])
     capex = revenue * capex_ratio
 
     # HIRING DECISION — only when employee count is known
-    if employees and base.get("average_annual_salary_cost"):
-        if g > 0.05 and (cash > base["min_cash_buffer_for_hiring"] or cash > 0.1 * revenue):
-            rev_per_emp = revenue / employees
-            if rev_per_emp > base["average_annual_salary_cost"] * 2:
-                hired = True
-                cash -= base["average_annual_salary_cost"] * 0.5  # 6 months upfront cost
-                employees += 1
+    salary = base.get("average_annual_salary_cost")
+    if employees and salary:
+        hired = (
+            (g > 0.05)
+            & ((cash > base["min_cash_buffer_for_hiring"]) | (cash > 0.1 * revenue))
+            & (revenue / employees > salary * 2)
+        )
+        start_cash = np.where(hired, cash - salary * 0.5, cash)  # 6 months upfront cost
+    else:
+        hired = np.zeros(num_sims, dtype=bool)
+        start_cash = cash
 
     # --- Cash update ---
-    cash += cfo - capex
-    
-    # Calculate additional metrics for comprehensive analysis
-    gross_margin_pct = (gross_profit / revenue * 100) if revenue > 0 else 0
-    operating_margin_pct = (operating_income / revenue * 100) if revenue > 0 else 0
-    ebitda = operating_income  # Simplified (no depreciation/amortization in model)
     cash_flow = cfo - capex
+    ending_cash = start_cash + cash_flow
 
     # Balance sheet ratio projections
     ta = base.get("total_assets", 1)
-    tl = base.get("total_liabilities", 0)
     se = base.get("shareholders_equity", 1)
     ni = operating_income * (1 - 0.25)  # rough after-tax
-    current_ratio = base.get("current_ratio", 1) * (1 + g * 0.5)
-    debt_to_equity = base.get("debt_to_equity", 0.5) * (1 + g * 0.1)
-    roe = ni / se if se > 0 else 0
-    roa = ni / ta if ta > 0 else 0
 
     return {
-        "cash": cash,
+        "cash": ending_cash,
         "revenue": revenue,
         "hired": hired,
-        "gross_margin": gross_margin_pct,
-        "operating_margin": operating_margin_pct,
-        "ebitda": ebitda,
+        "gross_margin": _pct_of_revenue(gross_profit, revenue),
+        "operating_margin": _pct_of_revenue(operating_income, revenue),
+        "ebitda": operating_income,  # Simplified (no depreciation/amortization in model)
         "cash_flow": cash_flow,
         "revenue_growth": g,
         "opex": opex,
         "capex": capex,
         "cfo": cfo,
-        "current_ratio": current_ratio,
-        "debt_to_equity": debt_to_equity,
-        "roe": roe,
-        "roa": roa
+        "current_ratio": base.get("current_ratio", 1) * (1 + g * 0.5),
+        "debt_to_equity": base.get("debt_to_equity", 0.5) * (1 + g * 0.1),
+        "roe": ni / se if se > 0 else np.zeros(num_sims),
+        "roa": ni / ta if ta > 0 else np.zeros(num_sims),
     }
 
+
+class SimulationRecords(Sequence):
+    """
+    Per-path view of simulate_paths output: item i is path i as a dict of
+    SIM_SERIES values, built on access rather than stored for every path.
+    """
+
+    def __init__(self, paths: Dict[str, np.ndarray]):
+        self._paths = paths
+
+    def __len__(self):
+        return len(self._paths["cash"])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return {name: self._paths[name][index].item() for name in SIM_SERIES}
+
+
+def run_simulation(base, dists):
+    """Run a single Monte Carlo simulation."""
+    return {name: values[0].item() for name, values in simulate_paths(base, dists, 1).items()}
+
 # =====================================================
 # MONTE CARLO ENGINE
 # =====================================================
 
-def run_monte_carlo_simulations(base: dict, dists: dict, num_sims: int = None) -> Dict:
-    """Run comprehensive Monte Carlo simulations and return all metrics."""
+def run_monte_carlo_simulations(base: dict, dists: dict, num_sims: int = None, rng=None) -> Dict:
+    """Run comprehensive Monte Carlo simulations and return all metrics (draws from rng, default RNG)."""
     if num_sims is None:
         num_sims = NUM_SIMULATIONS
-    
-    # Optimized: Use list comprehension and direct array conversion
-    simulations = [run_simulation(base, dists) for _ in range(num_sims)]
-    
-    # Convert to arrays for analysis (faster with list comprehension)
-    cash = np.array([s["cash"] for s in simulations])
-    revenue = np.array([s["revenue"] for s in simulations])
-    gross_margin = np.array([s["gross_margin"] for s in simulations])
-    operating_margin = np.array([s["operating_margin"] for s in simulations])
-    ebitda = np.array([s["ebitda"] for s in simulations])
-    cash_flow = np.array([s["cash_flow"] for s in simulations])
-    revenue_growth = np.array([s["revenue_growth"] for s in simulations])
-    opex = np.array([s["opex"] for s in simulations])
-    capex = np.array([s["capex"] for s in simulations])
-    cfo = np.array([s["cfo"] for s in simulations])
-    hired = np.array([s["hired"] for s in simulations])
-    current_ratio = np.array([s["current_ratio"] for s in simulations])
-    debt_to_equity = np.array([s["debt_to_equity"] for s in simulations])
-    roe = np.array([s["roe"] for s in simulations])
-    roa = np.array([s["roa"] for s in simulations])
-    
+
+    paths = simulate_paths(base, dists, num_sims, rng)
+
     return {
         "base": base,
-        "simulations": simulations,
-        "cash": cash,
-        "revenue": revenue,
-        "gross_margin": gross_margin,
-        "operating_margin": operating_margin,
-        "ebitda": ebitda,
-        "cash_flow": cash_flow,
-        "revenue_growth": revenue_growth,
-        "opex": opex,
-        "capex": capex,
-        "cfo": cfo,
-        "hired": hired,
-        "current_ratio": current_ratio,
-        "debt_to_equity": debt_to_equity,
-        "roe": roe,
-        "roa": roa
+        "simulations": SimulationRecords(paths),
+        "cash": paths["cash"],
+        "revenue": paths["revenue"],
+        "gross_margin": paths["gross_margin"],
+        "operating_margin": paths["operating_margin"],
+        "ebitda": paths["ebitda"],
+        "cash_flow": paths["cash_flow"],
+        "revenue_growth": paths["revenue_growth"],
+        "opex": paths["opex"],
+        "capex": paths["capex"],
+        "cfo": paths["cfo"],
+        "hired": paths["hired"],
+        "current_ratio": paths["current_ratio"],
+        "debt_to_equity": paths["debt_to_equity"],
+        "roe": paths["roe"],
+        "roa": paths["roa"]
     }
 
 
@@ -394,19 +501,22 @@ def run_engine(return_cash_array=False):
     statement_chunks = load_statement_chunks()
     data_quality = load_data_quality()
 
+    # One partition pass for all tail percentiles instead of one per call
+    cash_p5, cash_p10, cash_p90, cash_p95 = np.percentile(cash, [5, 10, 90, 95])
+
     results = {
         "statement_chunks": statement_chunks,
         "data_quality": data_quality,
         "starting_cash": base["cash"],
         "starting_revenue": base["revenue"],
         "median_ending_cash": float(np.median(cash)),
-        "p5_ending_cash": float(np.percentile(cash, 5)),
-        "p10_ending_cash": float(np.percentile(cash, 10)),
-        "p90_ending_cash": float(np.percentile(cash, 90)),
-        "p95_ending_cash": float(np.percentile(cash, 95)),
-        "probability_cash_negative": float(np.mean(cash < 0)),
+        "p5_ending_cash": float(cash_p5),
+        "p10_ending_cash": float(cash_p10),
+        "p90_ending_cash": float(cash_p90),
+        "p95_ending_cash": float(cash_p95),
+        "probability_cash_negative": float(np.count_nonzero(cash < 0) / cash.size),
         "expected_revenue_growth": float((np.mean(revenue) - base["revenue"]) / base["revenue"]),
-        "probability_should_hire": float(np.mean(hire_results)),
+        "probability_should_hire": float(np.count_nonzero(hire_results) / hire_results.size),
         "capex_cap_used": base["capex_cap"],
         "hiring_parameters": {
             "revenue_growth_threshold": "> 5% (0.05)",
@@ -425,70 +535,80 @@ def run_engine(return_cash_array=False):
 # MULTI-PERIOD SIMULATION (for fan charts)
 # =====================================================
 
-def run_simulation_multi_period(base: dict, dists: dict, num_periods: int) -> dict:
-    periods = {
-        "revenue": [],
-        "cash": [],
-        "gross_margin_pct": [],
-        "operating_margin_pct": [],
-        "cash_flow": [],
-        "revenue_growth": [],
-    }
-    revenue = base["revenue"]
-    cash = base["cash"]
-    employees = base["employee_count"]
-    for _ in range(num_periods):
-        g = truncated_normal(**dists["revenue_growth"])[0]
-        revenue *= (1 + g)
-        revenue = max(revenue, 0)
-        margin = truncated_normal(**dists["gross_margin"])[0]
-        opex_ratio = truncated_normal(**dists["opex_ratio"])[0]
-        cash_conv = truncated_normal(**dists["cash_conversion"])[0]
+MULTI_PERIOD_SERIES = ("revenue", "cash", "gross_margin_pct", "operating_margin_pct", "cash_flow", "revenue_growth")
+
+
+def simulate_multi_period_paths(base: dict, dists: dict, num_periods: int, num_sims: int, rng=None) -> Dict[str, np.ndarray]:
+    """
+    num_sims multi-period paths at once, stepped period by period: each
+    period draws every distribution as a num_sims vector. Returns one
+    (num_sims, num_periods) array per MULTI_PERIOD_SERIES entry. Draws come
+    from rng (default RNG).
+    """
+    periods = {name: np.empty((num_sims, num_periods)) for name in MULTI_PERIOD_SERIES}
+    revenue = np.full(num_sims, float(base["revenue"]))
+    cash = np.full(num_sims, float(base["cash"]))
+    employees = np.full(num_sims, base["employee_count"] or 0)
+    # Loop-invariant inputs, read out of base/dists once rather than every period
+    growth_dist, margin_dist = dists["revenue_growth"], dists["gross_margin"]
+    opex_dist, conversion_dist = dists["opex_ratio"], dists["cash_conversion"]
+    capex_dist, capex_cap = dists["capex_ratio"], base["capex_cap"]
+    salary = base.get("average_annual_salary_cost")
+    min_cash_buffer = base["min_cash_buffer_for_hiring"]
+    can_hire = bool(base["employee_count"] and salary)
+    salary_2x = salary * 2 if salary else 0
+    hire_upfront = salary * 0.5 if salary else 0  # 6 months upfront cost
+    for t in range(num_periods):
+        g = truncated_normal(**growth_dist, size=num_sims, rng=rng)
+        revenue = np.maximum(revenue * (1 + g), 0)
+        margin = truncated_normal(**margin_dist, size=num_sims, rng=rng)
+        opex_ratio = truncated_normal(**opex_dist, size=num_sims, rng=rng)
+        cash_conv = truncated_normal(**conversion_dist, size=num_sims, rng=rng)
         gross_profit = revenue * margin
         opex = revenue * opex_ratio
         operating_income = gross_profit - opex
         cfo = operating_income * cash_conv
-        capex_ratio = lognorm(
-            s=dists["capex_ratio"]["std"] / max(dists["capex_ratio"]["mean"], 0.001),
-            scale=dists["capex_ratio"]["mean"]
-        ).rvs()
-        capex_ratio = min(capex_ratio, base["capex_cap"])
+        capex_ratio = np.minimum(lognormal_ratio(**capex_dist, size=num_sims, rng=rng), capex_cap)
         capex = revenue * capex_ratio
-        if employees and base.get("average_annual_salary_cost"):
-            if g > 0.05 and (cash > base["min_cash_buffer_for_hiring"] or cash > 0.1 * revenue):
-                rev_per_emp = revenue / employees
-                if rev_per_emp > base["average_annual_salary_cost"] * 2:
-                    cash -= base["average_annual_salary_cost"] * 0.5
-                    employees += 1
-        cash += cfo - capex
-        periods["revenue"].append(revenue)
-        periods["cash"].append(cash)
-        periods["gross_margin_pct"].append((gross_profit / revenue * 100) if revenue > 0 else 0)
-        periods["operating_margin_pct"].append((operating_income / revenue * 100) if revenue > 0 else 0)
-        periods["cash_flow"].append(cfo - capex)
-        periods["revenue_growth"].append(g)
-    for k in periods:
-        periods[k] = np.array(periods[k])
+        if can_hire:
+            hired = (
+                (g > 0.05)
+                & ((cash > min_cash_buffer) | (cash > 0.1 * revenue))
+                & (revenue / employees > salary_2x)
+            )
+            cash = np.where(hired, cash - hire_upfront, cash)
+            employees = employees + hired
+        cash_flow = cfo - capex
+        cash = cash + cash_flow
+        periods["revenue"][:, t] = revenue
+        periods["cash"][:, t] = cash
+        periods["gross_margin_pct"][:, t] = _pct_of_revenue(gross_profit, revenue)
+        periods["operating_margin_pct"][:, t] = _pct_of_revenue(operating_income, revenue)
+        periods["cash_flow"][:, t] = cash_flow
+        periods["revenue_growth"][:, t] = g
     return periods
 
 
-def run_multi_period_simulations(base: dict, dists: dict, num_periods: int = 8, num_sims: int = None) -> Dict:
+def run_simulation_multi_period(base: dict, dists: dict, num_periods: int) -> dict:
+    """One multi-period path: an array of num_periods values per MULTI_PERIOD_SERIES entry."""
+    return {name: values[0] for name, values in simulate_multi_period_paths(base, dists, num_periods, 1).items()}
+
+
+# Fan-chart bands, computed together in a single np.percentile call per metric
+FAN_CHART_PERCENTILES = (10, 90, 20, 80, 30, 70, 5, 95)
+
+
+def run_multi_period_simulations(base: dict, dists: dict, num_periods: int = 8, num_sims: int = None, rng=None) -> Dict:
     if num_sims is None:
         num_sims = min(10000, 2000)
-    all_paths = [run_simulation_multi_period(base, dists, num_periods) for _ in range(num_sims)]
+    all_paths = simulate_multi_period_paths(base, dists, num_periods, num_sims, rng)
     result = {"base": base, "num_periods": num_periods, "num_simulations": num_sims}
     for metric in ["revenue", "cash", "gross_margin_pct", "operating_margin_pct", "cash_flow"]:
-        paths = np.array([p[metric] for p in all_paths])
+        paths = all_paths[metric]
+        bands = np.percentile(paths, FAN_CHART_PERCENTILES, axis=0)
         result[metric] = {
             "median": np.median(paths, axis=0),
-            "p10": np.percentile(paths, 10, axis=0),
-            "p90": np.percentile(paths, 90, axis=0),
-            "p20": np.percentile(paths, 20, axis=0),
-            "p80": np.percentile(paths, 80, axis=0),
-            "p30": np.percentile(paths, 30, axis=0),
-            "p70": np.percentile(paths, 70, axis=0),
-            "p5": np.percentile(paths, 5, axis=0),
-            "p95": np.percentile(paths, 95, axis=0),
+            **{f"p{q}": band for q, band in zip(FAN_CHART_PERCENTILES, bands)},
             "paths": paths,
         }
     return result
@@ -498,6 +618,34 @@ def run_multi_period_simulations(base: dict, dists: dict, num_periods: int = 8,
 # VISUALIZATION
 # =====================================================
 
+def new_figure(figsize, nrows=1, ncols=1, **subplot_kw):
+    """
+    (fig, ax) for one chart (ax is an array for a grid), imported on first use
+    so callers that never plot skip matplotlib. Figures are built directly
+    rather than through pyplot: nothing is registered with a GUI backend, so
+    nothing needs plt.close().
+    """
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=figsize)
+    return fig, fig.subplots(nrows, ncols, subplot_kw=subplot_kw or None)
+
+
+def summary_stats(values: np.ndarray) -> Dict:
+    """Mean/std/min/max and tail percentiles of a simulated series, as used by the plots."""
+    p5, p10, median, p90, p95 = np.percentile(values, [5, 10, 50, 90, 95])
+    return {"mean": np.mean(values), "median": median, "std": np.std(values),
+            "min": values.min(), "max": values.max(),
+            "p5": p5, "p10": p10, "p90": p90, "p95": p95}
+
+
+def _normal_fit_curve(stats: Dict):
+    """Normal density over [min, max] for the mean/std in stats."""
+    mean, std = stats["mean"], stats["std"]
+    x_curve = np.linspace(stats["min"], stats["max"], 1000)
+    y_curve = (1 / (std * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x_curve - mean) / std) ** 2)
+    return x_curve, y_curve
+
+
 def plot_fan_chart(multi_period_results: dict, metric: str = "revenue", title: str = None):
     data = multi_period_results[metric]
     num_periods = multi_period_results["num_periods"]
@@ -506,7 +654,7 @@ def plot_fan_chart(multi_period_results: dict, metric: str = "revenue", title: s
     starting_value = base.get(
         metric if metric not in ("gross_margin_pct", "operating_margin_pct", "cash_flow") else "revenue", 0
     )
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig, ax = new_figure((14, 8))
     ax.fill_between(periods, data["p5"], data["p95"], alpha=0.1, color="steelblue", label="5th-95th (90% CI)")
     ax.fill_between(periods, data["p10"], data["p90"], alpha=0.15, color="steelblue", label="10th-90th (80% CI)")
     ax.fill_between(periods, data["p20"], data["p80"], alpha=0.2, color="steelblue", label="20th-80th (60% CI)")
@@ -533,20 +681,21 @@ Range: {data['p90'][-1] - data['p10'][-1]:,.0f}"""
     ax.text(0.02, 0.98, stats_text, transform=ax.transAxes,
             fontsize=10, verticalalignment="top", family="monospace",
             bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.9, edgecolor="black"))
-    plt.tight_layout()
+    fig.tight_layout()
     filename = os.path.join(OUTPUT_DIR, f"fan_chart_{metric}.png")
-    plt.savefig(filename, dpi=300, bbox_inches="tight")
+    fig.savefig(filename, dpi=PLOT_DPI, bbox_inches="tight")
     print(f"\n📊 Fan chart saved as '{filename}'")
-    plt.close()
     return filename
 
 
-def plot_monte_carlo_bell_curve(results: dict, cash_outcomes: np.ndarray):
+def plot_monte_carlo_bell_curve(results: dict, cash_outcomes: np.ndarray, stats: Optional[Dict] = None):
     """
     Plot the Monte Carlo simulation results as a bell curve (normal distribution)
     showing the distribution of ending cash positions across all simulations.
+    stats (mean/std/min/max of cash_outcomes) can be passed in when the caller
+    has already computed them.
     """
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig, ax = new_figure((14, 8))
     
     # Create histogram (empirical distribution)
     n_bins = 60
@@ -555,10 +704,12 @@ def plot_monte_carlo_bell_curve(results: dict, cash_outcomes: np.ndarray):
                                     linewidth=0.5, label='Monte Carlo Simulation Results')
     
     # Overlay theoretical normal distribution curve
-    mean_cash = np.mean(cash_outcomes)
-    std_cash = np.std(cash_outcomes)
-    x_curve = np.linspace(cash_outcomes.min(), cash_outcomes.max(), 1000)
-    y_curve = (1 / (std_cash * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x_curve - mean_cash) / std_cash) ** 2)
+    if stats is None:
+        stats = {"mean": np.mean(cash_outcomes), "std": np.std(cash_outcomes),
+                 "min": cash_outcomes.min(), "max": cash_outcomes.max()}
+    mean_cash, std_cash = stats["mean"], stats["std"]
+    cash_min, cash_max = stats["min"], stats["max"]
+    x_curve, y_curve = _normal_fit_curve(stats)
     ax.plot(x_curve, y_curve, 'r-', linewidth=2.5, label='Normal Distribution Fit', alpha=0.8)
     
     # Mark key percentiles
@@ -578,10 +729,10 @@ def plot_monte_carlo_bell_curve(results: dict, cash_outcomes: np.ndarray):
     ax.axvline(starting, color='purple', linestyle=':', linewidth=2.5, alpha=0.8, label=f'Starting Cash: {starting:,.0f}')
     
     # Mark zero line if negative values exist
-    if cash_outcomes.min() < 0:
+    if cash_min < 0:
         ax.axvline(0, color='black', linestyle='-', linewidth=2, alpha=0.6, label='Zero Cash (Risk Threshold)')
         # Fill negative cash region
-        ax.axvspan(cash_outcomes.min(), 0, alpha=0.15, color='red', label='Negative Cash Zone')
+        ax.axvspan(cash_min, 0, alpha=0.15, color='red', label='Negative Cash Zone')
     
     # Fill area under normal curve
     ax.fill_between(x_curve, 0, y_curve, alpha=0.2, color='steelblue')
@@ -599,8 +750,8 @@ def plot_monte_carlo_bell_curve(results: dict, cash_outcomes: np.ndarray):
     stats_text = f"""Statistics:
 Mean: {mean_cash:,.0f}
 Std Dev: {std_cash:,.0f}
-Min: {cash_outcomes.min():,.0f}
-Max: {cash_outcomes.max():,.0f}
+Min: {cash_min:,.0f}
+Max: {cash_max:,.0f}
 Prob < 0: {results['probability_cash_negative']*100:.2f}%
 Prob Should Hire: {results.get('probability_should_hire', 0)*100:.2f}%"""
     
@@ -621,34 +772,33 @@ Prob Should Hire: {results.get('probability_should_hire', 0)*100:.2f}%"""
                 fontsize=9, verticalalignment='top', horizontalalignment='right',
                 bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8, edgecolor='blue'))
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, 'monte_carlo_bell_curve.png'), dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(os.path.join(OUTPUT_DIR, 'monte_carlo_bell_curve.png'), dpi=PLOT_DPI, bbox_inches='tight')
     print(f"\n📊 Graph saved as '{os.path.join(OUTPUT_DIR, 'monte_carlo_bell_curve.png')}'")
-    plt.close()  # Close figure instead of showing (non-blocking)
 
 
-def plot_revenue_distribution(sim_data: Dict):
-    """Plot revenue distribution for revenue-related questions"""
+def plot_revenue_distribution(sim_data: Dict, stats: Optional[Dict] = None):
+    """
+    Plot revenue distribution for revenue-related questions. stats (see
+    summary_stats) can be passed in when the caller has already computed them.
+    """
     revenue = sim_data["revenue"]
     base = sim_data["base"]
+    if stats is None:
+        stats = summary_stats(revenue)
     
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = new_figure((12, 7))
     
     n_bins = 50
     ax.hist(revenue, bins=n_bins, density=True, alpha=0.7, color='steelblue', 
             edgecolor='black', linewidth=0.5, label='Revenue Distribution')
     
     # Overlay normal curve
-    mean_rev = np.mean(revenue)
-    std_rev = np.std(revenue)
-    x_curve = np.linspace(revenue.min(), revenue.max(), 1000)
-    y_curve = (1 / (std_rev * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x_curve - mean_rev) / std_rev) ** 2)
+    x_curve, y_curve = _normal_fit_curve(stats)
     ax.plot(x_curve, y_curve, 'r-', linewidth=2, label='Normal Fit', alpha=0.8)
     
     # Mark key percentiles
-    p10 = np.percentile(revenue, 10)
-    p50 = np.percentile(revenue, 50)
-    p90 = np.percentile(revenue, 90)
+    p10, p50, p90 = stats["p10"], stats["median"], stats["p90"]
     
     ax.axvline(p10, color='orange', linestyle='--', linewidth=2, label=f'P10: {p10:,.0f}')
     ax.axvline(p50, color='green', linestyle='-', linewidth=2, label=f'Median: {p50:,.0f}')
@@ -662,34 +812,33 @@ def plot_revenue_distribution(sim_data: Dict):
     ax.grid(True, alpha=0.3)
     ax.legend()
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, 'revenue_distribution.png'), dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(os.path.join(OUTPUT_DIR, 'revenue_distribution.png'), dpi=PLOT_DPI, bbox_inches='tight')
     print(f"\n📊 Revenue distribution graph saved as '{os.path.join(OUTPUT_DIR, 'revenue_distribution.png')}'")
-    plt.close()  # Close figure instead of showing (non-blocking)
 
 
-def plot_cash_distribution(sim_data: Dict):
-    """Plot cash distribution for cash/liquidity-related questions"""
+def plot_cash_distribution(sim_data: Dict, stats: Optional[Dict] = None):
+    """
+    Plot cash distribution for cash/liquidity-related questions. stats (see
+    summary_stats) can be passed in when the caller has already computed them.
+    """
     cash = sim_data["cash"]
     base = sim_data["base"]
+    if stats is None:
+        stats = summary_stats(cash)
     
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = new_figure((12, 7))
     
     n_bins = 50
     ax.hist(cash, bins=n_bins, density=True, alpha=0.7, color='steelblue', 
             edgecolor='black', linewidth=0.5, label='Cash Distribution')
     
     # Overlay normal curve
-    mean_cash = np.mean(cash)
-    std_cash = np.std(cash)
-    x_curve = np.linspace(cash.min(), cash.max(), 1000)
-    y_curve = (1 / (std_cash * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x_curve - mean_cash) / std_cash) ** 2)
+    x_curve, y_curve = _normal_fit_curve(stats)
     ax.plot(x_curve, y_curve, 'r-', linewidth=2, label='Normal Fit', alpha=0.8)
     
     # Mark key percentiles
-    p5 = np.percentile(cash, 5)
-    p50 = np.percentile(cash, 50)
-    p95 = np.percentile(cash, 95)
+    p5, p50, p95 = stats["p5"], stats["median"], stats["p95"]
     
     ax.axvline(p5, color='red', linestyle='--', linewidth=2, label=f'P5: {p5:,.0f}')
     ax.axvline(p50, color='green', linestyle='-', linewidth=2, label=f'Median: {p50:,.0f}')
@@ -697,9 +846,9 @@ def plot_cash_distribution(sim_data: Dict):
     ax.axvline(base["cash"], color='purple', linestyle=':', linewidth=2, 
                label=f'Current: {base["cash"]:,.0f}')
     
-    if cash.min() < 0:
+    if stats["min"] < 0:
         ax.axvline(0, color='black', linestyle='-', linewidth=2, label='Zero Cash')
-        ax.axvspan(cash.min(), 0, alpha=0.15, color='red', label='Negative Zone')
+        ax.axvspan(stats["min"], 0, alpha=0.15, color='red', label='Negative Zone')
     
     ax.set_xlabel('Cash Position', fontsize=12, fontweight='bold')
     ax.set_ylabel('Probability Density', fontsize=12, fontweight='bold')
@@ -707,7 +856,6 @@ def plot_cash_distribution(sim_data: Dict):
     ax.grid(True, alpha=0.3)
     ax.legend()
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, 'cash_distribution.png'), dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(os.path.join(OUTPUT_DIR, 'cash_distribution.png'), dpi=PLOT_DPI, bbox_inches='tight')
     print(f"\n📊 Cash distribution graph saved as '{os.path.join(OUTPUT_DIR, 'cash_distribution.png')}'")
-    plt.close()  # Close figure instead of showing (non-blocking)
@@ -4,24 +4,37 @@ CLI Entry Point for Monte Carlo Financial Analysis
 Thin CLI wrapper around mc_router. Run directly or from backend:
 
     python ml-simulator/montecarlo.py "What is the probability of negative cash?"
+    python ml-simulator/montecarlo.py --batch questions.txt   # one question per line
 """
 
 import sys
 import os
 import json
 import time
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-from mc_router import answer_question, answer_scenario_comparison, answer_sensitivity_analysis, answer_what_if
-from monte_carlo_simulations import run_engine, plot_monte_carlo_bell_curve, OUTPUT_DIR
+from mc_router import answer_question, answer_questions, answer_scenario_comparison, answer_sensitivity_analysis, answer_what_if
+from monte_carlo_simulations import (
+    run_engine,
+    plot_monte_carlo_bell_curve,
+    plot_revenue_distribution,
+    plot_cash_distribution,
+    OUTPUT_DIR
+)
+
+try:
+    import orjson  # C encoder with native numpy support
+except ImportError:
+    orjson = None
 
 
 MODE_FLAGS = {"--compare", "-c", "--scenarios"}
 SENSITIVITY_FLAGS = {"--sensitivity", "-s"}
 ANOMALY_FLAGS = {"--anomalies", "-a"}
 WHATIF_FLAGS = {"--whatif", "-w"}
+BATCH_FLAGS = {"--batch", "-b"}
 
 
 def is_compare_mode(args: list) -> bool:
@@ -40,16 +53,52 @@ def is_whatif_mode(args: list) -> bool:
     return any(flag in args for flag in WHATIF_FLAGS)
 
 
+def is_batch_mode(args: list) -> bool:
+    return any(flag in args for flag in BATCH_FLAGS)
+
+
+def to_json(obj) -> str:
+    """Indented JSON for stdout and the output files; unknown types fall back to str()."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
+def _render_plot(plot_metadata: dict) -> str:
+    """Draw the plot answer_question asked for. Runs in a worker process."""
+    plot_type = plot_metadata.get("type")
+    if plot_type == "revenue":
+        plot_revenue_distribution(plot_metadata.get("sim_data"))
+        return "Graph saved as 'revenue_distribution.png'"
+    if plot_type == "cash":
+        plot_cash_distribution(plot_metadata.get("sim_data"))
+        return "Graph saved as 'cash_distribution.png'"
+    if plot_type == "bell_curve":
+        plot_monte_carlo_bell_curve(plot_metadata.get("results_for_plot"), plot_metadata.get("cash"),
+                                    plot_metadata.get("stats"))
+        return "Graph saved as 'monte_carlo_bell_curve.png'"
+    return ""
+
+
+def _plot_payload(plot_metadata: dict) -> dict:
+    """plot_metadata without the per-path "simulations" records, which no plot reads."""
+    if "sim_data" not in plot_metadata:
+        return plot_metadata
+    sim_data = plot_metadata["sim_data"]
+    return {**plot_metadata, "sim_data": {k: sim_data[k] for k in ("base", "revenue", "cash")}}
+
+
 if __name__ == "__main__":
     if is_anomaly_mode(sys.argv[1:]):
         from anomaly_detection import run_anomaly_detection
         result = run_anomaly_detection()
-        print(json.dumps(result, indent=2, default=str))
+        print(to_json(result))
         sys.exit(0)
 
     if is_sensitivity_mode(sys.argv[1:]):
         result = answer_sensitivity_analysis()
-        print(json.dumps(result, indent=2, default=str))
+        print(to_json(result))
         sys.exit(0)
 
     if is_whatif_mode(sys.argv[1:]):
@@ -65,7 +114,27 @@ if __name__ == "__main__":
         overrides = parsed.get("overrides", {})
         num_sims = parsed.get("num_simulations", None)
         result = answer_what_if(base_metrics, overrides, num_sims)
-        print(json.dumps(result, indent=2, default=str))
+        print(to_json(result))
+        sys.exit(0)
+
+    if is_batch_mode(sys.argv[1:]):
+        flag = [a for a in sys.argv[1:] if a in BATCH_FLAGS][0]
+        flag_idx = sys.argv.index(flag)
+        path = " ".join(sys.argv[flag_idx + 1:])
+        try:
+            with open(path, encoding="utf-8") as f:
+                questions = [line.strip() for line in f if line.strip()]
+        except OSError as e:
+            print(to_json({"error": f"Could not read batch file: {e}"}))
+            sys.exit(1)
+        results = []
+        for question, response in zip(questions, answer_questions(questions)):
+            if isinstance(response, BaseException):
+                results.append({"question": question, "error": str(response)})
+            else:
+                response.pop("_plot_metadata", None)
+                results.append(response)
+        print(to_json(results))
         sys.exit(0)
 
     if is_compare_mode(sys.argv[1:]):
@@ -78,7 +147,7 @@ if __name__ == "__main__":
             print(json.dumps({"error": "Invalid scenarios JSON"}, indent=2))
             sys.exit(1)
         result = answer_scenario_comparison(scenarios)
-        print(json.dumps(result, indent=2, default=str))
+        print(to_json(result))
         sys.exit(0)
 
     if len(sys.argv) > 1:
@@ -94,18 +163,54 @@ if __name__ == "__main__":
         print("\n" + "=" * 70)
         print("STANDARD MONTE CARLO SIMULATION RESULTS")
         print("=" * 70)
-        print(json.dumps({k: v for k, v in results.items() if k != "hiring_parameters"}, indent=2))
+        print(to_json({k: v for k, v in results.items() if k != "hiring_parameters"}))
         plot_monte_carlo_bell_curve(results, cash_array)
     else:
         start_time = time.time()
 
         comprehensive_answer = answer_question(question, generate_plot=True, generate_fan_charts=True)
 
+        # Render the plot in a worker while the answer files are written;
+        # it is collected before exit, since the backend reads the PNG after.
+        plot_metadata = comprehensive_answer.get("_plot_metadata")
+        plot_info = comprehensive_answer.get("plot_generation", {})
+        plot_pool = plot_future = None
+        if plot_metadata and plot_info.get("status") == "will_generate":
+            # spawn: forking a process that already runs threads can deadlock the child
+            plot_pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+            plot_future = plot_pool.submit(_render_plot, _plot_payload(plot_metadata))
+
         analysis_results = comprehensive_answer.get("analysis_results", {})
         llm_explanation = analysis_results.get("llm_explanation", "")
         computed_answer = analysis_results.get("computed_answer", {})
         data_used = analysis_results.get("data_used", {})
 
+        print("\n" + "=" * 70)
+        print("FINANCIAL ANALYSIS - STRUCTURED INTERPRETATION")
+        print("=" * 70)
+        print("\n" + llm_explanation)
+        print("\n" + "=" * 70)
+
+        if computed_answer:
+            print("\n" + "=" * 70)
+            print("COMPUTED METRICS (Summary)")
+            print("=" * 70)
+            print(to_json(computed_answer))
+            print("=" * 70)
+
+        if data_used:
+            print("\n" + "=" * 70)
+            print("DATA CONTEXT")
+            print("=" * 70)
+            print(f"Periods Analyzed: {data_used.get('periods_analyzed', 'N/A')}")
+            print(f"Time Period: {data_used.get('time_period_requested', 'N/A')}")
+            print(f"Note: {data_used.get('note', 'N/A')}")
+            print("=" * 70)
+
+        # Answer first, so it shows before the output files are written
+        sys.stdout.flush()
+        answer_time = time.time() - start_time
+
         interpretation_file = os.path.join(OUTPUT_DIR, "financial_analysis_interpretation.txt")
         with open(interpretation_file, 'w', encoding='utf-8') as f:
             f.write("=" * 70 + "\n")
@@ -127,66 +232,27 @@ if __name__ == "__main__":
         if analysis_results.get("metrics"):
             metrics_data.update(analysis_results.get("metrics", {}))
         with open(metrics_file, 'w', encoding='utf-8') as f:
-            json.dump(metrics_data, f, indent=2, default=str)
-
-        print("\n" + "=" * 70)
-        print("FINANCIAL ANALYSIS - STRUCTURED INTERPRETATION")
-        print("=" * 70)
-        print("\n" + llm_explanation)
-        print("\n" + "=" * 70)
-
-        if computed_answer:
-            print("\n" + "=" * 70)
-            print("COMPUTED METRICS (Summary)")
-            print("=" * 70)
-            print(json.dumps(computed_answer, indent=2, default=str))
-            print("=" * 70)
-
-        if data_used:
-            print("\n" + "=" * 70)
-            print("DATA CONTEXT")
-            print("=" * 70)
-            print(f"Periods Analyzed: {data_used.get('periods_analyzed', 'N/A')}")
-            print(f"Time Period: {data_used.get('time_period_requested', 'N/A')}")
-            print(f"Note: {data_used.get('note', 'N/A')}")
-            print("=" * 70)
+            f.write(to_json(metrics_data))
 
         output_file = os.path.join(OUTPUT_DIR, "monte_carlo_analysis.json")
         json_to_save = comprehensive_answer.copy()
         json_to_save.pop("_plot_metadata", None)
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(json_to_save, f, indent=2, default=str)
+            f.write(to_json(json_to_save))
 
         elapsed_time = time.time() - start_time
-        print(f"\nAnalysis completed in {elapsed_time:.2f} seconds")
+        print(f"\nAnalysis completed in {elapsed_time:.2f} seconds (answer shown after {answer_time:.2f})")
         print(f"Interpretation saved to '{interpretation_file}'")
         print(f"Metrics saved to '{metrics_file}'")
         print(f"Full analysis saved to '{output_file}'")
 
-        plot_metadata = comprehensive_answer.get("_plot_metadata")
-        plot_info = comprehensive_answer.get("plot_generation", {})
-
-        if plot_metadata and plot_info.get("status") == "will_generate":
+        if plot_future is not None:
             try:
-                plot_type = plot_metadata.get("type")
-                if plot_type == "revenue":
-                    from monte_carlo_simulations import plot_revenue_distribution
-                    plot_revenue_distribution(plot_metadata.get("sim_data"))
-                    plt.close('all')
-                    print(f"Graph saved as 'revenue_distribution.png'")
-                elif plot_type == "cash":
-                    from monte_carlo_simulations import plot_cash_distribution
-                    plot_cash_distribution(plot_metadata.get("sim_data"))
-                    plt.close('all')
-                    print(f"Graph saved as 'cash_distribution.png'")
-                elif plot_type == "bell_curve":
-                    plot_monte_carlo_bell_curve(plot_metadata.get("results_for_plot"), plot_metadata.get("cash"))
-                    plt.close('all')
-                    print(f"Graph saved as 'monte_carlo_bell_curve.png'")
+                print(plot_future.result())
             except Exception as e:
                 print(f"Could not generate plot: {e}")
-                import traceback
-                traceback.print_exc()
-                plt.close('all')
+                traceback.print_exception(e)
+            finally:
+                plot_pool.shutdown()
         elif plot_info.get("status") == "failed":
             print(f"Plot generation failed: {plot_info.get('error', 'Unknown error')}")
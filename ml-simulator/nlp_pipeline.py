@@ -7,14 +7,27 @@ Consolidated NLP module: rule-based primary, Backboard API fallback.
 import re
 import json
 import asyncio
+import hashlib
 import os
 import numpy as np
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 from backboard import BackboardClient
-from backboard.exceptions import BackboardAPIError
+from backboard.exceptions import BackboardAPIError, BackboardNotFoundError
+
+try:
+    import orjson  # faster loads for the model's JSON replies
+except ImportError:
+    orjson = None
 
 # Import Monte Carlo simulation functions
 API_KEY = os.environ.get("BACKBOARD_API_KEY", "")
+# Parser assistant ids reused across processes (the backend runs one process
+# per question); set to "" to create a fresh assistant every run.
+ASSISTANT_ID_FILE = os.environ.get(
+    "NLP_ASSISTANT_ID_FILE", os.path.join(os.path.expanduser("~"), ".simucfo_assistant_id")
+)
+ASSISTANT_NAME = "Finance NLP Parser"
 
 API_SYSTEM_PROMPT = """
 You are an intelligent NLP parser for business and financial queries.
@@ -50,24 +63,78 @@ Rules:
 def extract_json(raw_output: str) -> dict:
     raw_output = raw_output.strip()
     if raw_output.startswith("```"):
-        raw_output = raw_output.replace("```json", "").replace("```", "").strip()
+        raw_output = raw_output.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw_output)
+        except orjson.JSONDecodeError:
+            pass  # json also accepts NaN/Infinity and huge ints; let it decide
     return json.loads(raw_output)
 
 
+def _assistant_fingerprint(client: BackboardClient) -> str:
+    """Key for the cached id: a new API key or system prompt needs a new assistant."""
+    raw = "\0".join((getattr(client, "api_key", ""), ASSISTANT_NAME, API_SYSTEM_PROMPT))
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def _read_assistant_ids() -> Dict[str, str]:
+    try:
+        with open(ASSISTANT_ID_FILE, encoding="utf-8") as f:
+            ids = json.load(f)
+        return ids if isinstance(ids, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_assistant_ids(ids: Dict[str, str]) -> None:
+    """Best effort, written via rename so a concurrent reader never sees half a file."""
+    tmp = f"{ASSISTANT_ID_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(ids, f)
+        os.replace(tmp, ASSISTANT_ID_FILE)
+    except OSError:
+        pass
+
+
+def forget_assistant(client: BackboardClient) -> None:
+    """Drop the cached parser assistant id (e.g. after the server lost it)."""
+    if not ASSISTANT_ID_FILE:
+        return
+    ids = _read_assistant_ids()
+    if ids.pop(_assistant_fingerprint(client), None) is not None:
+        _write_assistant_ids(ids)
+
+
 async def get_or_create_assistant(client: BackboardClient):
+    if ASSISTANT_ID_FILE:
+        cached = _read_assistant_ids().get(_assistant_fingerprint(client))
+        if cached:
+            return cached
     try:
         assistant = await client.create_assistant(
-            name="Finance NLP Parser",
+            name=ASSISTANT_NAME,
             system_prompt=API_SYSTEM_PROMPT
         )
-        return assistant.assistant_id
     except BackboardAPIError as e:
         raise RuntimeError("Failed to create assistant (timeout or network issue)") from e
+    if ASSISTANT_ID_FILE:
+        ids = _read_assistant_ids()
+        ids[_assistant_fingerprint(client)] = assistant.assistant_id
+        _write_assistant_ids(ids)
+    return assistant.assistant_id
 
 
 async def run_nlp_api(user_query: str, assistant_id: str, client: BackboardClient):
     """Backboard API-based NLP parsing (fallback when rule-based confidence is low)."""
-    thread = await client.create_thread(assistant_id)
+    try:
+        thread = await client.create_thread(assistant_id)
+    except BackboardNotFoundError:
+        # Cached id from an earlier run that no longer exists server-side
+        forget_assistant(client)
+        assistant_id = await get_or_create_assistant(client)
+        thread = await client.create_thread(assistant_id)
     response = await client.add_message(
         thread_id=thread.thread_id,
         content=user_query,
@@ -97,28 +164,29 @@ async def parse_question_with_fallback(
 ) -> Dict:
     """Rule-based primary, API-based fallback when confidence < 0.4."""
     result = parse_question(question)
-    confidence = result.get("nlp_analysis", {}).get("confidence", 0.0)
+    analysis = result["nlp_analysis"]
+    confidence = analysis.get("confidence", 0.0)
 
     if confidence < 0.4 and client and assistant_id and API_KEY:
         try:
             api_result = await run_nlp_api(question, assistant_id, client)
-            result["nlp_analysis"]["api_fallback"] = True
-            result["nlp_analysis"]["api_intent"] = api_result.get("intent")
-            result["nlp_analysis"]["api_metric"] = api_result.get("metric")
-            result["nlp_analysis"]["api_parameters"] = api_result.get("parameters", {})
-            result["nlp_analysis"]["api_confidence"] = 0.9
+            analysis["api_fallback"] = True
+            analysis["api_intent"] = api_result.get("intent")
+            analysis["api_metric"] = api_result.get("metric")
+            analysis["api_parameters"] = api_result.get("parameters", {})
+            analysis["api_confidence"] = 0.9
         except Exception as e:
-            result["nlp_analysis"]["api_fallback"] = False
-            result["nlp_analysis"]["api_error"] = str(e)
+            analysis["api_fallback"] = False
+            analysis["api_error"] = str(e)
 
     return result
 
 
 from monte_carlo_simulations import (
-    load_financials,
-    derive_historical_metrics,
-    build_distributions,
+    load_base_and_distributions,
     run_monte_carlo_simulations,
+    sorted_percentiles,
+    sorted_prob_below,
     NUM_SIMULATIONS,
     CSV_PATH,
     plot_monte_carlo_bell_curve,
@@ -130,60 +198,301 @@ from monte_carlo_simulations import (
 # NLP QUESTION PARSING
 # =====================================================
 
+FINANCIAL_KEYWORDS = (
+    "revenue", "sales", "income", "cash", "liquidity", "margin", "profit",
+    "cost", "expense", "opex", "capex", "ebitda", "growth", "risk",
+    "volatility", "forecast", "budget", "financial", "money", "dollar",
+    "runway", "buffer", "hiring", "employee", "salary", "spending"
+)
+THRESHOLD_KEYWORDS = ("below", "above", "exceeds", "drops", "falls", "minimum", "maximum", "threshold")
+COMPARISON_KEYWORDS = ("more than", "less than", "greater than", "at least", "at most")
+REVENUE_KEYWORDS = ("revenue", "sales", "income", "turnover", "topline")
+CASH_KEYWORDS = ("cash", "liquidity", "runway", "buffer", "reserves", "balance")
+MARGIN_KEYWORDS = ("margin", "profitability", "gross margin", "operating margin", "ebitda")
+COST_KEYWORDS = ("cost", "expense", "opex", "capex", "spending")
+RISK_KEYWORDS = ("risk", "volatility", "uncertainty", "probability", "chance", "likelihood")
+GROWTH_KEYWORDS = ("growth", "increase", "decrease", "decline", "slowdown")
+# (keywords, intent, reasoning); the first rule with a keyword hit wins
+INTENT_RULES = (
+    (("probability", "chance", "likelihood", "risk"),
+     "probability_assessment", "Question seeks probability/risk assessment"),
+    (("what is", "what are", "how much", "how many"),
+     "value_query", "Question seeks specific value or range"),
+    (("how", "why", "what causes"),
+     "explanation_query", "Question seeks explanation or analysis"),
+    (("what happens if", "scenario", "if"),
+     "scenario_analysis", "Question seeks scenario/what-if analysis"),
+)
+INTENT_KEYWORDS = tuple(kw for keywords, _, _ in INTENT_RULES for kw in keywords)
+# Question categories produced by parse_question and routed on by answer_question
+CATEGORY_REVENUE_GROWTH_RISK = "revenue_growth_risk"
+CATEGORY_COST_MARGIN_PRESSURE = "cost_margin_pressure"
+CATEGORY_CASH_FLOW_LIQUIDITY = "cash_flow_liquidity"
+CATEGORY_FORECAST_CONFIDENCE = "forecast_confidence"
+CATEGORY_SCENARIO_ANALYSIS = "scenario_analysis"
+CATEGORY_RISK_ATTRIBUTION = "risk_attribution"
+CATEGORY_PLANNING_DECISION = "planning_decision"
+CATEGORY_NON_FINANCIAL = "non_financial"
+CATEGORY_GENERAL = "general"
+# Phrases the question-type rules below look for
+QUESTION_PHRASES = (
+    "assumptions", "below", "cash below", "cash buffer", "cash drops below",
+    "collections delayed", "confident", "cost", "cost component", "cost inflation",
+    "cost of not taking action", "cost reduction", "costs increase",
+    "downside revenue risk", "drivers", "drops", "early warning", "ebitda", "error band",
+    "expected revenue", "flexibility", "forecast", "forecast error",
+    "forecast uncertainty", "gross margin", "growth slows", "improves survival",
+    "intervene", "last quarter", "liquidity crunch", "margin risk", "minimum threshold",
+    "miss", "monitor", "months", "months of runway", "operating margin",
+    "previous quarter", "quarters", "reduce downside risk", "reduce risk", "required",
+    "revenue", "revenue below", "revenue drops below", "revenue falls below",
+    "revenue growth slows", "revenue p10", "revenue p90", "revenue plan", "revenue range",
+    "risk driven", "riskier", "risks", "runway", "safest operating plan", "scenario",
+    "sensitive", "spending", "stabilize margins", "survival probability", "top",
+    "uncertainty", "volatile", "warning signals", "what happens if", "worst-case",
+    "worst-case cash",
+)
+
+# One scan of the question finds every vocabulary entry it contains. The
+# lookahead reports the longest entry starting at each position; entries
+# contained in it (e.g. "revenue" in "revenue falls below") are added from a
+# precomputed table, so the hit set equals {kw for kw in vocab if kw in text}.
+_VOCABULARY = sorted(
+    set(FINANCIAL_KEYWORDS + THRESHOLD_KEYWORDS + COMPARISON_KEYWORDS + REVENUE_KEYWORDS
+        + CASH_KEYWORDS + MARGIN_KEYWORDS + COST_KEYWORDS + RISK_KEYWORDS + GROWTH_KEYWORDS
+        + INTENT_KEYWORDS + QUESTION_PHRASES),
+    key=len,
+    reverse=True,
+)
+_VOCABULARY_RE = re.compile("(?=(" + "|".join(re.escape(kw) for kw in _VOCABULARY) + "))")
+_CONTAINED_KEYWORDS = {
+    kw: frozenset(other for other in _VOCABULARY if other in kw) for kw in _VOCABULARY
+}
+
+
+_FINANCIAL_KEYWORD_SET = frozenset(FINANCIAL_KEYWORDS)
+_THRESHOLD_KEYWORD_SET = frozenset(THRESHOLD_KEYWORDS + COMPARISON_KEYWORDS)
+_ENTITY_KEYWORD_SETS = (
+    ("revenue", frozenset(REVENUE_KEYWORDS)),
+    ("cash", frozenset(CASH_KEYWORDS)),
+    ("margin", frozenset(MARGIN_KEYWORDS)),
+    ("cost", frozenset(COST_KEYWORDS)),
+)
+_INTENT_RULE_SETS = tuple(
+    (frozenset(keywords), intent, reason) for keywords, intent, reason in INTENT_RULES
+)
+_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%?')
+# Shorter questions can't contain a financial keyword; only the first
+# MAX_QUESTION_CHARS of longer ones are scanned
+MIN_QUESTION_CHARS = 3
+MAX_QUESTION_CHARS = 4096
+
+
+def keyword_hits(text: str) -> Set[str]:
+    """Return every vocabulary keyword/phrase that occurs in (lower-cased) text."""
+    hits: Set[str] = set()
+    for m in _VOCABULARY_RE.finditer(text):
+        hits |= _CONTAINED_KEYWORDS[m.group(1)]
+    return hits
+
+
+# Cheap first pass: a question with none of the financial keywords is
+# answered as non-financial without the full vocabulary scan.
+_FINANCIAL_RE = re.compile("|".join(map(re.escape, FINANCIAL_KEYWORDS)))
+
+
+@lru_cache(maxsize=1024)
+def _question_hits(question: str) -> FrozenSet[str]:
+    # Shared by parse_question and select_monte_carlo_parameters so a question
+    # is only lower-cased and scanned once; kept off the parsed dict because
+    # nlp_analysis is serialised verbatim into responses.
+    return frozenset(keyword_hits(question[:MAX_QUESTION_CHARS].lower().strip()))
+
+
+# Question-type rules, checked in order against the keyword hit set; each is
+# (matches(hits, numbers), category, question_type, params(hits, numbers)).
+Hits = FrozenSet[str]
+Numbers = List[float]
+RuleMatch = Callable[[Hits, Numbers], bool]
+RuleParams = Callable[[Hits, Numbers], Dict]
+
+
+def _any_of(*phrases: str) -> RuleMatch:
+    return lambda hits, numbers: not hits.isdisjoint(phrases)
+
+
+def _all_of(first: str, *either: str) -> RuleMatch:
+    # `first` and at least one of `either`
+    return lambda hits, numbers: first in hits and not hits.isdisjoint(either)
+
+
+def _no_params(hits: Hits, numbers: Numbers) -> Dict:
+    return {}
+
+
+def _first_number(name: str, cast: Callable[[float], float] = float) -> RuleParams:
+    return lambda hits, numbers: {name: cast(numbers[0])} if numbers else {}
+
+
+def _revenue_threshold_params(hits: Hits, numbers: Numbers) -> Dict:
+    if "last quarter" in hits or "previous quarter" in hits:
+        return {"threshold_type": "last_quarter"}
+    return {"threshold": numbers[0]} if numbers else {}
+
+
+def _cash_threshold_params(hits: Hits, numbers: Numbers) -> Dict:
+    if "minimum threshold" in hits:
+        return {"threshold_type": "minimum"}
+    return {"threshold": numbers[0]} if numbers else {}
+
+
+def _worst_case_cash_params(hits: Hits, numbers: Numbers) -> Dict:
+    return {"months": int(numbers[0])} if "months" in hits and numbers else {}
+
+
+def _is_scenario(hits: Hits, numbers: Numbers) -> bool:
+    return "what happens if" in hits or "scenario" in hits
+
+
+_QUESTION_RULES: Tuple[Tuple[RuleMatch, Optional[str], Optional[str], RuleParams], ...] = (
+    # Revenue & Growth Risk
+    (_any_of("revenue falls below", "revenue drops below", "revenue below"),
+     CATEGORY_REVENUE_GROWTH_RISK, "revenue_below_threshold", _revenue_threshold_params),
+    (_any_of("revenue range", "expected revenue", "revenue p10", "revenue p90"),
+     CATEGORY_REVENUE_GROWTH_RISK, "revenue_range", _no_params),
+    (_all_of("volatile", "revenue"),
+     CATEGORY_REVENUE_GROWTH_RISK, "revenue_volatility", _no_params),
+    (lambda hits, numbers: "downside revenue risk" in hits or ("growth slows" in hits and bool(numbers)),
+     CATEGORY_REVENUE_GROWTH_RISK, "downside_revenue_risk", _first_number("slowdown_pct")),
+    (_all_of("miss", "revenue plan"),
+     CATEGORY_REVENUE_GROWTH_RISK, "miss_revenue_plan", _no_params),
+
+    # Cost & Margin Pressure
+    (_all_of("gross margin", "below", "drops"),
+     CATEGORY_COST_MARGIN_PRESSURE, "gross_margin_below", _first_number("threshold")),
+    (_all_of("ebitda", "sensitive", "cost inflation"),
+     CATEGORY_COST_MARGIN_PRESSURE, "ebitda_cost_sensitivity", _no_params),
+    (_all_of("worst-case", "operating margin"),
+     CATEGORY_COST_MARGIN_PRESSURE, "worst_case_operating_margin", _no_params),
+    (_all_of("cost component", "margin risk"),
+     CATEGORY_COST_MARGIN_PRESSURE, "cost_component_risk", _no_params),
+    (_all_of("cost reduction", "stabilize margins"),
+     CATEGORY_COST_MARGIN_PRESSURE, "cost_reduction_required", _no_params),
+
+    # Cash Flow & Liquidity
+    (_any_of("cash drops below", "cash below"),
+     CATEGORY_CASH_FLOW_LIQUIDITY, "cash_below_threshold", _cash_threshold_params),
+    (_any_of("months of runway", "runway"),
+     CATEGORY_CASH_FLOW_LIQUIDITY, "cash_runway", _no_params),
+    (_any_of("worst-case cash"),
+     CATEGORY_CASH_FLOW_LIQUIDITY, "worst_case_cash", _worst_case_cash_params),
+    (_all_of("cash buffer", "required"),
+     CATEGORY_CASH_FLOW_LIQUIDITY, "cash_buffer_required", _no_params),
+    (_any_of("liquidity crunch"),
+     CATEGORY_CASH_FLOW_LIQUIDITY, "liquidity_crunch", _no_params),
+
+    # Forecast Confidence
+    (_all_of("confident", "forecast"),
+     CATEGORY_FORECAST_CONFIDENCE, "forecast_confidence_level", _no_params),
+    (_any_of("forecast uncertainty"),
+     CATEGORY_FORECAST_CONFIDENCE, "uncertainty_trend", _no_params),
+    (_all_of("assumptions", "uncertainty"),
+     CATEGORY_FORECAST_CONFIDENCE, "assumption_uncertainty", _no_params),
+    (_any_of("forecast error", "error band"),
+     CATEGORY_FORECAST_CONFIDENCE, "forecast_error_band", _no_params),
+    (_all_of("riskier", "quarters"),
+     CATEGORY_FORECAST_CONFIDENCE, "quarterly_risk", _no_params),
+
+    # Scenario & What-If (an unrecognised scenario leaves category unset)
+    (lambda hits, numbers: _is_scenario(hits, numbers) and "revenue growth slows" in hits and bool(numbers),
+     CATEGORY_SCENARIO_ANALYSIS, "revenue_slowdown_scenario", _first_number("slowdown_pct")),
+    (lambda hits, numbers: _is_scenario(hits, numbers) and "costs increase" in hits and bool(numbers),
+     CATEGORY_SCENARIO_ANALYSIS, "cost_increase_scenario", _first_number("increase_pct")),
+    (lambda hits, numbers: _is_scenario(hits, numbers) and "collections delayed" in hits and bool(numbers),
+     CATEGORY_SCENARIO_ANALYSIS, "collection_delay_scenario", _first_number("days", int)),
+    (_is_scenario, None, None, _no_params),
+
+    # Risk Attribution
+    (_all_of("top", "drivers", "risks"),
+     CATEGORY_RISK_ATTRIBUTION, "top_risk_drivers",
+     lambda hits, numbers: {"top_n": int(numbers[0]) if numbers else 3}),
+    (_all_of("risk driven", "revenue", "cost"),
+     CATEGORY_RISK_ATTRIBUTION, "revenue_vs_cost_risk", _no_params),
+    (_all_of("assumptions", "monitor"),
+     CATEGORY_RISK_ATTRIBUTION, "monitor_assumptions", _no_params),
+    (_any_of("early warning", "warning signals"),
+     CATEGORY_RISK_ATTRIBUTION, "early_warning_signals", _no_params),
+    (_any_of("intervene", "reduce risk"),
+     CATEGORY_RISK_ATTRIBUTION, "intervention_priorities", _no_params),
+
+    # Planning & Decision Support
+    (_any_of("safest operating plan"),
+     CATEGORY_PLANNING_DECISION, "safest_plan", _no_params),
+    (_all_of("flexibility", "spending"),
+     CATEGORY_PLANNING_DECISION, "spending_flexibility", _no_params),
+    (_any_of("cost of not taking action"),
+     CATEGORY_PLANNING_DECISION, "inaction_cost", _no_params),
+    (_any_of("reduce downside risk"),
+     CATEGORY_PLANNING_DECISION, "risk_reduction_actions", _no_params),
+    (_any_of("survival probability", "improves survival"),
+     CATEGORY_PLANNING_DECISION, "survival_improvement", _no_params),
+)
+
+
 def parse_question(question: str) -> Dict:
     """
     Advanced NLP-based question parsing to understand user intent and extract parameters.
     Uses semantic analysis, keyword extraction, and pattern matching.
+
+    Parsing is pure, so results are memoised per question; each call gets its
+    own copy of the mutable parts since callers annotate the result.
     """
-    question_lower = question.lower().strip()
+    if len(question.strip()) < MIN_QUESTION_CHARS:
+        return _non_financial_result(question, "Question is too short to analyse")
+    if not _FINANCIAL_RE.search(question[:MAX_QUESTION_CHARS].lower()):
+        return _non_financial_result(question, "Question does not contain financial keywords")
+    cached = _parse_question_cached(question)
+    analysis = cached["nlp_analysis"]
+    return {
+        **cached,
+        "parameters": dict(cached["parameters"]),
+        "nlp_analysis": {
+            **analysis,
+            "detected_entities": list(analysis["detected_entities"]),
+            "reasoning": list(analysis["reasoning"]),
+        },
+    }
+
+
+def _non_financial_result(question: str, reason: str) -> Dict:
+    return {
+        "original_question": question,
+        "category": CATEGORY_NON_FINANCIAL,
+        "question_type": None,
+        "parameters": {},
+        "nlp_analysis": {
+            "detected_entities": [],
+            "intent": None,
+            "confidence": 0.0,
+            "reasoning": [reason]
+        }
+    }
+
+
+@lru_cache(maxsize=1024)
+def _parse_question_cached(question: str) -> Dict:
+    hits = _question_hits(question)
     
     # Check if question is non-financial
-    financial_keywords = [
-        "revenue", "sales", "income", "cash", "liquidity", "margin", "profit", 
-        "cost", "expense", "opex", "capex", "ebitda", "growth", "risk", 
-        "volatility", "forecast", "budget", "financial", "money", "dollar",
-        "runway", "buffer", "hiring", "employee", "salary", "spending"
-    ]
-    
-    is_financial_question = any(kw in question_lower for kw in financial_keywords)
+    is_financial_question = not _FINANCIAL_KEYWORD_SET.isdisjoint(hits)
     
     if not is_financial_question:
-        return {
-            "original_question": question,
-            "category": "non_financial",
-            "question_type": None,
-            "parameters": {},
-            "nlp_analysis": {
-                "detected_entities": [],
-                "intent": None,
-                "confidence": 0.0,
-                "reasoning": ["Question does not contain financial keywords"]
-            }
-        }
-    
-    # Extract numbers/percentages from question
-    numbers = re.findall(r'(\d+(?:\.\d+)?)\s*%?', question)
-    numbers = [float(n) for n in numbers]
-    
-    # Extract time periods
-    time_periods = {
-        "quarter": re.search(r'(\d+)\s*(?:quarters?|q)', question_lower),
-        "month": re.search(r'(\d+)\s*(?:months?|m)', question_lower),
-        "year": re.search(r'(\d+)\s*(?:years?|y)', question_lower),
-        "days": re.search(r'(\d+)\s*(?:days?|d)', question_lower)
-    }
-    
-    # Extract thresholds and comparisons
-    threshold_keywords = ["below", "above", "exceeds", "drops", "falls", "minimum", "maximum", "threshold"]
-    comparison_keywords = ["more than", "less than", "greater than", "at least", "at most"]
+        return _non_financial_result(question, "Question does not contain financial keywords")
     
-    # Semantic categories mapping
-    revenue_keywords = ["revenue", "sales", "income", "turnover", "topline"]
-    cash_keywords = ["cash", "liquidity", "runway", "buffer", "reserves", "balance"]
-    margin_keywords = ["margin", "profitability", "gross margin", "operating margin", "ebitda"]
-    cost_keywords = ["cost", "expense", "opex", "capex", "spending"]
-    risk_keywords = ["risk", "volatility", "uncertainty", "probability", "chance", "likelihood"]
-    growth_keywords = ["growth", "increase", "decrease", "decline", "slowdown"]
+    # Extract numbers/percentages from question; the rules only ever use the
+    # first one, so stop at the first match
+    first_number = _NUMBER_RE.search(question, 0, MAX_QUESTION_CHARS)
+    numbers: Numbers = [float(first_number.group(1))] if first_number else []
     
     result = {
         "original_question": question,
@@ -197,280 +506,170 @@ def parse_question(question: str) -> Dict:
             "reasoning": []
         }
     }
+    analysis = result["nlp_analysis"]
     
     # Detect primary entity (revenue, cash, margin, etc.)
-    detected_entities = []
-    if any(kw in question_lower for kw in revenue_keywords):
-        detected_entities.append("revenue")
-    if any(kw in question_lower for kw in cash_keywords):
-        detected_entities.append("cash")
-    if any(kw in question_lower for kw in margin_keywords):
-        detected_entities.append("margin")
-    if any(kw in question_lower for kw in cost_keywords):
-        detected_entities.append("cost")
-    
-    result["nlp_analysis"]["detected_entities"] = detected_entities
+    detected_entities = [
+        entity for entity, keywords in _ENTITY_KEYWORD_SETS if not keywords.isdisjoint(hits)
+    ]
+    
+    analysis["detected_entities"] = detected_entities
     
     # Intent classification
-    if any(kw in question_lower for kw in ["probability", "chance", "likelihood", "risk"]):
-        result["nlp_analysis"]["intent"] = "probability_assessment"
-        result["nlp_analysis"]["reasoning"].append("Question seeks probability/risk assessment")
-    elif any(kw in question_lower for kw in ["what is", "what are", "how much", "how many"]):
-        result["nlp_analysis"]["intent"] = "value_query"
-        result["nlp_analysis"]["reasoning"].append("Question seeks specific value or range")
-    elif any(kw in question_lower for kw in ["how", "why", "what causes"]):
-        result["nlp_analysis"]["intent"] = "explanation_query"
-        result["nlp_analysis"]["reasoning"].append("Question seeks explanation or analysis")
-    elif any(kw in question_lower for kw in ["what happens if", "scenario", "if"]):
-        result["nlp_analysis"]["intent"] = "scenario_analysis"
-        result["nlp_analysis"]["reasoning"].append("Question seeks scenario/what-if analysis")
+    for keywords, intent, reason in _INTENT_RULE_SETS:
+        if not keywords.isdisjoint(hits):
+            analysis["intent"] = intent
+            analysis["reasoning"].append(reason)
+            break
     
     # Confidence scoring based on keyword matches
     confidence = 0.0
     if detected_entities:
         confidence += 0.3
-    if result["nlp_analysis"]["intent"]:
+    if analysis["intent"]:
         confidence += 0.3
     if numbers:
         confidence += 0.2
-    if any(kw in question_lower for kw in threshold_keywords + comparison_keywords):
+    if not _THRESHOLD_KEYWORD_SET.isdisjoint(hits):
         confidence += 0.2
-    result["nlp_analysis"]["confidence"] = min(confidence, 1.0)
-    
-    # Revenue & Growth Risk
-    if any(phrase in question_lower for phrase in ["revenue falls below", "revenue drops below", "revenue below"]):
-        result["category"] = "revenue_growth_risk"
-        result["question_type"] = "revenue_below_threshold"
-        if "last quarter" in question_lower or "previous quarter" in question_lower:
-            result["parameters"]["threshold_type"] = "last_quarter"
-        elif numbers:
-            result["parameters"]["threshold"] = numbers[0]
-    elif any(phrase in question_lower for phrase in ["revenue range", "expected revenue", "revenue p10", "revenue p90"]):
-        result["category"] = "revenue_growth_risk"
-        result["question_type"] = "revenue_range"
-    elif "volatile" in question_lower and "revenue" in question_lower:
-        result["category"] = "revenue_growth_risk"
-        result["question_type"] = "revenue_volatility"
-    elif "downside revenue risk" in question_lower or ("growth slows" in question_lower and numbers):
-        result["category"] = "revenue_growth_risk"
-        result["question_type"] = "downside_revenue_risk"
-        if numbers:
-            result["parameters"]["slowdown_pct"] = numbers[0]
-    elif "miss" in question_lower and "revenue plan" in question_lower:
-        result["category"] = "revenue_growth_risk"
-        result["question_type"] = "miss_revenue_plan"
-    
-    # Cost & Margin Pressure
-    elif "gross margin" in question_lower and ("below" in question_lower or "drops" in question_lower):
-        result["category"] = "cost_margin_pressure"
-        result["question_type"] = "gross_margin_below"
-        if numbers:
-            result["parameters"]["threshold"] = numbers[0]
-    elif "ebitda" in question_lower and ("sensitive" in question_lower or "cost inflation" in question_lower):
-        result["category"] = "cost_margin_pressure"
-        result["question_type"] = "ebitda_cost_sensitivity"
-    elif "worst-case" in question_lower and "operating margin" in question_lower:
-        result["category"] = "cost_margin_pressure"
-        result["question_type"] = "worst_case_operating_margin"
-    elif "cost component" in question_lower and "margin risk" in question_lower:
-        result["category"] = "cost_margin_pressure"
-        result["question_type"] = "cost_component_risk"
-    elif "cost reduction" in question_lower and "stabilize margins" in question_lower:
-        result["category"] = "cost_margin_pressure"
-        result["question_type"] = "cost_reduction_required"
+    analysis["confidence"] = min(confidence, 1.0)
     
-    # Cash Flow & Liquidity
-    elif "cash drops below" in question_lower or "cash below" in question_lower:
-        result["category"] = "cash_flow_liquidity"
-        result["question_type"] = "cash_below_threshold"
-        if "minimum threshold" in question_lower:
-            result["parameters"]["threshold_type"] = "minimum"
-        elif numbers:
-            result["parameters"]["threshold"] = numbers[0]
-    elif "months of runway" in question_lower or "runway" in question_lower:
-        result["category"] = "cash_flow_liquidity"
-        result["question_type"] = "cash_runway"
-    elif "worst-case cash" in question_lower:
-        result["category"] = "cash_flow_liquidity"
-        result["question_type"] = "worst_case_cash"
-        if "months" in question_lower and numbers:
-            result["parameters"]["months"] = int(numbers[0])
-    elif "cash buffer" in question_lower and "required" in question_lower:
-        result["category"] = "cash_flow_liquidity"
-        result["question_type"] = "cash_buffer_required"
-    elif "liquidity crunch" in question_lower:
-        result["category"] = "cash_flow_liquidity"
-        result["question_type"] = "liquidity_crunch"
-    
-    # Forecast Confidence
-    elif "confident" in question_lower and "forecast" in question_lower:
-        result["category"] = "forecast_confidence"
-        result["question_type"] = "forecast_confidence_level"
-    elif "forecast uncertainty" in question_lower:
-        result["category"] = "forecast_confidence"
-        result["question_type"] = "uncertainty_trend"
-    elif "assumptions" in question_lower and "uncertainty" in question_lower:
-        result["category"] = "forecast_confidence"
-        result["question_type"] = "assumption_uncertainty"
-    elif "forecast error" in question_lower or "error band" in question_lower:
-        result["category"] = "forecast_confidence"
-        result["question_type"] = "forecast_error_band"
-    elif "riskier" in question_lower and "quarters" in question_lower:
-        result["category"] = "forecast_confidence"
-        result["question_type"] = "quarterly_risk"
-    
-    # Scenario & What-If
-    elif "what happens if" in question_lower or "scenario" in question_lower:
-        if "revenue growth slows" in question_lower and numbers:
-            result["category"] = "scenario_analysis"
-            result["question_type"] = "revenue_slowdown_scenario"
-            result["parameters"]["slowdown_pct"] = numbers[0]
-        elif "costs increase" in question_lower and numbers:
-            result["category"] = "scenario_analysis"
-            result["question_type"] = "cost_increase_scenario"
-            result["parameters"]["increase_pct"] = numbers[0]
-        elif "collections delayed" in question_lower and numbers:
-            result["category"] = "scenario_analysis"
-            result["question_type"] = "collection_delay_scenario"
-            result["parameters"]["days"] = int(numbers[0])
-    
-    # Risk Attribution
-    elif "top" in question_lower and ("drivers" in question_lower or "risks" in question_lower):
-        result["category"] = "risk_attribution"
-        result["question_type"] = "top_risk_drivers"
-        if numbers:
-            result["parameters"]["top_n"] = int(numbers[0])
-        else:
-            result["parameters"]["top_n"] = 3
-    elif "risk driven" in question_lower and ("revenue" in question_lower or "cost" in question_lower):
-        result["category"] = "risk_attribution"
-        result["question_type"] = "revenue_vs_cost_risk"
-    elif "assumptions" in question_lower and "monitor" in question_lower:
-        result["category"] = "risk_attribution"
-        result["question_type"] = "monitor_assumptions"
-    elif "early warning" in question_lower or "warning signals" in question_lower:
-        result["category"] = "risk_attribution"
-        result["question_type"] = "early_warning_signals"
-    elif "intervene" in question_lower or "reduce risk" in question_lower:
-        result["category"] = "risk_attribution"
-        result["question_type"] = "intervention_priorities"
-    
-    # Planning & Decision Support
-    elif "safest operating plan" in question_lower:
-        result["category"] = "planning_decision"
-        result["question_type"] = "safest_plan"
-    elif "flexibility" in question_lower and "spending" in question_lower:
-        result["category"] = "planning_decision"
-        result["question_type"] = "spending_flexibility"
-    elif "cost of not taking action" in question_lower:
-        result["category"] = "planning_decision"
-        result["question_type"] = "inaction_cost"
-    elif "reduce downside risk" in question_lower:
-        result["category"] = "planning_decision"
-        result["question_type"] = "risk_reduction_actions"
-    elif "survival probability" in question_lower or "improves survival" in question_lower:
-        result["category"] = "planning_decision"
-        result["question_type"] = "survival_improvement"
-    
-    # Default: general analysis
+    # First matching rule decides category, question type and parameters
+    for matches, category, question_type, extract_params in _QUESTION_RULES:
+        if matches(hits, numbers):
+            result["category"] = category
+            result["question_type"] = question_type
+            result["parameters"].update(extract_params(hits, numbers))
+            break
     else:
-        result["category"] = "general"
+        # Default: general analysis
+        result["category"] = CATEGORY_GENERAL
         result["question_type"] = "comprehensive_analysis"
     
     return result
 
+
+def _clear_parse_caches() -> None:
+    _parse_question_cached.cache_clear()
+    _question_hits.cache_clear()
+
+
+parse_question.cache_clear = _clear_parse_caches
+
 # =====================================================
 # PARAMETER SELECTION
 # =====================================================
 
+def _param_meta(reasoning: str, impact: str) -> Dict:
+    return {"reasoning": reasoning, "impact": impact}
+
+
+# group -> (selection reasoning, {parameter: meta}), applied in this order
+PARAMETER_GROUPS = {
+    "revenue": (
+        "Revenue-focused question requires revenue growth and margin parameters",
+        {
+            "revenue_growth": _param_meta(
+                "Question focuses on revenue, so revenue growth is essential for projection",
+                "Directly affects revenue outcomes"),
+            "gross_margin": _param_meta(
+                "Gross margin affects revenue quality and profitability",
+                "Influences revenue composition and margins"),
+        },
+    ),
+    "cash": (
+        "Cash/liquidity question requires cash flow parameters (CFO, CapEx) and revenue growth",
+        {
+            "cash_conversion": _param_meta(
+                "Cash conversion ratio determines how much operating income becomes cash",
+                "Directly affects cash flow from operations"),
+            "capex_ratio": _param_meta(
+                "Capital expenditures consume cash and affect ending cash position",
+                "Reduces available cash"),
+            "revenue_growth": _param_meta(
+                "Revenue growth drives operating income, which generates cash",
+                "Indirectly affects cash through operating income"),
+        },
+    ),
+    "margin": (
+        "Margin question requires gross margin, opex ratio, and revenue growth",
+        {
+            "gross_margin": _param_meta(
+                "Gross margin is fundamental to profitability analysis",
+                "Directly determines gross profit"),
+            "opex_ratio": _param_meta(
+                "Operating expense ratio determines operating margin",
+                "Affects operating income and EBITDA"),
+            "revenue_growth": _param_meta(
+                "Revenue growth affects scale and margin calculations",
+                "Influences margin percentages through revenue base"),
+        },
+    ),
+    # Include all parameters for comprehensive risk analysis
+    "risk": (
+        "Risk assessment requires all parameters for comprehensive uncertainty analysis",
+        {
+            name: _param_meta(
+                f"{name} contributes to overall financial risk and uncertainty",
+                "Part of comprehensive risk assessment")
+            for name in ["revenue_growth", "gross_margin", "opex_ratio", "cash_conversion", "capex_ratio"]
+        },
+    ),
+}
+
+
+# Attached to every parameter when a question selects no specific group
+_GENERIC_PARAM_META = _param_meta(
+    "General question requires comprehensive parameter set",
+    "Provides complete financial picture"
+)
+
+
 def select_monte_carlo_parameters(question_data: Dict, base: Dict, dists: Dict) -> Dict:
     """
     Dynamically select which Monte Carlo parameters to simulate based on NLP analysis.
     Returns selected parameters with reasoning for each selection.
     """
-    selected_params = {}
-    reasoning = []
+    reasoning: List[str] = []
     
     # Always include base parameters
     base_params = ["revenue_growth", "gross_margin", "opex_ratio"]
     
     # Analyze question to determine which parameters are most relevant
-    question_lower = question_data["original_question"].lower()
-    entities = question_data.get("nlp_analysis", {}).get("detected_entities", [])
-    intent = question_data.get("nlp_analysis", {}).get("intent", "")
-    
-    # Revenue-related questions
-    if "revenue" in entities or "revenue" in question_lower:
-        selected_params["revenue_growth"] = {
-            "distribution": dists["revenue_growth"],
-            "reasoning": "Question focuses on revenue, so revenue growth is essential for projection",
-            "impact": "Directly affects revenue outcomes"
-        }
-        selected_params["gross_margin"] = {
-            "distribution": dists["gross_margin"],
-            "reasoning": "Gross margin affects revenue quality and profitability",
-            "impact": "Influences revenue composition and margins"
-        }
-        reasoning.append("Revenue-focused question requires revenue growth and margin parameters")
-    
-    # Cash/liquidity-related questions
-    if "cash" in entities or any(kw in question_lower for kw in ["cash", "liquidity", "runway", "buffer"]):
-        selected_params["cash_conversion"] = {
-            "distribution": dists["cash_conversion"],
-            "reasoning": "Cash conversion ratio determines how much operating income becomes cash",
-            "impact": "Directly affects cash flow from operations"
-        }
-        selected_params["capex_ratio"] = {
-            "distribution": dists["capex_ratio"],
-            "reasoning": "Capital expenditures consume cash and affect ending cash position",
-            "impact": "Reduces available cash"
-        }
-        selected_params["revenue_growth"] = {
-            "distribution": dists["revenue_growth"],
-            "reasoning": "Revenue growth drives operating income, which generates cash",
-            "impact": "Indirectly affects cash through operating income"
-        }
-        reasoning.append("Cash/liquidity question requires cash flow parameters (CFO, CapEx) and revenue growth")
-    
-    # Margin/profitability questions
-    if "margin" in entities or any(kw in question_lower for kw in ["margin", "profitability", "ebitda"]):
-        selected_params["gross_margin"] = {
-            "distribution": dists["gross_margin"],
-            "reasoning": "Gross margin is fundamental to profitability analysis",
-            "impact": "Directly determines gross profit"
-        }
-        selected_params["opex_ratio"] = {
-            "distribution": dists["opex_ratio"],
-            "reasoning": "Operating expense ratio determines operating margin",
-            "impact": "Affects operating income and EBITDA"
-        }
-        selected_params["revenue_growth"] = {
-            "distribution": dists["revenue_growth"],
-            "reasoning": "Revenue growth affects scale and margin calculations",
-            "impact": "Influences margin percentages through revenue base"
-        }
-        reasoning.append("Margin question requires gross margin, opex ratio, and revenue growth")
-    
-    # Risk/volatility questions
-    if "risk" in question_lower or "volatility" in question_lower or intent == "probability_assessment":
-        # Include all parameters for comprehensive risk analysis
-        for param_name in ["revenue_growth", "gross_margin", "opex_ratio", "cash_conversion", "capex_ratio"]:
-            if param_name in dists:
-                selected_params[param_name] = {
-                    "distribution": dists[param_name],
-                    "reasoning": f"{param_name} contributes to overall financial risk and uncertainty",
-                    "impact": "Part of comprehensive risk assessment"
-                }
-        reasoning.append("Risk assessment requires all parameters for comprehensive uncertainty analysis")
+    hits = _question_hits(question_data["original_question"])
+    analysis = question_data.get("nlp_analysis", {})
+    entities = analysis.get("detected_entities", [])
+    intent = analysis.get("intent", "")
+    
+    active_groups: List[str] = []
+    if "revenue" in entities or "revenue" in hits:
+        active_groups.append("revenue")
+    if "cash" in entities or not hits.isdisjoint(("cash", "liquidity", "runway", "buffer")):
+        active_groups.append("cash")
+    if "margin" in entities or not hits.isdisjoint(("margin", "profitability", "ebitda")):
+        active_groups.append("margin")
+    if "risk" in hits or "volatility" in hits or intent == "probability_assessment":
+        active_groups.append("risk")
+    
+    # A parameter keeps its first position but takes the explanation of the
+    # last group that selects it; distributions are attached once at the end.
+    chosen: Dict[str, Dict] = {}
+    for group in active_groups:
+        group_reasoning, group_params = PARAMETER_GROUPS[group]
+        chosen.update(group_params)
+        reasoning.append(group_reasoning)
+    selected_params = {
+        name: {"distribution": dists[name], **meta}
+        for name, meta in chosen.items()
+        if name in dists
+    }
     
     # If no specific entities detected, use all parameters
     if not selected_params:
-        for param_name in dists.keys():
-            selected_params[param_name] = {
-                "distribution": dists[param_name],
-                "reasoning": "General question requires comprehensive parameter set",
-                "impact": "Provides complete financial picture"
-            }
+        selected_params = {
+            name: {"distribution": dist, **_GENERIC_PARAM_META}
+            for name, dist in dists.items()
+        }
         reasoning.append("General question - using all available parameters for comprehensive analysis")
     
     return {
@@ -484,245 +683,476 @@ def select_monte_carlo_parameters(question_data: Dict, base: Dict, dists: Dict)
 # ANSWER GENERATION FUNCTIONS
 # =====================================================
 
-def answer_revenue_growth_risk(question_data: Dict, sim_data: Dict) -> Dict:
-    """Answer questions about revenue and growth risk"""
-    base = sim_data["base"]
-    revenue = sim_data["revenue"]
-    revenue_growth = sim_data["revenue_growth"]
-    
-    answer = {
+SUMMARY_PERCENTILES = (5, 10, 50, 90, 95)
+# Series summarised in the raw_data block of the comprehensive response
+DISTRIBUTION_STAT_KEYS = ("revenue", "cash")
+MARGIN_STAT_KEYS = ("gross_margin", "operating_margin")
+RISK_DRIVER_KEYS = ("revenue", "gross_margin", "operating_margin", "cash", "opex")
+
+
+def _sorted_sim(sim_data: Dict, key: str) -> np.ndarray:
+    """Sorted copy of a simulated series, made once and kept on sim_data."""
+    cache = sim_data.setdefault("_sorted", {})
+    values = cache.get(key)
+    if values is None:
+        values = cache[key] = np.sort(sim_data[key])
+    return values
+
+
+def _sim_percentiles(sim_data: Dict, key: str, percentiles) -> List[float]:
+    """np.percentile of a simulated series, read off its cached sorted copy."""
+    return sorted_percentiles(_sorted_sim(sim_data, key), percentiles)
+
+
+def _sim_percentile(sim_data: Dict, key: str, percentile: float) -> float:
+    return _sim_percentiles(sim_data, key, (percentile,))[0]
+
+
+def _sim_prob_below(sim_data: Dict, key: str, threshold: float) -> float:
+    """Share of simulations where the series is below threshold (binary search)."""
+    return sorted_prob_below(_sorted_sim(sim_data, key), threshold)
+
+
+def _sim_moments(sim_data: Dict, key: str) -> Tuple[np.float64, np.float64]:
+    """(mean, std) of a simulated series, computed once and kept on sim_data."""
+    cache = sim_data.setdefault("_moments", {})
+    moments = cache.get(key)
+    if moments is None:
+        values = sim_data[key]
+        moments = cache[key] = (values.mean(), values.std())
+    return moments
+
+
+def _prime_sim_moments(sim_data: Dict, keys) -> None:
+    """Fill the moment cache for several series with one stacked mean/std."""
+    moments = sim_data.setdefault("_moments", {})
+    missing = [key for key in keys if key not in moments]
+    if missing:
+        stacked = np.stack([sim_data[key] for key in missing])
+        for key, mean, std in zip(missing, stacked.mean(axis=1), stacked.std(axis=1)):
+            moments[key] = (mean, std)
+
+
+def _prime_sim_stats(sim_data: Dict, keys) -> None:
+    """
+    Fill the moment and sorted caches for several series with one stacked
+    mean/std/sort instead of a separate numpy call per series and statistic.
+    """
+    _prime_sim_moments(sim_data, keys)
+    ordered = sim_data.setdefault("_sorted", {})
+    missing = [key for key in keys if key not in ordered]
+    if missing:
+        stacked = np.sort(np.stack([sim_data[key] for key in missing]), axis=1)
+        for key, values in zip(missing, stacked):
+            ordered[key] = values
+
+
+def _sim_cv(sim_data: Dict, key: str) -> float:
+    """Coefficient of variation (std / mean) of a simulated series."""
+    mean, std = _sim_moments(sim_data, key)
+    return float(std / mean)
+
+
+def _distribution_stats(sim_data: Dict, key: str) -> Dict:
+    """Mean/median/std/min/max and tail percentiles of a simulated series."""
+    mean, std = _sim_moments(sim_data, key)
+    ordered = _sorted_sim(sim_data, key)
+    p5, p10, median, p90, p95 = _sim_percentiles(sim_data, key, SUMMARY_PERCENTILES)
+    return {
+        "mean": float(mean),
+        "median": median,
+        "std": float(std),
+        "min": float(ordered[0]),
+        "max": float(ordered[-1]),
+        "p5": p5,
+        "p10": p10,
+        "p90": p90,
+        "p95": p95
+    }
+
+
+def _margin_stats(sim_data: Dict, key: str) -> Dict:
+    mean, std = _sim_moments(sim_data, key)
+    return {
+        "mean": float(mean),
+        "median": _sim_percentile(sim_data, key, 50),
+        "std": float(std)
+    }
+
+
+def _raw_data_stats(sim_data: Dict) -> Dict:
+    raw_data = {f"{key}_statistics": _distribution_stats(sim_data, key) for key in DISTRIBUTION_STAT_KEYS}
+    raw_data.update({f"{key}_statistics": _margin_stats(sim_data, key) for key in MARGIN_STAT_KEYS})
+    return raw_data
+
+
+RISK_LEVELS = ("low", "medium", "high")
+
+
+def _risk_bucket(value: float, medium_above: float, high_above: float) -> int:
+    """Index into RISK_LEVELS: 0 up to medium_above, 1 up to high_above, 2 beyond."""
+    return int(value > medium_above) + int(value > high_above)
+
+
+def _risk_level(value: float, medium_above: float, high_above: float) -> str:
+    return RISK_LEVELS[_risk_bucket(value, medium_above, high_above)]
+
+
+def _new_answer(question_data: Dict, **extra) -> Dict:
+    return {
         "question": question_data["original_question"],
         "category": question_data["category"],
         "answer": {},
         "reasoning": "",
-        "metrics": {}
+        **extra
     }
-    
-    if question_data["question_type"] == "revenue_below_threshold":
-        if question_data["parameters"].get("threshold_type") == "last_quarter":
-            threshold = base["revenue"]
-            prob = float(np.mean(revenue < threshold))
-            answer["answer"] = {
-                "probability": prob,
-                "percentage": prob * 100,
-                "threshold": threshold,
-                "interpretation": "high" if prob > 0.3 else "medium" if prob > 0.1 else "low"
-            }
-            answer["reasoning"] = f"Based on {NUM_SIMULATIONS:,} simulations, there is a {prob*100:.1f}% probability that revenue will fall below last quarter's level of {threshold:,.0f}. "
-        else:
-            threshold = question_data["parameters"].get("threshold", base["revenue"] * 0.9)
-            prob = float(np.mean(revenue < threshold))
-            answer["answer"] = {"probability": prob, "threshold": threshold}
-            answer["reasoning"] = f"Probability of revenue falling below {threshold:,.0f} is {prob*100:.1f}%."
-        
-        answer["metrics"] = {
-            "p5_revenue": float(np.percentile(revenue, 5)),
-            "p10_revenue": float(np.percentile(revenue, 10)),
-            "median_revenue": float(np.median(revenue)),
-            "p90_revenue": float(np.percentile(revenue, 90)),
-            "p95_revenue": float(np.percentile(revenue, 95))
-        }
-    
-    elif question_data["question_type"] == "revenue_range":
-        p10 = float(np.percentile(revenue, 10))
-        p90 = float(np.percentile(revenue, 90))
-        median = float(np.median(revenue))
-        answer["answer"] = {
-            "p10_revenue": p10,
-            "p90_revenue": p90,
-            "median_revenue": median,
-            "range": p90 - p10,
-            "confidence_interval": "80%"
-        }
-        answer["reasoning"] = f"Expected revenue range (P10-P90) is {p10:,.0f} to {p90:,.0f}, with median of {median:,.0f}. This represents an 80% confidence interval."
-    
-    elif question_data["question_type"] == "revenue_volatility":
-        cv = float(np.std(revenue) / np.mean(revenue))
-        historical_revenues = [base["revenue"]]
-        historical_cv = 0.0  # Would need historical data
-        answer["answer"] = {
-            "coefficient_of_variation": cv,
-            "volatility_level": "high" if cv > 0.2 else "medium" if cv > 0.1 else "low",
-            "std_dev": float(np.std(revenue))
-        }
-        answer["reasoning"] = f"Revenue volatility (coefficient of variation) is {cv:.3f}, indicating {'high' if cv > 0.2 else 'medium' if cv > 0.1 else 'low'} volatility."
-    
-    elif question_data["question_type"] == "downside_revenue_risk":
-        slowdown = question_data["parameters"].get("slowdown_pct", 5) / 100
-        adjusted_growth = revenue_growth - slowdown
-        adjusted_revenue = base["revenue"] * (1 + adjusted_growth)
-        prob_negative = float(np.mean(adjusted_revenue < base["revenue"]))
-        answer["answer"] = {
-            "slowdown_scenario": f"{slowdown*100}%",
-            "probability_revenue_declines": prob_negative,
-            "expected_revenue": float(np.mean(adjusted_revenue))
-        }
-        answer["reasoning"] = f"If growth slows by {slowdown*100}%, there is a {prob_negative*100:.1f}% probability revenue will decline."
-    
+
+
+def _answer_by_type(question_data: Dict, sim_data: Dict, handlers: Dict, answer: Dict) -> Dict:
+    # Unrecognised question types keep the empty answer skeleton
+    handler = handlers.get(question_data["question_type"])
+    if handler is not None:
+        handler(question_data, sim_data, answer)
     return answer
 
 
-def answer_cost_margin_pressure(question_data: Dict, sim_data: Dict) -> Dict:
-    """Answer questions about cost and margin pressure"""
+# Revenue & growth risk answers
+
+def _revenue_below_threshold(question_data: Dict, sim_data: Dict, answer: Dict) -> None:
     base = sim_data["base"]
-    gross_margin = sim_data["gross_margin"]
-    operating_margin = sim_data["operating_margin"]
-    ebitda = sim_data["ebitda"]
-    opex = sim_data["opex"]
-    
-    answer = {
-        "question": question_data["original_question"],
-        "category": question_data["category"],
-        "answer": {},
-        "reasoning": ""
-    }
-    
-    if question_data["question_type"] == "gross_margin_below":
-        threshold = question_data["parameters"].get("threshold", 30)
-        prob = float(np.mean(gross_margin < threshold))
+    if question_data["parameters"].get("threshold_type") == "last_quarter":
+        threshold = base["revenue"]
+        prob = _sim_prob_below(sim_data, "revenue", threshold)
         answer["answer"] = {
             "probability": prob,
+            "percentage": prob * 100,
             "threshold": threshold,
-            "p5_gross_margin": float(np.percentile(gross_margin, 5)),
-            "median_gross_margin": float(np.median(gross_margin))
+            "interpretation": _risk_level(prob, 0.1, 0.3)
         }
-        answer["reasoning"] = f"Probability of gross margin falling below {threshold}% is {prob*100:.1f}%. Median gross margin is {float(np.median(gross_margin)):.1f}%."
-    
-    elif question_data["question_type"] == "worst_case_operating_margin":
-        p5 = float(np.percentile(operating_margin, 5))
-        p1 = float(np.percentile(operating_margin, 1))
-        answer["answer"] = {
-            "worst_case_5th_percentile": p5,
-            "worst_case_1st_percentile": p1,
-            "median": float(np.median(operating_margin))
-        }
-        answer["reasoning"] = f"Worst-case operating margin (5th percentile) is {p5:.1f}%, with extreme worst case (1st percentile) at {p1:.1f}%."
-    
-    elif question_data["question_type"] == "cost_component_risk":
-        # Analyze which cost component contributes most to margin risk
-        opex_volatility = float(np.std(opex) / np.mean(opex))
-        answer["answer"] = {
-            "primary_risk_driver": "operating_expenses",
-            "opex_volatility": opex_volatility,
-            "recommendation": "Monitor operating expense ratios closely"
-        }
-        answer["reasoning"] = f"Operating expenses show volatility of {opex_volatility:.3f}, making it the primary margin risk driver."
+        answer["reasoning"] = f"Based on {NUM_SIMULATIONS:,} simulations, there is a {prob*100:.1f}% probability that revenue will fall below last quarter's level of {threshold:,.0f}. "
+    else:
+        threshold = question_data["parameters"].get("threshold", base["revenue"] * 0.9)
+        prob = _sim_prob_below(sim_data, "revenue", threshold)
+        answer["answer"] = {"probability": prob, "threshold": threshold}
+        answer["reasoning"] = f"Probability of revenue falling below {threshold:,.0f} is {prob*100:.1f}%."
     
-    return answer
+    p5, p10, median, p90, p95 = _sim_percentiles(sim_data, "revenue", SUMMARY_PERCENTILES)
+    answer["metrics"] = {
+        "p5_revenue": p5,
+        "p10_revenue": p10,
+        "median_revenue": median,
+        "p90_revenue": p90,
+        "p95_revenue": p95
+    }
 
 
-def answer_cash_flow_liquidity(question_data: Dict, sim_data: Dict) -> Dict:
-    """Answer questions about cash flow and liquidity"""
+def _revenue_range(question_data: Dict, sim_data: Dict, answer: Dict) -> None:
+    p10, median, p90 = _sim_percentiles(sim_data, "revenue", (10, 50, 90))
+    answer["answer"] = {
+        "p10_revenue": p10,
+        "p90_revenue": p90,
+        "median_revenue": median,
+        "range": p90 - p10,
+        "confidence_interval": "80%"
+    }
+    answer["reasoning"] = f"Expected revenue range (P10-P90) is {p10:,.0f} to {p90:,.0f}, with median of {median:,.0f}. This represents an 80% confidence interval."
+
+
+def _revenue_volatility(question_data: Dict, sim_data: Dict, answer: Dict) -> None:
+    cv = _sim_cv(sim_data, "revenue")
+    level = _risk_level(cv, 0.1, 0.2)
+    answer["answer"] = {
+        "coefficient_of_variation": cv,
+        "volatility_level": level,
+        "std_dev": float(_sim_moments(sim_data, "revenue")[1])
+    }
+    answer["reasoning"] = f"Revenue volatility (coefficient of variation) is {cv:.3f}, indicating {level} volatility."
+
+
+def _downside_revenue_risk(question_data: Dict, sim_data: Dict, answer: Dict) -> None:
     base = sim_data["base"]
-    cash = sim_data["cash"]
+    slowdown = question_data["parameters"].get("slowdown_pct", 5) / 100
+    # base * (1 + growth - slowdown) < base  <=>  growth < slowdown, and the
+    # mean is linear, so neither needs the adjusted revenue array
+    prob_negative = _sim_prob_below(sim_data, "revenue_growth", slowdown)
+    growth_mean, _ = _sim_moments(sim_data, "revenue_growth")
+    answer["answer"] = {
+        "slowdown_scenario": f"{slowdown*100}%",
+        "probability_revenue_declines": prob_negative,
+        "expected_revenue": float(base["revenue"] * (1 + (growth_mean - slowdown)))
+    }
+    answer["reasoning"] = f"If growth slows by {slowdown*100}%, there is a {prob_negative*100:.1f}% probability revenue will decline."
+
+
+_REVENUE_GROWTH_ANSWERS = {
+    "revenue_below_threshold": _revenue_below_threshold,
+    "revenue_range": _revenue_range,
+    "revenue_volatility": _revenue_volatility,
+    "downside_revenue_risk": _downside_revenue_risk,
+}
+
+
+def answer_revenue_growth_risk(question_data: Dict, sim_data: Dict) -> Dict:
+    """Answer questions about revenue and growth risk"""
+    answer = _new_answer(question_data, metrics={})
+    return _answer_by_type(question_data, sim_data, _REVENUE_GROWTH_ANSWERS, answer)
+
+
+# Cost & margin pressure answers
+
+def _gross_margin_below(question_data: Dict, sim_data: Dict, answer: Dict) -> None:
+    threshold = question_data["parameters"].get("threshold", 30)
+    prob = _sim_prob_below(sim_data, "gross_margin", threshold)
+    p5_margin, median_margin = _sim_percentiles(sim_data, "gross_margin", (5, 50))
+    answer["answer"] = {
+        "probability": prob,
+        "threshold": threshold,
+        "p5_gross_margin": p5_margin,
+        "median_gross_margin": median_margin
+    }
+    answer["reasoning"] = f"Probability of gross margin falling below {threshold}% is {prob*100:.1f}%. Median gross margin is {median_margin:.1f}%."
+
+
+def _worst_case_operating_margin(question_data: Dict, sim_data: Dict, answer: Dict) -> None:
+    p1, p5, median = _sim_percentiles(sim_data, "operating_margin", (1, 5, 50))
+    answer["answer"] = {
+        "worst_case_5th_percentile": p5,
+        "worst_case_1st_percentile": p1,
+        "median": median
+    }
+    answer["reasoning"] = f"Worst-case operating margin (5th percentile) is {p5:.1f}%, with extreme worst case (1st percentile) at {p1:.1f}%."
+
+
+def _cost_component_risk(question_data: Dict, sim_data: Dict, answer: Dict) -> None:
+    # Analyze which cost component contributes most to margin risk
+    opex_volatility = _sim_cv(sim_data, "opex")
+    answer["answer"] = {
+        "primary_risk_driver": "operating_expenses",
+        "opex_volatility": opex_volatility,
+        "recommendation": "Monitor operating expense ratios closely"
+    }
+    answer["reasoning"] = f"Operating expenses show volatility of {opex_volatility:.3f}, making it the primary margin risk driver."
+
+
+_COST_MARGIN_ANSWERS = {
+    "gross_margin_below": _gross_margin_below,
+    "worst_case_operating_margin": _worst_case_operating_margin,
+    "cost_component_risk": _cost_component_risk,
+}
+
+
+def answer_cost_margin_pressure(question_data: Dict, sim_data: Dict) -> Dict:
+    """Answer questions about cost and margin pressure"""
+    return _answer_by_type(question_data, sim_data, _COST_MARGIN_ANSWERS, _new_answer(question_data))
+
+
+# Cash flow & liquidity answers
+
+def _cash_below_threshold(question_data: Dict, sim_data: Dict, answer: Dict) -> None:
+    base = sim_data["base"]
+    if question_data["parameters"].get("threshold_type") == "minimum":
+        threshold = base.get("min_cash_buffer_for_hiring", base["cash"] * 0.3)
+    else:
+        threshold = question_data["parameters"].get("threshold", base["cash"] * 0.5)
+    prob = _sim_prob_below(sim_data, "cash", threshold)
+    p5_cash, median_cash = _sim_percentiles(sim_data, "cash", (5, 50))
+    answer["answer"] = {
+        "probability": prob,
+        "threshold": threshold,
+        "p5_cash": p5_cash,
+        "median_cash": median_cash
+    }
+    answer["reasoning"] = f"Probability of cash falling below {threshold:,.0f} is {prob*100:.1f}%. 5th percentile cash is {p5_cash:,.0f}."
+
+
+def _cash_runway(question_data: Dict, sim_data: Dict, answer: Dict) -> None:
+    # Calculate months of runway based on burn rate
+    # Mean of the negative cash flows, without gathering them into a new array
     cash_flow = sim_data["cash_flow"]
-    
-    answer = {
-        "question": question_data["original_question"],
-        "category": question_data["category"],
-        "answer": {},
-        "reasoning": ""
+    burning = np.count_nonzero(cash_flow < 0)
+    if burning:
+        monthly_burn = float(-np.minimum(cash_flow, 0.0).sum() / burning)
+    else:
+        monthly_burn = sim_data["base"]["cash"] / 12
+    if monthly_burn > 0:
+        p5_cash, median_cash = _sim_percentiles(sim_data, "cash", (5, 50))
+        runway_p5 = p5_cash / monthly_burn
+        runway_median = median_cash / monthly_burn
+    else:
+        runway_p5 = float("inf")
+        runway_median = float("inf")
+    answer["answer"] = {
+        "runway_months_p5": runway_p5,
+        "runway_months_median": runway_median,
+        "monthly_burn_rate": monthly_burn
     }
+    answer["reasoning"] = f"In downside scenarios (5th percentile), cash runway is {runway_p5:.1f} months. Median runway is {runway_median:.1f} months."
+
+
+def _liquidity_crunch(question_data: Dict, sim_data: Dict, answer: Dict) -> None:
+    prob_negative = _sim_prob_below(sim_data, "cash", 0)
+    prob_low = _sim_prob_below(sim_data, "cash", sim_data["base"]["cash"] * 0.3)
+    level = _risk_level(prob_negative, 0.05, 0.15)
+    answer["answer"] = {
+        "probability_negative_cash": prob_negative,
+        "probability_low_liquidity": prob_low,
+        "risk_level": level
+    }
+    answer["reasoning"] = f"Probability of liquidity crunch (negative cash) is {prob_negative*100:.1f}%, indicating {level} risk."
+
+
+_CASH_FLOW_ANSWERS = {
+    "cash_below_threshold": _cash_below_threshold,
+    "cash_runway": _cash_runway,
+    "liquidity_crunch": _liquidity_crunch,
+}
+
+
+def answer_cash_flow_liquidity(question_data: Dict, sim_data: Dict) -> Dict:
+    """Answer questions about cash flow and liquidity"""
+    return _answer_by_type(question_data, sim_data, _CASH_FLOW_ANSWERS, _new_answer(question_data))
+
+
+# Risk attribution answers
+
+def _top_risk_drivers(question_data: Dict, sim_data: Dict, answer: Dict) -> None:
+    top_n = question_data["parameters"].get("top_n", 3)
     
-    if question_data["question_type"] == "cash_below_threshold":
-        if question_data["parameters"].get("threshold_type") == "minimum":
-            threshold = base.get("min_cash_buffer_for_hiring", base["cash"] * 0.3)
-        else:
-            threshold = question_data["parameters"].get("threshold", base["cash"] * 0.5)
-        prob = float(np.mean(cash < threshold))
-        answer["answer"] = {
-            "probability": prob,
-            "threshold": threshold,
-            "p5_cash": float(np.percentile(cash, 5)),
-            "median_cash": float(np.median(cash))
-        }
-        answer["reasoning"] = f"Probability of cash falling below {threshold:,.0f} is {prob*100:.1f}%. 5th percentile cash is {float(np.percentile(cash, 5)):,.0f}."
-    
-    elif question_data["question_type"] == "cash_runway":
-        # Calculate months of runway based on burn rate
-        monthly_burn = -np.mean(cash_flow[cash_flow < 0]) if np.any(cash_flow < 0) else base["cash"] / 12
-        if monthly_burn > 0:
-            runway_p5 = float(np.percentile(cash, 5)) / monthly_burn
-            runway_median = float(np.median(cash)) / monthly_burn
-        else:
-            runway_p5 = float("inf")
-            runway_median = float("inf")
-        answer["answer"] = {
-            "runway_months_p5": runway_p5,
-            "runway_months_median": runway_median,
-            "monthly_burn_rate": monthly_burn
-        }
-        answer["reasoning"] = f"In downside scenarios (5th percentile), cash runway is {runway_p5:.1f} months. Median runway is {runway_median:.1f} months."
-    
-    elif question_data["question_type"] == "liquidity_crunch":
-        prob_negative = float(np.mean(cash < 0))
-        prob_low = float(np.mean(cash < base["cash"] * 0.3))
-        answer["answer"] = {
-            "probability_negative_cash": prob_negative,
-            "probability_low_liquidity": prob_low,
-            "risk_level": "high" if prob_negative > 0.15 else "medium" if prob_negative > 0.05 else "low"
-        }
-        answer["reasoning"] = f"Probability of liquidity crunch (negative cash) is {prob_negative*100:.1f}%, indicating {'high' if prob_negative > 0.15 else 'medium' if prob_negative > 0.05 else 'low'} risk."
+    # Calculate risk contributions (coefficient of variation); opex is the
+    # only series not already primed by answer_question
+    _prime_sim_moments(sim_data, RISK_DRIVER_KEYS)
+    gross_margin_mean, gross_margin_std = _sim_moments(sim_data, "gross_margin")
+    operating_margin_mean, operating_margin_std = _sim_moments(sim_data, "operating_margin")
+    cash_mean, cash_std = _sim_moments(sim_data, "cash")
+    risks = {
+        "revenue_volatility": _sim_cv(sim_data, "revenue"),
+        "gross_margin_volatility": float(gross_margin_std / gross_margin_mean) if gross_margin_mean > 0 else 0,
+        "operating_margin_volatility": float(operating_margin_std / operating_margin_mean) if operating_margin_mean > 0 else 0,
+        "cash_volatility": float(cash_std / np.abs(cash_mean)) if cash_mean != 0 else 0,
+        "opex_volatility": _sim_cv(sim_data, "opex")
+    }
     
-    return answer
+    sorted_risks = sorted(risks.items(), key=lambda x: x[1], reverse=True)[:top_n]
+    answer["answer"] = {
+        "top_risk_drivers": [{"driver": k, "volatility": v} for k, v in sorted_risks],
+        "recommendation": f"Focus on managing {sorted_risks[0][0]} as it shows highest volatility"
+    }
+    answer["reasoning"] = f"Top {top_n} risk drivers ranked by volatility: {', '.join([f'{k} ({v:.3f})' for k, v in sorted_risks])}."
+
+
+def _revenue_vs_cost_risk(question_data: Dict, sim_data: Dict, answer: Dict) -> None:
+    rev_vol = _sim_cv(sim_data, "revenue")
+    cost_vol = _sim_cv(sim_data, "opex")
+    answer["answer"] = {
+        "revenue_volatility": rev_vol,
+        "cost_volatility": cost_vol,
+        "primary_risk_source": "revenue" if rev_vol > cost_vol else "costs",
+        "ratio": rev_vol / cost_vol if cost_vol > 0 else float("inf")
+    }
+    answer["reasoning"] = f"Risk is driven more by {'revenue' if rev_vol > cost_vol else 'cost'} volatility ({max(rev_vol, cost_vol):.3f} vs {min(rev_vol, cost_vol):.3f})."
+
+
+_RISK_ATTRIBUTION_ANSWERS = {
+    "top_risk_drivers": _top_risk_drivers,
+    "revenue_vs_cost_risk": _revenue_vs_cost_risk,
+}
 
 
 def answer_risk_attribution(question_data: Dict, sim_data: Dict) -> Dict:
     """Answer questions about risk attribution"""
-    revenue = sim_data["revenue"]
-    revenue_growth = sim_data["revenue_growth"]
-    gross_margin = sim_data["gross_margin"]
-    operating_margin = sim_data["operating_margin"]
-    cash = sim_data["cash"]
-    opex = sim_data["opex"]
-    
-    answer = {
-        "question": question_data["original_question"],
-        "category": question_data["category"],
-        "answer": {},
-        "reasoning": ""
-    }
+    return _answer_by_type(question_data, sim_data, _RISK_ATTRIBUTION_ANSWERS, _new_answer(question_data))
+
+
+def answer_general(question_data: Dict, sim_data: Dict) -> Dict:
+    """Default: comprehensive general analysis with interpretation"""
+    base = sim_data["base"]
+
+    # Calculate risk metrics
+    revenue_cv = _sim_cv(sim_data, "revenue")
+    cash_mean, cash_std = _sim_moments(sim_data, "cash")
+    cash_cv = float(cash_std / np.abs(cash_mean)) if cash_mean != 0 else 0
     
-    if question_data["question_type"] == "top_risk_drivers":
-        top_n = question_data["parameters"].get("top_n", 3)
-        
-        # Calculate risk contributions (coefficient of variation)
-        risks = {
-            "revenue_volatility": float(np.std(revenue) / np.mean(revenue)),
-            "gross_margin_volatility": float(np.std(gross_margin) / np.mean(gross_margin)) if np.mean(gross_margin) > 0 else 0,
-            "operating_margin_volatility": float(np.std(operating_margin) / np.mean(operating_margin)) if np.mean(operating_margin) > 0 else 0,
-            "cash_volatility": float(np.std(cash) / np.abs(np.mean(cash))) if np.mean(cash) != 0 else 0,
-            "opex_volatility": float(np.std(opex) / np.mean(opex))
-        }
-        
-        sorted_risks = sorted(risks.items(), key=lambda x: x[1], reverse=True)[:top_n]
-        answer["answer"] = {
-            "top_risk_drivers": [{"driver": k, "volatility": v} for k, v in sorted_risks],
-            "recommendation": f"Focus on managing {sorted_risks[0][0]} as it shows highest volatility"
-        }
-        answer["reasoning"] = f"Top {top_n} risk drivers ranked by volatility: {', '.join([f'{k} ({v:.3f})' for k, v in sorted_risks])}."
+    prob_cash_negative = _sim_prob_below(sim_data, "cash", 0)
+    prob_revenue_decline = _sim_prob_below(sim_data, "revenue", base["revenue"])
+    revenue_p10, revenue_median, revenue_p90 = _sim_percentiles(sim_data, "revenue", (10, 50, 90))
+    cash_p5, cash_median, cash_p95 = _sim_percentiles(sim_data, "cash", (5, 50, 95))
     
-    elif question_data["question_type"] == "revenue_vs_cost_risk":
-        rev_vol = float(np.std(revenue) / np.mean(revenue))
-        cost_vol = float(np.std(opex) / np.mean(opex))
-        answer["answer"] = {
-            "revenue_volatility": rev_vol,
-            "cost_volatility": cost_vol,
-            "primary_risk_source": "revenue" if rev_vol > cost_vol else "costs",
-            "ratio": rev_vol / cost_vol if cost_vol > 0 else float("inf")
-        }
-        answer["reasoning"] = f"Risk is driven more by {'revenue' if rev_vol > cost_vol else 'cost'} volatility ({max(rev_vol, cost_vol):.3f} vs {min(rev_vol, cost_vol):.3f})."
+    # Interpret risk levels
+    revenue_bucket = _risk_bucket(revenue_cv, 0.15, 0.25)
+    cash_bucket = _risk_bucket(prob_cash_negative, 0.05, 0.15)
+    revenue_risk_level = RISK_LEVELS[revenue_bucket].upper()
+    cash_risk_level = RISK_LEVELS[cash_bucket].upper()
+    revenue_is_primary = revenue_cv > cash_cv
     
-    return answer
+    return {
+        "question": question_data["original_question"],
+        "category": CATEGORY_GENERAL,
+        "answer": {
+            "revenue_risk_assessment": {
+                "risk_level": revenue_risk_level,
+                "coefficient_of_variation": revenue_cv,
+                "interpretation": f"Revenue shows {revenue_risk_level.lower()} volatility (CV: {revenue_cv:.3f}). "
+                                f"{('Low', 'Moderate', 'High')[revenue_bucket]} variability indicates "
+                                f"{('relatively stable', 'moderate uncertainty', 'significant uncertainty')[revenue_bucket]} in revenue projections.",
+                "probability_revenue_declines": prob_revenue_decline,
+                "expected_revenue_range": {
+                    "p10": revenue_p10,
+                    "median": revenue_median,
+                    "p90": revenue_p90
+                }
+            },
+            "cash_risk_assessment": {
+                "risk_level": cash_risk_level,
+                "probability_negative_cash": prob_cash_negative,
+                "interpretation": f"Cash position shows {cash_risk_level.lower()} risk. "
+                                f"There is a {prob_cash_negative*100:.1f}% probability of negative cash, "
+                                f"which indicates {('low', 'moderate', 'significant')[cash_bucket]} liquidity risk.",
+                "cash_range": {
+                    "p5": cash_p5,
+                    "median": cash_median,
+                    "p95": cash_p95
+                }
+            },
+            "overall_assessment": {
+                "primary_risk": "revenue_volatility" if revenue_is_primary else "cash_liquidity",
+                "recommendation": f"Focus on managing {'revenue volatility' if revenue_is_primary else 'cash liquidity'} as the primary risk driver."
+            }
+        },
+        "reasoning": f"""
+Based on {NUM_SIMULATIONS:,} Monte Carlo simulations:
+
+REVENUE RISK: Your revenue shows {revenue_risk_level.lower()} volatility with a coefficient of variation of {revenue_cv:.3f}. 
+This means revenue can vary significantly from projections. There is a {prob_revenue_decline*100:.1f}% probability 
+that revenue will decline compared to current levels.
+
+CASH RISK: Your cash position shows {cash_risk_level.lower()} risk with a {prob_cash_negative*100:.1f}% probability 
+of going negative. The 5th percentile cash position is {cash_p5:,.0f}, indicating 
+the worst-case scenario you should prepare for.
+
+RECOMMENDATION: {'Focus on revenue stability and diversification' if revenue_is_primary else 'Build cash reserves and manage liquidity carefully'} 
+to mitigate the primary risk factor.
+        """.strip()
+    }
+
+
+_CATEGORY_ANSWERS = {
+    CATEGORY_REVENUE_GROWTH_RISK: answer_revenue_growth_risk,
+    CATEGORY_COST_MARGIN_PRESSURE: answer_cost_margin_pressure,
+    CATEGORY_CASH_FLOW_LIQUIDITY: answer_cash_flow_liquidity,
+    CATEGORY_RISK_ATTRIBUTION: answer_risk_attribution,
+}
+
 
 # =====================================================
 # MAIN ANSWER FUNCTION
 # =====================================================
 
-def answer_question(question: str, generate_plot: bool = True) -> Dict:
+def answer_question(question: str, generate_plot: bool = True, verbose: bool = True) -> Dict:
     """
     Main function to answer any financial question using Monte Carlo simulation.
-    Returns comprehensive JSON with all analysis, data, and decision reasoning.
+    Returns comprehensive JSON with all analysis, data, and decision reasoning;
+    verbose=False leaves out the raw_data statistics and decision_reasoning
+    blocks, and the work of building them, for callers that only need the answer.
     
     QUERY ANALYSIS PROCESS:
     1. NLP Parsing: Advanced natural language understanding to extract entities, intent, parameters
@@ -736,16 +1166,16 @@ def answer_question(question: str, generate_plot: bool = True) -> Dict:
     question_data = parse_question(question)
     
     # Early return for non-financial questions
-    if question_data["category"] == "non_financial":
+    if question_data["category"] == CATEGORY_NON_FINANCIAL:
         return {
             "query_analysis": {
                 "original_question": question_data["original_question"],
-                "category": "non_financial",
+                "category": CATEGORY_NON_FINANCIAL,
                 "nlp_analysis": question_data.get("nlp_analysis", {})
             },
             "analysis_results": {
                 "question": question,
-                "category": "non_financial",
+                "category": CATEGORY_NON_FINANCIAL,
                 "answer": {
                     "message": "This question is not related to financial analysis. Please ask a question about revenue, cash, margins, costs, risk, or other financial metrics."
                 },
@@ -754,111 +1184,36 @@ def answer_question(question: str, generate_plot: bool = True) -> Dict:
         }
     
     # Load data
-    df = load_financials(CSV_PATH)
-    base = derive_historical_metrics(df)
-    dists = build_distributions(base)
+    base, dists = load_base_and_distributions(CSV_PATH)
     
     # Dynamically select parameters based on question understanding
     param_selection = select_monte_carlo_parameters(question_data, base, dists)
     
     # Run simulations (all parameters are always simulated, but we track which are relevant)
     sim_data = run_monte_carlo_simulations(base, dists)
+    _prime_sim_stats(sim_data, DISTRIBUTION_STAT_KEYS + MARGIN_STAT_KEYS)
     
     # Route to appropriate answer function
-    if question_data["category"] == "revenue_growth_risk":
-        answer = answer_revenue_growth_risk(question_data, sim_data)
-    elif question_data["category"] == "cost_margin_pressure":
-        answer = answer_cost_margin_pressure(question_data, sim_data)
-    elif question_data["category"] == "cash_flow_liquidity":
-        answer = answer_cash_flow_liquidity(question_data, sim_data)
-    elif question_data["category"] == "risk_attribution":
-        answer = answer_risk_attribution(question_data, sim_data)
-    else:
-        # Default: comprehensive general analysis with interpretation
-        revenue = sim_data["revenue"]
-        cash = sim_data["cash"]
-        revenue_growth = sim_data["revenue_growth"]
-        gross_margin = sim_data["gross_margin"]
-        operating_margin = sim_data["operating_margin"]
-        
-        # Calculate risk metrics
-        revenue_cv = float(np.std(revenue) / np.mean(revenue))
-        cash_cv = float(np.std(cash) / np.abs(np.mean(cash))) if np.mean(cash) != 0 else 0
-        
-        prob_cash_negative = float(np.mean(cash < 0))
-        prob_revenue_decline = float(np.mean(revenue < sim_data["base"]["revenue"]))
-        
-        # Interpret risk levels
-        revenue_risk_level = "HIGH" if revenue_cv > 0.25 else "MEDIUM" if revenue_cv > 0.15 else "LOW"
-        cash_risk_level = "HIGH" if prob_cash_negative > 0.15 else "MEDIUM" if prob_cash_negative > 0.05 else "LOW"
-        
-        answer = {
-            "question": question,
-            "category": "general",
-            "answer": {
-                "revenue_risk_assessment": {
-                    "risk_level": revenue_risk_level,
-                    "coefficient_of_variation": revenue_cv,
-                    "interpretation": f"Revenue shows {revenue_risk_level.lower()} volatility (CV: {revenue_cv:.3f}). "
-                                    f"{'High' if revenue_cv > 0.25 else 'Moderate' if revenue_cv > 0.15 else 'Low'} variability indicates "
-                                    f"{'significant uncertainty' if revenue_cv > 0.25 else 'moderate uncertainty' if revenue_cv > 0.15 else 'relatively stable'} in revenue projections.",
-                    "probability_revenue_declines": prob_revenue_decline,
-                    "expected_revenue_range": {
-                        "p10": float(np.percentile(revenue, 10)),
-                        "median": float(np.median(revenue)),
-                        "p90": float(np.percentile(revenue, 90))
-                    }
-                },
-                "cash_risk_assessment": {
-                    "risk_level": cash_risk_level,
-                    "probability_negative_cash": prob_cash_negative,
-                    "interpretation": f"Cash position shows {cash_risk_level.lower()} risk. "
-                                    f"There is a {prob_cash_negative*100:.1f}% probability of negative cash, "
-                                    f"which indicates {'significant liquidity risk' if prob_cash_negative > 0.15 else 'moderate liquidity risk' if prob_cash_negative > 0.05 else 'low liquidity risk'}.",
-                    "cash_range": {
-                        "p5": float(np.percentile(cash, 5)),
-                        "median": float(np.median(cash)),
-                        "p95": float(np.percentile(cash, 95))
-                    }
-                },
-                "overall_assessment": {
-                    "primary_risk": "revenue_volatility" if revenue_cv > cash_cv else "cash_liquidity",
-                    "recommendation": f"Focus on managing {'revenue volatility' if revenue_cv > cash_cv else 'cash liquidity'} as the primary risk driver."
-                }
-            },
-            "reasoning": f"""
-Based on {NUM_SIMULATIONS:,} Monte Carlo simulations:
-
-REVENUE RISK: Your revenue shows {revenue_risk_level.lower()} volatility with a coefficient of variation of {revenue_cv:.3f}. 
-This means revenue can vary significantly from projections. There is a {prob_revenue_decline*100:.1f}% probability 
-that revenue will decline compared to current levels.
-
-CASH RISK: Your cash position shows {cash_risk_level.lower()} risk with a {prob_cash_negative*100:.1f}% probability 
-of going negative. The 5th percentile cash position is {float(np.percentile(cash, 5)):,.0f}, indicating 
-the worst-case scenario you should prepare for.
-
-RECOMMENDATION: {'Focus on revenue stability and diversification' if revenue_cv > cash_cv else 'Build cash reserves and manage liquidity carefully'} 
-to mitigate the primary risk factor.
-            """.strip()
-        }
+    answer = _CATEGORY_ANSWERS.get(question_data["category"], answer_general)(question_data, sim_data)
     
     # Build comprehensive JSON response with all analysis and reasoning
+    analysis = question_data.get("nlp_analysis", {})
     comprehensive_response = {
         "query_analysis": {
             "original_question": question_data["original_question"],
-            "nlp_analysis": question_data.get("nlp_analysis", {}),
+            "nlp_analysis": analysis,
             "category": question_data["category"],
             "question_type": question_data["question_type"],
             "extracted_parameters": question_data["parameters"],
-            "parsing_confidence": question_data.get("nlp_analysis", {}).get("confidence", 0.0)
+            "parsing_confidence": analysis.get("confidence", 0.0)
         },
         "parameter_selection": {
             "selected_parameters": param_selection["selected_parameters"],
             "selection_reasoning": param_selection["reasoning"],
             "all_available_parameters": param_selection["all_available_parameters"],
             "why_these_parameters": f"""
-Based on NLP analysis detecting entities: {question_data.get('nlp_analysis', {}).get('detected_entities', [])} 
-and intent: {question_data.get('nlp_analysis', {}).get('intent', 'unknown')}, 
+Based on NLP analysis detecting entities: {analysis.get('detected_entities', [])} 
+and intent: {analysis.get('intent', 'unknown')}, 
 we selected {len(param_selection['selected_parameters'])} parameters that are most relevant to answer your question.
 Each parameter was chosen because it directly impacts the financial metrics mentioned in your question.
             """.strip()
@@ -880,41 +1235,10 @@ Each parameter was chosen because it directly impacts the financial metrics ment
             }
         },
         "analysis_results": answer,
-        "raw_data": {
-            "revenue_statistics": {
-                "mean": float(np.mean(sim_data["revenue"])),
-                "median": float(np.median(sim_data["revenue"])),
-                "std": float(np.std(sim_data["revenue"])),
-                "min": float(np.min(sim_data["revenue"])),
-                "max": float(np.max(sim_data["revenue"])),
-                "p5": float(np.percentile(sim_data["revenue"], 5)),
-                "p10": float(np.percentile(sim_data["revenue"], 10)),
-                "p90": float(np.percentile(sim_data["revenue"], 90)),
-                "p95": float(np.percentile(sim_data["revenue"], 95))
-            },
-            "cash_statistics": {
-                "mean": float(np.mean(sim_data["cash"])),
-                "median": float(np.median(sim_data["cash"])),
-                "std": float(np.std(sim_data["cash"])),
-                "min": float(np.min(sim_data["cash"])),
-                "max": float(np.max(sim_data["cash"])),
-                "p5": float(np.percentile(sim_data["cash"], 5)),
-                "p10": float(np.percentile(sim_data["cash"], 10)),
-                "p90": float(np.percentile(sim_data["cash"], 90)),
-                "p95": float(np.percentile(sim_data["cash"], 95))
-            },
-            "gross_margin_statistics": {
-                "mean": float(np.mean(sim_data["gross_margin"])),
-                "median": float(np.median(sim_data["gross_margin"])),
-                "std": float(np.std(sim_data["gross_margin"]))
-            },
-            "operating_margin_statistics": {
-                "mean": float(np.mean(sim_data["operating_margin"])),
-                "median": float(np.median(sim_data["operating_margin"])),
-                "std": float(np.std(sim_data["operating_margin"]))
-            }
-        },
-        "decision_reasoning": {
+    }
+    if verbose:
+        comprehensive_response["raw_data"] = _raw_data_stats(sim_data)
+        comprehensive_response["decision_reasoning"] = {
             "why_this_approach": """
 Monte Carlo simulation was chosen because:
 1. Financial forecasting involves multiple uncertain variables
@@ -929,31 +1253,37 @@ Percentiles (P5, P10, P90, P95) show the range of outcomes at different confiden
 Risk levels are classified as: LOW (<5% probability), MEDIUM (5-15%), HIGH (>15%).
             """.strip()
         }
-    }
     
     # Generate plot if requested and relevant (before returning JSON)
     if generate_plot:
+        raw_data = comprehensive_response.get("raw_data")
+
+        def plot_stats(key: str) -> Dict:
+            return raw_data[f"{key}_statistics"] if raw_data else _distribution_stats(sim_data, key)
+
         try:
-            if question_data["category"] in ["revenue_growth_risk", "cash_flow_liquidity", "general"]:
+            if question_data["category"] in (CATEGORY_REVENUE_GROWTH_RISK, CATEGORY_CASH_FLOW_LIQUIDITY, CATEGORY_GENERAL):
                 # Create appropriate plot based on question
                 if "revenue" in question.lower():
-                    plot_revenue_distribution(sim_data)
+                    plot_revenue_distribution(sim_data, plot_stats("revenue"))
                 elif "cash" in question.lower() or "liquidity" in question.lower():
-                    plot_cash_distribution(sim_data)
+                    plot_cash_distribution(sim_data, plot_stats("cash"))
                 else:
-                    # Default: comprehensive plot
+                    # Default: comprehensive plot, drawn from the cash summary
+                    cash_stats = plot_stats("cash")
+                    hired = sim_data.get("hired")
                     results_for_plot = {
                         "starting_cash": base["cash"],
                         "starting_revenue": base["revenue"],
-                        "median_ending_cash": float(np.median(sim_data["cash"])),
-                        "p5_ending_cash": float(np.percentile(sim_data["cash"], 5)),
-                        "p10_ending_cash": float(np.percentile(sim_data["cash"], 10)),
-                        "p90_ending_cash": float(np.percentile(sim_data["cash"], 90)),
-                        "p95_ending_cash": float(np.percentile(sim_data["cash"], 95)),
-                        "probability_cash_negative": float(np.mean(sim_data["cash"] < 0)),
-                        "probability_should_hire": float(np.mean(sim_data.get("hired", [False] * len(sim_data["cash"]))))
+                        "median_ending_cash": cash_stats["median"],
+                        "p5_ending_cash": cash_stats["p5"],
+                        "p10_ending_cash": cash_stats["p10"],
+                        "p90_ending_cash": cash_stats["p90"],
+                        "p95_ending_cash": cash_stats["p95"],
+                        "probability_cash_negative": _sim_prob_below(sim_data, "cash", 0),
+                        "probability_should_hire": float(np.count_nonzero(hired) / hired.size) if hired is not None else 0.0
                     }
-                    plot_monte_carlo_bell_curve(results_for_plot, sim_data["cash"])
+                    plot_monte_carlo_bell_curve(results_for_plot, sim_data["cash"], cash_stats)
         except Exception as e:
             print(f"\n⚠️  Could not generate plot: {e}")
             comprehensive_response["plot_generation"] = {"status": "failed", "error": str(e)}
@@ -7,6 +7,7 @@ Categories: Profitability, Liquidity, Solvency, Efficiency.
 
 import numpy as np
 from typing import Dict, Optional
+from monte_carlo_simulations import sorted_percentiles
 
 
 # ── Health score thresholds (standard financial norms) ──────────────────
@@ -123,12 +124,14 @@ def compute_ratios(base: dict, sim_data: dict, df) -> dict:
     def sim_stats(arr):
         if len(arr) == 0:
             return None
+        # One sort serves all five quantiles
+        p5, p25, median, p75, p95 = sorted_percentiles(np.sort(arr), (5, 25, 50, 75, 95))
         return {
-            "p5": float(np.percentile(arr, 5)),
-            "p25": float(np.percentile(arr, 25)),
-            "median": float(np.median(arr)),
-            "p75": float(np.percentile(arr, 75)),
-            "p95": float(np.percentile(arr, 95)),
+            "p5": p5,
+            "p25": p25,
+            "median": median,
+            "p75": p75,
+            "p95": p95,
             "mean": float(np.mean(arr)),
             "std": float(np.std(arr)),
         }
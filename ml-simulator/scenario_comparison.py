@@ -8,21 +8,23 @@ and returns side-by-side comparison results + visualization.
 import os
 import json
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 from typing import Dict, List, Optional
 from monte_carlo_simulations import (
     load_financials,
     derive_historical_metrics,
     build_distributions,
     run_monte_carlo_simulations,
+    sorted_percentiles,
+    sorted_prob_below,
+    new_figure,
     NUM_SIMULATIONS,
     CSV_PATH,
     OUTPUT_DIR
 )
 
 
+SUMMARY_PERCENTILES = (5, 10, 50, 90, 95)
+
 DEFAULT_OVERLAY_SCENARIO = {
     "name": "Base Case",
     "overrides": {}
@@ -86,10 +88,18 @@ def _summarize_scenario(base: dict, sim_data: dict) -> dict:
     operating_margin = sim_data["operating_margin"]
     cash_flow = sim_data["cash_flow"]
 
-    revenue_cv = float(np.std(revenue) / np.mean(revenue)) if np.mean(revenue) > 0 else 0
-    cash_cv = float(np.std(cash) / np.abs(np.mean(cash))) if np.mean(cash) != 0 else 0
-    prob_cash_negative = float(np.mean(cash < 0))
-    prob_revenue_decline = float(np.mean(revenue < base["revenue"]))
+    revenue_mean, revenue_std = revenue.mean(), revenue.std()
+    cash_mean, cash_std = cash.mean(), cash.std()
+    revenue_cv = float(revenue_std / revenue_mean) if revenue_mean > 0 else 0
+    cash_cv = float(cash_std / np.abs(cash_mean)) if cash_mean != 0 else 0
+
+    # One sort per series serves every percentile and threshold probability
+    revenue_sorted = np.sort(revenue)
+    cash_sorted = np.sort(cash)
+    rev_p5, rev_p10, rev_median, rev_p90, rev_p95 = sorted_percentiles(revenue_sorted, SUMMARY_PERCENTILES)
+    cash_p5, cash_p10, cash_median, cash_p90, cash_p95 = sorted_percentiles(cash_sorted, SUMMARY_PERCENTILES)
+    prob_cash_negative = sorted_prob_below(cash_sorted, 0)
+    prob_revenue_decline = sorted_prob_below(revenue_sorted, base["revenue"])
 
     return {
         "base_metrics": {
@@ -97,24 +107,24 @@ def _summarize_scenario(base: dict, sim_data: dict) -> dict:
             "starting_cash": float(base["cash"]),
         },
         "revenue": {
-            "mean": float(np.mean(revenue)),
-            "median": float(np.median(revenue)),
-            "std": float(np.std(revenue)),
-            "p5": float(np.percentile(revenue, 5)),
-            "p10": float(np.percentile(revenue, 10)),
-            "p90": float(np.percentile(revenue, 90)),
-            "p95": float(np.percentile(revenue, 95)),
+            "mean": float(revenue_mean),
+            "median": rev_median,
+            "std": float(revenue_std),
+            "p5": rev_p5,
+            "p10": rev_p10,
+            "p90": rev_p90,
+            "p95": rev_p95,
             "cv": revenue_cv,
             "prob_decline": prob_revenue_decline,
         },
         "cash": {
-            "mean": float(np.mean(cash)),
-            "median": float(np.median(cash)),
-            "std": float(np.std(cash)),
-            "p5": float(np.percentile(cash, 5)),
-            "p10": float(np.percentile(cash, 10)),
-            "p90": float(np.percentile(cash, 90)),
-            "p95": float(np.percentile(cash, 95)),
+            "mean": float(cash_mean),
+            "median": cash_median,
+            "std": float(cash_std),
+            "p5": cash_p5,
+            "p10": cash_p10,
+            "p90": cash_p90,
+            "p95": cash_p95,
             "cv": cash_cv,
             "prob_negative": prob_cash_negative,
         },
@@ -164,7 +174,7 @@ def plot_comparison_chart(scenario_results: List[dict], base: dict) -> str:
     x = np.arange(n)
     width = 0.25
 
-    fig, axes = plt.subplots(1, 3, figsize=(6 * n + 2, 6))
+    fig, axes = new_figure((6 * n + 2, 6), 1, 3)
     colors = ["#8c52ff", "#ff6b6b", "#4ecdc4", "#ffd93d", "#6c5ce7"]
 
     for idx, (metric_key, title, ylabel, getter) in enumerate([
@@ -217,11 +227,10 @@ def plot_comparison_chart(scenario_results: List[dict], base: dict) -> str:
     fig.suptitle(f"Scenario Comparison (Starting Revenue: {starting_rev:,.0f}, Cash: {starting_cash:,.0f})",
                  fontsize=14, fontweight="bold", y=1.02)
 
-    plt.tight_layout()
+    fig.tight_layout()
     filename = os.path.join(OUTPUT_DIR, "scenario_comparison.png")
-    plt.savefig(filename, dpi=300, bbox_inches="tight")
+    fig.savefig(filename, dpi=300, bbox_inches="tight")
     print(f"Scenario comparison chart saved to '{filename}'")
-    plt.close()
     return filename
 
 
@@ -8,15 +8,15 @@ to identify which drivers have the largest effect on financial outcomes.
 import os
 import json
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 from typing import Dict, List, Optional, Tuple
 from monte_carlo_simulations import (
     load_financials,
     derive_historical_metrics,
     build_distributions,
     run_monte_carlo_simulations,
+    sorted_percentiles,
+    sorted_prob_below,
+    new_figure,
     NUM_SIMULATIONS,
     CSV_PATH,
     OUTPUT_DIR
@@ -143,18 +143,22 @@ def _summarize(sim_data: dict, base: dict) -> dict:
     revenue = sim_data["revenue"]
     gross_margin = sim_data["gross_margin"]
     operating_margin = sim_data["operating_margin"]
-    cash_flow = sim_data["cash_flow"]
+    # One sort per series serves its percentiles and threshold probability
+    cash_sorted = np.sort(cash)
+    revenue_sorted = np.sort(revenue)
+    p5_cash, median_cash, p95_cash = sorted_percentiles(cash_sorted, (5, 50, 95))
+    p10_revenue, median_revenue, p90_revenue = sorted_percentiles(revenue_sorted, (10, 50, 90))
     return {
-        "median_cash": float(np.median(cash)),
-        "p5_cash": float(np.percentile(cash, 5)),
-        "p95_cash": float(np.percentile(cash, 95)),
-        "median_revenue": float(np.median(revenue)),
-        "p10_revenue": float(np.percentile(revenue, 10)),
-        "p90_revenue": float(np.percentile(revenue, 90)),
+        "median_cash": median_cash,
+        "p5_cash": p5_cash,
+        "p95_cash": p95_cash,
+        "median_revenue": median_revenue,
+        "p10_revenue": p10_revenue,
+        "p90_revenue": p90_revenue,
         "median_gross_margin": float(np.median(gross_margin)),
         "median_operating_margin": float(np.median(operating_margin)),
-        "prob_cash_negative": float(np.mean(cash < 0)),
-        "prob_revenue_decline": float(np.mean(revenue < base["revenue"])),
+        "prob_cash_negative": sorted_prob_below(cash_sorted, 0),
+        "prob_revenue_decline": sorted_prob_below(revenue_sorted, base["revenue"]),
     }
 
 
@@ -167,7 +171,7 @@ def plot_tornado(sensitivity_result: dict, metric: str = "median_cash") -> str:
     params = tornado_info["parameters"]
     metric_label = metric.replace("_", " ").replace("median ", "").title()
 
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = new_figure((12, 7))
     y_pos = np.arange(len(params))
     bar_height = 0.6
 
@@ -207,11 +211,10 @@ def plot_tornado(sensitivity_result: dict, metric: str = "median_cash") -> str:
         ax.text(high + 0.5, i, f"{high:+.1f}%", va="center", ha="left", fontsize=9, fontweight="bold", color="#2e7d32")
 
     fig.legend(["Low → High Impact"], loc="lower right", fontsize=9, framealpha=0.9)
-    plt.tight_layout()
+    fig.tight_layout()
     filename = os.path.join(OUTPUT_DIR, f"tornado_{metric}.png")
-    plt.savefig(filename, dpi=300, bbox_inches="tight")
+    fig.savefig(filename, dpi=300, bbox_inches="tight")
     print(f"Tornado chart saved to '{filename}'")
-    plt.close()
     return filename
 
 
@@ -224,7 +227,7 @@ def plot_tornado_absolute(sensitivity_result: dict, metric: str = "median_cash")
     params = tornado_info["parameters"]
     metric_label = metric.replace("_", " ").replace("median ", "").title()
 
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = new_figure((12, 7))
     y_pos = np.arange(len(params))
     bar_height = 0.6
 
@@ -263,9 +266,8 @@ def plot_tornado_absolute(sensitivity_result: dict, metric: str = "median_cash")
         ax.text(low, i, f"  {low:{fmt}}", va="center", ha="left", fontsize=8, fontweight="bold", color="#333")
         ax.text(high, i, f"  {high:{fmt}}", va="center", ha="left", fontsize=8, fontweight="bold", color="#333")
 
-    plt.tight_layout()
+    fig.tight_layout()
     filename = os.path.join(OUTPUT_DIR, f"tornado_absolute_{metric}.png")
-    plt.savefig(filename, dpi=300, bbox_inches="tight")
+    fig.savefig(filename, dpi=300, bbox_inches="tight")
     print(f"Tornado chart (absolute) saved to '{filename}'")
-    plt.close()
     return filename
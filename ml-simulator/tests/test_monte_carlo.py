@@ -3,7 +3,9 @@ import sys
 import os
 import numpy as np
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from monte_carlo_simulations import safe_float, truncated_normal
+from monte_carlo_simulations import (
+    safe_float, safe_float_column, sorted_percentiles, sorted_prob_below, truncated_normal,
+)
 
 
 class TestSafeFloat:
@@ -39,6 +41,21 @@ class TestSafeFloat:
         assert safe_float(0) == 0.0
 
 
+class TestSafeFloatColumn:
+    def test_matches_safe_float(self):
+        import pandas as pd
+        values = pd.Series(["1,234,567", "99.5", "-50", "N/A", "", None, "not_a_number", "0"])
+        expected = [safe_float(v) for v in values]
+        result = safe_float_column(values)
+        assert [None if np.isnan(v) else v for v in result] == expected
+
+    def test_numeric_column(self):
+        import pandas as pd
+        result = safe_float_column(pd.Series([1, 2, 3]))
+        assert result.dtype == np.float64
+        assert result.tolist() == [1.0, 2.0, 3.0]
+
+
 class TestTruncatedNormal:
     def test_returns_correct_shape(self):
         result = truncated_normal(100, 10, 50, 150, size=100)
@@ -65,3 +82,25 @@ class TestTruncatedNormal:
         result = truncated_normal(0, 100, -10, 10, size=1000)
         assert np.all(result >= -10)
         assert np.all(result <= 10)
+
+    def test_own_generator_reproducible(self):
+        a = truncated_normal(100, 10, 50, 150, size=100, rng=np.random.default_rng(7))
+        b = truncated_normal(100, 10, 50, 150, size=100, rng=np.random.default_rng(7))
+        assert np.array_equal(a, b)
+
+
+class TestSortedHelpers:
+    QS = [0, 1, 5, 10, 25, 33.3, 50, 75, 90, 95, 99, 100]
+
+    @pytest.mark.parametrize("n", [1, 2, 7, 100, 1001])
+    def test_percentiles_match_numpy(self, n):
+        values = np.random.default_rng(n).integers(0, 20, size=n).astype(float)
+        result = sorted_percentiles(np.sort(values), self.QS)
+        np.testing.assert_allclose(result, np.percentile(values, self.QS))
+
+    @pytest.mark.parametrize("n", [1, 2, 7, 100, 1001])
+    def test_prob_below_matches_numpy(self, n):
+        values = np.random.default_rng(n).integers(0, 20, size=n).astype(float)
+        sorted_values = np.sort(values)
+        for threshold in [-5.0, 0.0, 3.0, 7.5, 10.0, 19.0, 25.0]:
+            assert sorted_prob_below(sorted_values, threshold) == pytest.approx(np.mean(values < threshold))
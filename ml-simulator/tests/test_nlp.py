@@ -1,8 +1,12 @@
 import pytest
 import sys
 import os
+import asyncio
+from types import SimpleNamespace
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from nlp_pipeline import extract_json, parse_question
+import nlp_pipeline
+from nlp_pipeline import extract_json, parse_question, keyword_hits
+from backboard.exceptions import BackboardNotFoundError
 
 
 class TestExtractJson:
@@ -27,6 +31,20 @@ class TestExtractJson:
             extract_json("{invalid json}")
 
 
+class TestKeywordHits:
+    def test_overlapping_phrases_all_reported(self):
+        hits = keyword_hits("will revenue falls below plan")
+        assert {"revenue falls below", "revenue", "below", "falls"} <= hits
+
+    def test_substring_semantics(self):
+        # Matches the old `kw in text` checks, including inside longer words
+        assert "cost" in keyword_hits("costly")
+        assert "if" in keyword_hits("significant")
+
+    def test_no_hits(self):
+        assert keyword_hits("hello world") == set()
+
+
 class TestParseQuestion:
     def test_revenue_question(self):
         result = parse_question("What is the probability of revenue decline next quarter?")
@@ -58,6 +76,68 @@ class TestParseQuestion:
         result = parse_question("Should we hire more employees?")
         assert result["category"] != "non_financial"
 
+    def test_repeated_question_returns_independent_copies(self):
+        question = "What is the probability revenue falls below 10?"
+        first = parse_question(question)
+        first["parameters"]["threshold"] = 0
+        first["nlp_analysis"]["reasoning"].append("annotated by caller")
+        second = parse_question(question)
+        assert second["parameters"]["threshold"] == 10.0
+        assert "annotated by caller" not in second["nlp_analysis"]["reasoning"]
+
     def test_empty_question(self):
         result = parse_question("")
         assert "category" in result
+
+    def test_too_short_question(self):
+        result = parse_question(" ? ")
+        assert result["category"] == "non_financial"
+        assert result["nlp_analysis"]["reasoning"] == ["Question is too short to analyse"]
+
+    def test_overlong_question_still_parsed(self):
+        result = parse_question("What is my cash runway? " + "x" * 10000)
+        assert result["category"] == "cash_flow_liquidity"
+
+
+class FakeClient:
+    api_key = "test-key"
+
+    def __init__(self):
+        self.created = 0
+        self.live = set()
+
+    async def create_assistant(self, name, system_prompt):
+        self.created += 1
+        assistant_id = f"asst-{self.created}"
+        self.live.add(assistant_id)
+        return SimpleNamespace(assistant_id=assistant_id)
+
+    async def create_thread(self, assistant_id):
+        if assistant_id not in self.live:
+            raise BackboardNotFoundError("assistant not found")
+        return SimpleNamespace(thread_id="thread-1")
+
+    async def add_message(self, **kwargs):
+        return SimpleNamespace(content='{"intent": "forecast", "metric": "revenue"}')
+
+
+class TestAssistantIdCache:
+    @pytest.fixture(autouse=True)
+    def id_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(nlp_pipeline, "ASSISTANT_ID_FILE", str(tmp_path / "assistant_id"))
+
+    def test_id_reused_across_calls(self):
+        client = FakeClient()
+        first = asyncio.run(nlp_pipeline.get_or_create_assistant(client))
+        second = asyncio.run(nlp_pipeline.get_or_create_assistant(client))
+        assert first == second
+        assert client.created == 1
+
+    def test_stale_id_recreated_once(self):
+        client = FakeClient()
+        stale = asyncio.run(nlp_pipeline.get_or_create_assistant(client))
+        client.live.clear()
+        parsed = asyncio.run(nlp_pipeline.run_nlp_api("q", stale, client))
+        assert parsed["metric"] == "revenue"
+        assert client.created == 2
+        assert asyncio.run(nlp_pipeline.get_or_create_assistant(client)) == "asst-2"
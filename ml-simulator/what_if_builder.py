@@ -2,9 +2,6 @@ import os
 import json
 import base64
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 from typing import Dict, List, Optional
 from monte_carlo_simulations import (
     derive_historical_metrics,
@@ -13,11 +10,16 @@ from monte_carlo_simulations import (
     run_multi_period_simulations,
     plot_fan_chart,
     load_financials,
+    sorted_percentiles,
+    sorted_prob_below,
+    new_figure,
     CSV_PATH,
     OUTPUT_DIR,
     NUM_SIMULATIONS,
 )
 
+SUMMARY_PERCENTILES = (5, 10, 50, 90, 95)
+
 
 def apply_what_if_overrides(base: dict, dists: dict, overrides: dict) -> tuple:
     base_scenario = base.copy()
@@ -68,10 +70,19 @@ def _summarize_what_if(base: dict, sim_data: dict) -> dict:
     capex = sim_data["capex"]
     cfo = sim_data["cfo"]
 
-    revenue_cv = float(np.std(revenue) / np.mean(revenue)) if np.mean(revenue) > 0 else 0
-    cash_cv = float(np.std(cash) / np.abs(np.mean(cash))) if np.mean(cash) != 0 else 0
-    prob_cash_negative = float(np.mean(cash < 0))
-    prob_revenue_decline = float(np.mean(revenue < base["revenue"]))
+    revenue_mean, revenue_std = revenue.mean(), revenue.std()
+    cash_mean, cash_std = cash.mean(), cash.std()
+    revenue_cv = float(revenue_std / revenue_mean) if revenue_mean > 0 else 0
+    cash_cv = float(cash_std / np.abs(cash_mean)) if cash_mean != 0 else 0
+
+    # One sort per series serves every percentile and threshold probability
+    revenue_sorted = np.sort(revenue)
+    cash_sorted = np.sort(cash)
+    rev_p5, rev_p10, rev_median, rev_p90, rev_p95 = sorted_percentiles(revenue_sorted, SUMMARY_PERCENTILES)
+    cash_p5, cash_p10, cash_median, cash_p90, cash_p95 = sorted_percentiles(cash_sorted, SUMMARY_PERCENTILES)
+    prob_cash_negative = sorted_prob_below(cash_sorted, 0)
+    prob_revenue_decline = sorted_prob_below(revenue_sorted, base["revenue"])
+    cash_flow_p5, cash_flow_median, cash_flow_p95 = np.percentile(cash_flow, [5, 50, 95]).tolist()
 
     return {
         "base_metrics": {
@@ -79,25 +90,25 @@ def _summarize_what_if(base: dict, sim_data: dict) -> dict:
             "starting_cash": float(base["cash"]),
         },
         "revenue": {
-            "mean": float(np.mean(revenue)),
-            "median": float(np.median(revenue)),
-            "std": float(np.std(revenue)),
-            "p5": float(np.percentile(revenue, 5)),
-            "p10": float(np.percentile(revenue, 10)),
-            "p90": float(np.percentile(revenue, 90)),
-            "p95": float(np.percentile(revenue, 95)),
+            "mean": float(revenue_mean),
+            "median": rev_median,
+            "std": float(revenue_std),
+            "p5": rev_p5,
+            "p10": rev_p10,
+            "p90": rev_p90,
+            "p95": rev_p95,
             "cv": revenue_cv,
             "prob_decline": prob_revenue_decline,
             "mean_growth": float(np.mean(revenue_growth)),
         },
         "cash": {
-            "mean": float(np.mean(cash)),
-            "median": float(np.median(cash)),
-            "std": float(np.std(cash)),
-            "p5": float(np.percentile(cash, 5)),
-            "p10": float(np.percentile(cash, 10)),
-            "p90": float(np.percentile(cash, 90)),
-            "p95": float(np.percentile(cash, 95)),
+            "mean": float(cash_mean),
+            "median": cash_median,
+            "std": float(cash_std),
+            "p5": cash_p5,
+            "p10": cash_p10,
+            "p90": cash_p90,
+            "p95": cash_p95,
             "cv": cash_cv,
             "prob_negative": prob_cash_negative,
         },
@@ -109,9 +120,9 @@ def _summarize_what_if(base: dict, sim_data: dict) -> dict:
         },
         "cash_flow": {
             "mean": float(np.mean(cash_flow)),
-            "median": float(np.median(cash_flow)),
-            "p5": float(np.percentile(cash_flow, 5)),
-            "p95": float(np.percentile(cash_flow, 95)),
+            "median": cash_flow_median,
+            "p5": cash_flow_p5,
+            "p95": cash_flow_p95,
             "mean_opex": float(np.mean(opex)),
             "mean_capex": float(np.mean(capex)),
             "mean_cfo": float(np.mean(cfo)),
@@ -156,7 +167,7 @@ def run_what_if_comparison(base: dict, dists: dict, what_if_overrides: dict, bas
 
 
 def plot_what_if_comparison(baseline: dict, what_if: dict, base: dict, base_label: str = "Base", what_if_label: str = "What-If") -> str:
-    fig, axes = plt.subplots(1, 3, figsize=(16, 6))
+    fig, axes = new_figure((16, 6), 1, 3)
     colors = ["#4ecdc4", "#8c52ff"]
 
     # Revenue comparison
@@ -226,11 +237,10 @@ def plot_what_if_comparison(baseline: dict, what_if: dict, base: dict, base_labe
     fig.suptitle(f"What-If Scenario Comparison (Starting Revenue: {starting_rev:,.0f}, Cash: {starting_cash:,.0f})",
                  fontsize=14, fontweight="bold", y=1.02)
 
-    plt.tight_layout()
+    fig.tight_layout()
     filename = os.path.join(OUTPUT_DIR, "what_if_comparison.png")
-    plt.savefig(filename, dpi=300, bbox_inches="tight")
+    fig.savefig(filename, dpi=300, bbox_inches="tight")
     print(f"What-if comparison chart saved to '{filename}'")
-    plt.close()
     return filename
 
 
@@ -142,6 +142,23 @@ class TestFullPipeline:
         assert "debt_to_equity" in results
         assert len(results["debt_to_equity"]) == 50
 
+    def test_cached_base_reloads_when_csv_changes(self, sample_csv):
+        base, dists = mc_mod.load_base_and_distributions(sample_csv)
+        assert base["revenue"] == 10000000
+        base["revenue"] = 0
+        dists["revenue_growth"]["mean"] = 99
+        cached_base, cached_dists = mc_mod.load_base_and_distributions(sample_csv)
+        assert cached_base["revenue"] == 10000000
+        assert cached_dists["revenue_growth"]["mean"] != 99
+
+        df = pd.read_csv(sample_csv)
+        df.loc[df.index[-1], "revenue_total"] = 11000000
+        df.to_csv(sample_csv, index=False)
+        stat = os.stat(sample_csv)
+        os.utime(sample_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        reloaded_base, _ = mc_mod.load_base_and_distributions(sample_csv)
+        assert reloaded_base["revenue"] == 11000000
+
     def test_safe_float_in_pipeline(self, sample_csv):
         df = pd.read_csv(sample_csv)
         df["employee_count"] = df["employee_count"].apply(lambda x: "N/A")